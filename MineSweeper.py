@@ -1,29 +1,39 @@
 import random
 import numpy as np
-import pandas as pd
-from sklearn.preprocessing import LabelEncoder
-import tensorflow as tf
-tf.config.run_functions_eagerly(True)
-import matplotlib.pyplot as plt
+
+from src.game.neighbors import get_neighbor_table
+from src.utils.profiling import PROFILER, phase, profiled
+
+# pandas, scikit-learn, TensorFlow y matplotlib se importan en las funciones que
+# los usan para que jugar partidas no pague su tiempo de importación
 
 class Minesweeper:
-    def __init__(self, rows, columns, num_mines):
+    def __init__(self, rows, columns, num_mines, safe_first_click=False):
         self.rows = rows
         self.columns = columns
         self.num_mines = num_mines
-        self.board = self._create_board()
+        # Vecinos precalculados, compartidos por todas las partidas del mismo tamaño
+        self.neighbors = get_neighbor_table(rows, columns)
+        # Con safe_first_click las minas se colocan al abrir la primera celda y nunca en ella
+        self.mines_placed = not safe_first_click
+        if self.mines_placed:
+            self.board = self._create_board()
+        else:
+            self.board = [[0 for _ in range(columns)] for _ in range(rows)]
         self.visible = [[False for _ in range(columns)] for _ in range(rows)]
         self.marked = [[False for _ in range(columns)] for _ in range(rows)]
         self.lose = False
 
-    def _create_board(self):
+    @profiled("board_generation")
+    def _create_board(self, safe_cell=None):
         board = [[0 for _ in range(self.columns)] for _ in range(self.rows)]
         mines_placed = 0
         max_attempts = 100  # Prevenir bucle infinito
         attempts = 0
 
         # Crear lista de todas las posiciones posibles
-        all_positions = [(i, j) for i in range(self.rows) for j in range(self.columns)]
+        all_positions = [(i, j) for i in range(self.rows) for j in range(self.columns)
+                         if (i, j) != safe_cell]
         
         # Colocar minas usando random.sample
         mine_positions = random.sample(all_positions, self.num_mines)
@@ -31,10 +41,9 @@ class Minesweeper:
         for row, col in mine_positions:
             board[row][col] = -1
             # Incrementar números alrededor de la mina
-            for i in range(max(0, row-1), min(self.rows, row+2)):
-                for j in range(max(0, col-1), min(self.columns, col+2)):
-                    if board[i][j] != -1:
-                        board[i][j] += 1
+            for i, j in self.neighbors.adjacent(row, col):
+                if board[i][j] != -1:
+                    board[i][j] += 1
         
         return board
 
@@ -42,6 +51,10 @@ class Minesweeper:
         if self.lose:
             return "End Game"
 
+        if not self.mines_placed:
+            self.board = self._create_board(safe_cell=(row, column))
+            self.mines_placed = True
+
         if self.board[row][column] == -1:
             self.lose = True
             self._show_mines()
@@ -49,10 +62,9 @@ class Minesweeper:
 
         self.visible[row][column] = True
         if self.board[row][column] == 0:
-            for i in range(max(0, row-1), min(self.rows, row+2)):
-                for j in range(max(0, column-1), min(self.columns, column+2)):
-                    if not self.visible[i][j]:
-                        self.open_cell(i, j)
+            for i, j in self.neighbors.adjacent(row, column):
+                if not self.visible[i][j]:
+                    self.open_cell(i, j)
         
         return "Victory" if self.check_victory() else "continue"
     
@@ -89,7 +101,26 @@ class Minesweeper:
                     return False
         return True
 
-def generate_game_data(rows, columns, num_mines, num_samples):
+# Etiquetas de los datos en fragmentos, en el orden alfabético de LabelEncoder
+GAME_DATA_LABELS = ["Victory", "continue", "mark", "mine"]
+TRAINING_ACTIONS = ["mark", "open"]
+
+def generate_game_data(rows, columns, num_mines, num_samples, output_dir=None, shard_size=65536):
+    from src.ai.dataset import ShardReader, ShardWriter
+    
+    # Con output_dir los movimientos se escriben en fragmentos .npy a medida que
+    # se juegan en lugar de acumularse en memoria
+    writer = None
+    if output_dir is not None:
+        cells = rows * columns
+        writer = ShardWriter(output_dir, {
+            'board': ((cells,), np.int8),
+            'visible': ((cells,), np.bool_),
+            'marked': ((cells,), np.bool_),
+            'label': ((), np.uint8),
+        }, shard_size=shard_size, metadata={'rows': rows, 'columns': columns, 'num_mines': num_mines,
+                                            'labels': GAME_DATA_LABELS})
+    
     game_data = []
     
     for sample in range(num_samples):
@@ -112,10 +143,20 @@ def generate_game_data(rows, columns, num_mines, num_samples):
                 flattened_board = [cell for row in game.board for cell in row]
                 flattened_visible = [cell for row in game.visible for cell in row]
                 flattened_marked = [cell for row in game.marked for cell in row]
-                game_data.append(flattened_board + flattened_visible + flattened_marked + [result])
+                if writer is not None:
+                    writer.append(board=flattened_board, visible=flattened_visible,
+                                  marked=flattened_marked, label=GAME_DATA_LABELS.index(result))
+                else:
+                    game_data.append(flattened_board + flattened_visible + flattened_marked + [result])
                 
                 move_count += 1
     
+    if writer is not None:
+        writer.close()
+        return ShardReader(output_dir)
+    
+    import pandas as pd
+    
     column_names = (
         [f'cell_{i}' for i in range(rows * columns)] +
         [f'visible_{i}' for i in range(rows * columns)] +
@@ -125,13 +166,16 @@ def generate_game_data(rows, columns, num_mines, num_samples):
     
     return pd.DataFrame(game_data, columns=column_names)
 
+@profiled("decide")
 def get_ai_move(game, model):
     try:
-        flattened_board = [cell for row in game.board for cell in row]
-        state = np.array(flattened_board).reshape(1, -1)
+        with phase("observation"):
+            flattened_board = [cell for row in game.board for cell in row]
+            state = np.array(flattened_board).reshape(1, -1)
         
         # Predicción sin timeout
-        prediction = model.predict(state, verbose=0)
+        with phase("inference"):
+            prediction = model.predict(state, verbose=0)
         action = "open" if np.argmax(prediction) == 0 else "mark"
         
         available_cells = [(i, j) for i in range(game.rows) 
@@ -181,57 +225,102 @@ def play_ai_game(model, rows=5, columns=5, num_mines=5):
     game.display_board()
     return game.check_victory()
 
-def play_multiple_games(model, num_games=100, rows=5, columns=5, num_mines=5, max_moves_per_game=50):
-    victories = 0
-    total_moves = 0
-    games_data = []
-    
-    for game_num in range(num_games):
-        print(f"\nGame {game_num + 1}")
-        moves = 0
-        try:
-            game = Minesweeper(rows, columns, num_mines)
-            
-            while not game.lose and not game.check_victory() and moves < max_moves_per_game:
+def play_game(model, seed=None, rows=5, columns=5, num_mines=5, max_moves_per_game=50, verbose=True,
+              profile=False, safe_first_click=False):
+    # Con semilla, las minas y las jugadas al azar de la partida son reproducibles
+    if seed is not None:
+        random.seed(seed)
+    
+    # Con profile, los tiempos por fase de la partida se devuelven con el
+    # resultado para poder unirlos aunque la partida se juegue en otro proceso
+    if profile:
+        PROFILER.enable()
+    
+    moves = 0
+    try:
+        game = Minesweeper(rows, columns, num_mines, safe_first_click=safe_first_click)
+        
+        while not game.lose and not game.check_victory() and moves < max_moves_per_game:
+            if verbose:
                 game.display_board()
-                
-                move = get_ai_move(game, model)
-                if move is None:
+            
+            move = get_ai_move(game, model)
+            if move is None:
+                if verbose:
                     print("No more moves available or prediction error")
-                    break
-                    
-                row, col, action = move
-                print(f"AI decides to {action} at position ({row}, {col})")
+                break
                 
-                if action == "open":
+            row, col, action = move
+            if verbose:
+                print(f"AI decides to {action} at position ({row}, {col})")
+            
+            if action == "open":
+                with phase("open_cell"):
                     result = game.open_cell(row, col)
-                    if result == "mine":
+                if result == "mine":
+                    if verbose:
                         print("Game Over - Mine hit!")
                         game.display_board()
-                        break
-                    elif result == "Victory":
+                    break
+                elif result == "Victory":
+                    if verbose:
                         print("Victory!")
                         game.display_board()
-                        victories += 1
-                        break
-                else:
-                    game.mark_mine(row, col)
-                
-                moves += 1
-                
-            total_moves += moves
-            games_data.append({
-                'game_number': game_num + 1,
-                'result': 'Victory' if game.check_victory() else 'Loss',
-                'moves': moves
-            })
+                    break
+            else:
+                game.mark_mine(row, col)
             
-        except KeyboardInterrupt:
-            print("\nJuego interrumpido por el usuario")
-            break
-        except Exception as e:
-            print(f"Error en el juego {game_num + 1}: {e}")
-            continue
+            moves += 1
+    except Exception as e:
+        print(f"Error en la partida (semilla {seed}): {e}")
+        return None
+    finally:
+        if profile:
+            PROFILER.disable()
+    
+    record = {'result': 'Victory' if game.check_victory() else 'Loss', 'moves': moves}
+    if profile:
+        record['profile'] = PROFILER.snapshot()
+    return record
+
+def play_multiple_games(model, num_games=100, rows=5, columns=5, num_mines=5, max_moves_per_game=50,
+                        workers=1, seed=None, profile=False, profile_output=None, safe_first_click=False):
+    import pandas as pd
+    from functools import partial
+    from src.ai.parallel import game_seeds, play_parallel, resolve_model
+    
+    # Una semilla por partida: el resultado no depende del número de procesos
+    seeds = game_seeds(seed, num_games) if seed is not None or workers != 1 else [None] * num_games
+    
+    if workers == 1:
+        model = resolve_model(model)
+        results = []
+        for game_num, game_seed in enumerate(seeds):
+            print(f"\nGame {game_num + 1}")
+            try:
+                results.append(play_game(model, game_seed, rows, columns, num_mines, max_moves_per_game,
+                                         profile=profile, safe_first_click=safe_first_click))
+            except KeyboardInterrupt:
+                print("\nJuego interrumpido por el usuario")
+                break
+    else:
+        # Cada proceso carga su propio modelo: pasar la ruta .h5 o un NumpyModel
+        play = partial(play_game, rows=rows, columns=columns, num_mines=num_mines,
+                       max_moves_per_game=max_moves_per_game, verbose=False, profile=profile,
+                       safe_first_click=safe_first_click)
+        results = play_parallel(play, seeds, model, workers)
+    
+    # Unir los tiempos por fase de todas las partidas
+    if profile:
+        PROFILER.reset()
+        for result in results:
+            if result is not None:
+                PROFILER.merge(result.pop('profile'))
+    
+    games_data = [{'game_number': game_num + 1, **result}
+                  for game_num, result in enumerate(results) if result is not None]
+    victories = sum(1 for game in games_data if game['result'] == 'Victory')
+    total_moves = sum(game['moves'] for game in games_data)
     
     # Estadísticas finales
     games_played = len(games_data)
@@ -247,47 +336,101 @@ def play_multiple_games(model, num_games=100, rows=5, columns=5, num_mines=5, ma
         stats_df.to_csv('game_statistics.csv', index=False)
         print("\nEstadísticas guardadas en 'game_statistics.csv'")
     
+    if profile:
+        print("\n=== Tiempo por fase ===")
+        print(PROFILER.format_table())
+        if profile_output is not None:
+            PROFILER.dump_json(profile_output)
+            print(f"\nPerfil guardado en '{profile_output}'")
+    
     return pd.DataFrame(games_data)
 
-def generate_training_data_from_ai_games(model, num_games=100, rows=5, columns=5, num_mines=5):
+def play_training_game(model, seed=None, rows=5, columns=5, num_mines=5, verbose=True):
+    # Con semilla, las minas y las jugadas al azar de la partida son reproducibles
+    if seed is not None:
+        random.seed(seed)
+    
     training_data = []
+    game = Minesweeper(rows, columns, num_mines)
+    moves = 0
     
-    for game_num in range(num_games):
-        print(f"\nGenerando datos del juego {game_num + 1}")
-        game = Minesweeper(rows, columns, num_mines)
-        moves = 0
+    while not game.lose and not game.check_victory() and moves < 100:
+        # Obtener estado actual
+        state = []
+        for i in range(game.rows):
+            for j in range(game.columns):
+                if game.visible[i][j]:
+                    state.append(game.board[i][j])
+                else:
+                    state.append(-2 if game.marked[i][j] else -1)
         
-        while not game.lose and not game.check_victory() and moves < 100:
-            # Obtener estado actual
-            state = []
-            for i in range(game.rows):
-                for j in range(game.columns):
-                    if game.visible[i][j]:
-                        state.append(game.board[i][j])
-                    else:
-                        state.append(-2 if game.marked[i][j] else -1)
-            
-            # Obtener movimiento de la IA
-            move = get_ai_move(game, model)
-            if move is None:
-                break
-                
-            row, col, action = move
-            
-            # Solo guardar movimientos exitosos
-            if action == "open":
-                result = game.open_cell(row, col)
-                if result != "mine":  # Solo guardamos movimientos que no resultaron en mina
-                    training_data.append(state + [row, col, "open"])
-            else:
-                if game.board[row][col] == -1:  # Solo guardamos marcados correctos
-                    game.mark_mine(row, col)
-                    training_data.append(state + [row, col, "mark"])
-            
-            moves += 1
+        # Obtener movimiento de la IA
+        move = get_ai_move(game, model)
+        if move is None:
+            break
             
-            if moves % 10 == 0:
-                print(f"Movimientos procesados: {moves}")
+        row, col, action = move
+        
+        # Solo guardar movimientos exitosos
+        if action == "open":
+            result = game.open_cell(row, col)
+            if result != "mine":  # Solo guardamos movimientos que no resultaron en mina
+                training_data.append(state + [row, col, "open"])
+        else:
+            if game.board[row][col] == -1:  # Solo guardamos marcados correctos
+                game.mark_mine(row, col)
+                training_data.append(state + [row, col, "mark"])
+        
+        moves += 1
+        
+        if verbose and moves % 10 == 0:
+            print(f"Movimientos procesados: {moves}")
+    
+    return training_data
+
+def generate_training_data_from_ai_games(model, num_games=100, rows=5, columns=5, num_mines=5,
+                                         workers=1, seed=None, output_dir=None, shard_size=65536):
+    from functools import partial
+    from src.ai.dataset import ShardReader, ShardWriter
+    from src.ai.parallel import game_seeds, iter_parallel, resolve_model
+    
+    seeds = game_seeds(seed, num_games) if seed is not None or workers != 1 else [None] * num_games
+    
+    if workers == 1:
+        model = resolve_model(model)
+        
+        def play_games():
+            for game_num, game_seed in enumerate(seeds):
+                print(f"\nGenerando datos del juego {game_num + 1}")
+                yield play_training_game(model, game_seed, rows, columns, num_mines)
+        games = play_games()
+    else:
+        play = partial(play_training_game, rows=rows, columns=columns, num_mines=num_mines, verbose=False)
+        games = iter_parallel(play, seeds, model, workers)
+    
+    # Con output_dir cada partida se escribe en fragmentos .npy al terminar, con
+    # memoria acotada; las filas se unen siempre en el orden de las partidas
+    if output_dir is not None:
+        with ShardWriter(output_dir, {
+            'state': ((rows * columns,), np.int8),
+            'row': ((), np.int16),
+            'column': ((), np.int16),
+            'action': ((), np.uint8),
+        }, shard_size=shard_size, metadata={'rows': rows, 'columns': columns, 'num_mines': num_mines,
+                                            'labels': TRAINING_ACTIONS}) as writer:
+            for game in games:
+                if game:
+                    writer.extend(state=[sample[:-3] for sample in game],
+                                  row=[sample[-3] for sample in game],
+                                  column=[sample[-2] for sample in game],
+                                  action=[TRAINING_ACTIONS.index(sample[-1]) for sample in game])
+        reader = ShardReader(output_dir)
+        print(f"\n{len(reader)} muestras guardadas en {output_dir}")
+        return reader
+    
+    import pandas as pd
+    
+    training_data = [row for game in games for row in game]
     
     # Guardar los datos en CSV
     df = pd.DataFrame(training_data)
@@ -304,21 +447,35 @@ def generate_training_data_from_ai_games(model, num_games=100, rows=5, columns=5
     return df
 
 # Función para reentrenar el modelo
-def retrain_model(model, new_data_df):
+def retrain_model(model, new_data_df, epochs=10, batch_size=32, validation_split=0.2):
+    import tensorflow as tf
+    from src.ai.dataset import ShardDataset, ShardReader
+    
     # Habilitar ejecución eager
     tf.config.run_functions_eagerly(True)
     
-    # Preparar los datos nuevos
-    X_new = new_data_df.iloc[:, :-3].values  # Todas las columnas excepto row, column y action
-    y_new = new_data_df['action'].values
-    
-    # Convertir etiquetas
-    label_encoder = LabelEncoder()
-    y_new = label_encoder.fit_transform(y_new)
+    # Datos en fragmentos (directorio o ShardReader): se leen con memory-mapping
+    # y un hilo prepara los lotes, así que no tienen que caber en memoria
+    streaming = isinstance(new_data_df, (str, ShardReader))
+    if streaming:
+        dataset = ShardDataset(new_data_df, inputs='state', target='action', batch_size=batch_size)
+        train_data, validation_data = dataset.split(validation_split)
+        input_size = dataset.input_shape[0]
+    else:
+        from sklearn.preprocessing import LabelEncoder
+        
+        # Preparar los datos nuevos
+        X_new = new_data_df.iloc[:, :-3].values  # Todas las columnas excepto row, column y action
+        y_new = new_data_df['action'].values
+        
+        # Convertir etiquetas
+        label_encoder = LabelEncoder()
+        y_new = label_encoder.fit_transform(y_new)
+        input_size = X_new.shape[1]
     
     # Recrear el modelo con el mismo diseño
     new_model = tf.keras.Sequential([
-        tf.keras.layers.Dense(128, activation='relu', input_shape=(X_new.shape[1],)),
+        tf.keras.layers.Dense(128, activation='relu', input_shape=(input_size,)),
         tf.keras.layers.Dense(64, activation='relu'),
         tf.keras.layers.Dense(2, activation='softmax')  # Suponiendo clasificación binaria
     ])
@@ -332,12 +489,22 @@ def retrain_model(model, new_data_df):
     
     # Reentrenar el modelo
     print("\nReentrenando modelo...")
-    history = new_model.fit(X_new, y_new, epochs=10, batch_size=32, validation_split=0.2)
+    if streaming:
+        has_validation = len(validation_data) > 0
+        history = new_model.fit(train_data.repeat(), steps_per_epoch=len(train_data), epochs=epochs,
+                                validation_data=validation_data.repeat() if has_validation else None,
+                                validation_steps=len(validation_data) if has_validation else None)
+    else:
+        history = new_model.fit(X_new, y_new, epochs=epochs, batch_size=batch_size,
+                                validation_split=validation_split)
     
     return new_model, history
 
 # Uso:
 if __name__ == "__main__":
+    import tensorflow as tf
+    import matplotlib.pyplot as plt
+    
     try:
         model = tf.keras.models.load_model("minesweeper_ai_model.h5")
         stats_df = play_multiple_games(model, num_games=50, max_moves_per_game=50)
@@ -0,0 +1,82 @@
+"""
+Benchmark de movimientos por segundo del motor por lotes frente al motor individual.
+
+Uso:
+    python -m benchmarks.batched_engine [--seconds 1.0]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.game.batched import BatchedMinesweeper
+from src.game.minesweeper import Minesweeper, GameAction, GameStatus
+
+
+def single_moves_per_second(config: dict, seconds: float) -> float:
+    """
+    Mide movimientos por segundo abriendo celdas aleatorias en partidas individuales.
+
+    Args:
+        config: Configuración predefinida de Minesweeper
+        seconds: Duración aproximada de la medición
+
+    Returns:
+        Movimientos por segundo
+    """
+    rng = np.random.default_rng(0)
+    game = Minesweeper(config["rows"], config["columns"], config["mines"])
+    moves = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        rows = rng.integers(0, config["rows"], 100)
+        cols = rng.integers(0, config["columns"], 100)
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            if game.open_cell(row, col) != GameStatus.ONGOING:
+                game = Minesweeper(config["rows"], config["columns"], config["mines"])
+        moves += 100
+    return moves / (time.perf_counter() - start)
+
+
+def batched_moves_per_second(config: dict, num_games: int, seconds: float) -> float:
+    """
+    Mide movimientos por segundo (sumando todas las partidas) del motor por lotes.
+
+    Args:
+        config: Configuración predefinida de Minesweeper
+        num_games: Número de partidas simultáneas
+        seconds: Duración aproximada de la medición
+
+    Returns:
+        Movimientos por segundo
+    """
+    rng = np.random.default_rng(0)
+    games = BatchedMinesweeper.from_config(num_games, config, rng=rng)
+    actions = np.full(num_games, GameAction.OPEN.value)
+    moves = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        rows = rng.integers(0, config["rows"], num_games)
+        cols = rng.integers(0, config["columns"], num_games)
+        status, _, _ = games.step(rows, cols, actions)
+        games.reset(status != GameStatus.ONGOING.value)
+        moves += num_games
+    return moves / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="Duración de cada medición")
+    args = parser.parse_args()
+
+    config = Minesweeper.EXPERT
+    print(f"{'Motor':<24}{'Movimientos/s':>16}")
+    print(f"{'Minesweeper':<24}{single_moves_per_second(config, args.seconds):>16,.0f}")
+    for num_games in (1, 64, 1024):
+        rate = batched_moves_per_second(config, num_games, args.seconds)
+        print(f"{f'BatchedMinesweeper x{num_games}':<24}{rate:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark de generación de tableros para cada configuración predefinida.
+
+Uso:
+    python -m benchmarks.board_generation [--seconds 1.0]
+"""
+
+import argparse
+import time
+
+from src.game.board import Board
+from src.game.minesweeper import Minesweeper
+
+
+PRESETS = {
+    "beginner": Minesweeper.BEGINNER,
+    "intermediate": Minesweeper.INTERMEDIATE,
+    "expert": Minesweeper.EXPERT,
+}
+
+
+def boards_per_second(rows: int, columns: int, mines: int, seconds: float = 1.0) -> float:
+    """
+    Mide cuántos tableros por segundo se pueden construir.
+
+    Args:
+        rows: Número de filas del tablero
+        columns: Número de columnas del tablero
+        mines: Número de minas
+        seconds: Duración aproximada de la medición
+
+    Returns:
+        Tableros generados por segundo
+    """
+    # Calentamiento
+    for _ in range(10):
+        Board(rows, columns, mines)
+
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            Board(rows, columns, mines)
+        count += 100
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="Duración de cada medición")
+    args = parser.parse_args()
+
+    print(f"{'Nivel':<14}{'Tablero':<12}{'Tableros/s':>14}")
+    for name, config in PRESETS.items():
+        rate = boards_per_second(config["rows"], config["columns"], config["mines"], args.seconds)
+        size = f"{config['rows']}x{config['columns']}"
+        print(f"{name:<14}{size:<12}{rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Memoria por celda de Board frente a CompactBoard.
+
+Uso:
+    python -m benchmarks.board_memory [--large]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from src.game.board import Board
+from src.game.compact_board import CompactBoard
+from src.game.minesweeper import Minesweeper
+
+
+def bytes_per_cell(board_class, rows: int, columns: int, mines: int) -> float:
+    """
+    Calcula los bytes por celda de los arrays de un tablero.
+
+    Args:
+        board_class: Board o CompactBoard
+        rows: Número de filas del tablero
+        columns: Número de columnas del tablero
+        mines: Número de minas
+
+    Returns:
+        Bytes por celda
+    """
+    board = board_class(rows, columns, mines)
+    return board.get_memory_usage() / (rows * columns)
+
+
+def many_games_bytes(board_class, num_games: int) -> int:
+    """
+    Mide con tracemalloc la memoria total de muchas partidas EXPERT, objetos incluidos.
+
+    Args:
+        board_class: Board o CompactBoard
+        num_games: Número de tableros a crear
+
+    Returns:
+        Bytes asignados por los tableros
+    """
+    config = Minesweeper.EXPERT
+    tracemalloc.start()
+    boards = [board_class(config["rows"], config["columns"], config["mines"]) for _ in range(num_games)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del boards
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--large", action="store_true", help="Crear además un tablero compacto de 10000x10000")
+    args = parser.parse_args()
+
+    config = Minesweeper.EXPERT
+    print(f"{'Almacenamiento':<16}{'Bytes/celda':>12}{'100k EXPERT (MB)':>20}{'10k x 10k (MB)':>18}")
+    for board_class in (Board, CompactBoard):
+        per_cell = bytes_per_cell(board_class, config["rows"], config["columns"], config["mines"])
+        many = many_games_bytes(board_class, 10_000) * 10  # Extrapolado de 10k partidas
+        print(f"{board_class.__name__:<16}{per_cell:>12.3f}{many / 2**20:>20,.0f}{per_cell * 10**8 / 2**20:>18,.0f}")
+
+    if args.large:
+        start = time.perf_counter()
+        board = CompactBoard(10_000, 10_000, 10**7)
+        elapsed = time.perf_counter() - start
+        print(f"\nCompactBoard 10000x10000: {board.get_memory_usage() / 2**20:,.0f} MB, creado en {elapsed:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
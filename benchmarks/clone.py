@@ -0,0 +1,64 @@
+"""
+Benchmark de copia de partidas: deepcopy frente a clone y snapshot/restore.
+
+Mide el tiempo por copia de una partida EXPERT a medio jugar, con Board y con
+CompactBoard, y con un manejador de eventos registrado (deepcopy también lo
+copia; clone no).
+
+Uso:
+    python -m benchmarks.clone [--number 2000]
+"""
+
+import argparse
+import copy
+import timeit
+
+import numpy as np
+
+from src.game.minesweeper import Minesweeper, GameEvent
+
+
+def midgame(compact: bool, seed: int = 0) -> Minesweeper:
+    """
+    Crea una partida EXPERT con unas cuantas celdas abiertas y marcadas.
+
+    Args:
+        compact: Si es True, usa CompactBoard
+        seed: Semilla del tablero
+
+    Returns:
+        Partida en curso
+    """
+    game = Minesweeper.from_config(Minesweeper.EXPERT, compact=compact, rng=seed,
+                                   safe_first_click=True, safe_neighbors=True)
+    game.open_cell(8, 15)
+    game.register_event_handler(GameEvent.CELL_OPENED, lambda **kwargs: None)
+    hidden = np.argwhere(game.get_board_state() == game.board.HIDDEN)
+    for row, col in hidden[:10]:
+        game.mark_cell(int(row), int(col))
+    return game
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="Copias por medición")
+    args = parser.parse_args()
+
+    print(f"{'Tablero':<10}{'Operación':<20}{'µs/copia':>10}")
+    for name, compact in (("Board", False), ("Compact", True)):
+        game = midgame(compact)
+        state = game.snapshot()
+        operations = {
+            "deepcopy": lambda: copy.deepcopy(game),
+            "clone": game.clone,
+            "snapshot": game.snapshot,
+            "restore": lambda: game.restore(state),
+        }
+        for operation, function in operations.items():
+            number = max(1, args.number // 20) if operation == "deepcopy" else args.number
+            seconds = min(timeit.repeat(function, number=number, repeat=3)) / number
+            print(f"{name:<10}{operation:<20}{seconds * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
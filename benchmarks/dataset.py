@@ -0,0 +1,59 @@
+"""
+Benchmark de ShardDataset: mini-lotes por segundo con y sin hilo de prefetch.
+
+Escribe un conjunto de fragmentos temporal y lo recorre simulando un paso
+de entrenamiento por lote, para medir cuánto tiempo espera el modelo a los datos.
+
+Uso:
+    python -m benchmarks.dataset [--samples 500000] [--batch-size 256]
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from src.ai.dataset import ShardDataset, ShardWriter
+
+
+def train_step(x: np.ndarray, weights: np.ndarray) -> float:
+    """Paso de entrenamiento simulado: un forward denso sobre el lote."""
+    return float(np.maximum(x @ weights, 0).sum())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=500_000, help="Muestras del conjunto")
+    parser.add_argument("--cells", type=int, default=25, help="Celdas por estado")
+    parser.add_argument("--batch-size", type=int, default=256, help="Muestras por mini-lote")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    weights = rng.standard_normal((args.cells, 512)).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with ShardWriter(tmp, {"state": ((args.cells,), np.int8), "action": ((), np.uint8)}) as writer:
+            for start in range(0, args.samples, 65536):
+                count = min(65536, args.samples - start)
+                writer.extend(state=rng.integers(-2, 9, (count, args.cells)).astype(np.int8),
+                              action=rng.integers(0, 2, count).astype(np.uint8))
+
+        dataset = ShardDataset(tmp, batch_size=args.batch_size, seed=0)
+        print(f"{'Lectura':<24}{'Lotes/s':>12}{'Época (s)':>12}")
+
+        start = time.perf_counter()
+        for x, _ in dataset._epoch_batches():
+            train_step(x, weights)
+        elapsed = time.perf_counter() - start
+        print(f"{'mmap, mismo hilo':<24}{len(dataset) / elapsed:>12,.0f}{elapsed:>12.2f}")
+
+        start = time.perf_counter()
+        for x, _ in dataset:
+            train_step(x, weights)
+        elapsed = time.perf_counter() - start
+        print(f"{'mmap + prefetch':<24}{len(dataset) / elapsed:>12,.0f}{elapsed:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
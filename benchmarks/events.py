@@ -0,0 +1,55 @@
+"""
+Benchmark del coste de los eventos en open_cell: sin suscriptores, por celda y en bloque.
+
+Uso:
+    python -m benchmarks.events [--games 300]
+"""
+
+import argparse
+import random
+import time
+
+from src.game.minesweeper import Minesweeper, GameEvent, GameStatus
+
+
+def opens_per_second(num_games: int, event: GameEvent = None, seed: int = 0) -> float:
+    """
+    Juega partidas EXPERT abriendo celdas al azar y mide aperturas por segundo.
+
+    Args:
+        num_games: Número de partidas
+        event: Evento al que suscribir un manejador vacío (None para ninguno)
+        seed: Semilla de tableros y jugadas
+
+    Returns:
+        Llamadas a open_cell por segundo
+    """
+    random.seed(seed)
+    config = Minesweeper.EXPERT
+    opens, elapsed = 0, 0.0
+    for _ in range(num_games):
+        game = Minesweeper(config["rows"], config["columns"], config["mines"])
+        if event is not None:
+            game.register_event_handler(event, lambda **kwargs: None)
+        while game.status == GameStatus.ONGOING:
+            row, col = random.randrange(config["rows"]), random.randrange(config["columns"])
+            start = time.perf_counter()
+            game.open_cell(row, col)
+            elapsed += time.perf_counter() - start
+            opens += 1
+    return opens / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=300, help="Partidas EXPERT por configuración")
+    args = parser.parse_args()
+
+    print(f"{'Suscriptores':<24}{'Aperturas/s':>14}")
+    for name, event in (("ninguno", None), ("CELL_OPENED", GameEvent.CELL_OPENED),
+                        ("CELLS_OPENED", GameEvent.CELLS_OPENED)):
+        print(f"{name:<24}{opens_per_second(args.games, event):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
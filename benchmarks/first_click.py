@@ -0,0 +1,99 @@
+"""
+Benchmark de partidas útiles por segundo con y sin primera jugada segura.
+
+Juega partidas con ConstraintSolver (y una celda oculta al azar cuando no hay
+deducciones) colocando las minas de tres formas: al crear el tablero, al
+abrir la primera celda excluyéndola y excluyendo también sus vecinas. Una
+partida es útil si no se pierde en la primera jugada, que no aporta
+información al jugador ni datos de entrenamiento. La ganancia es el aumento
+de partidas útiles por tablero generado; las partidas útiles duran más, así
+que también se muestran las jugadas por partida.
+
+Uso:
+    python -m benchmarks.first_click [--games 300] [--seed 0]
+"""
+
+import argparse
+import time
+from typing import Dict
+
+import numpy as np
+
+from src.game.minesweeper import Minesweeper, GameAction, GameStatus
+from src.solver.constraint_solver import ConstraintSolver
+
+
+PRESETS = {
+    "beginner": Minesweeper.BEGINNER,
+    "intermediate": Minesweeper.INTERMEDIATE,
+    "expert": Minesweeper.EXPERT,
+}
+
+MODES = {
+    "inmediata": {},
+    "segura": {"safe_first_click": True},
+    "segura+vecinas": {"safe_first_click": True, "safe_neighbors": True},
+}
+
+
+def play_games(config: Dict[str, int], options: Dict[str, bool], num_games: int,
+               seed: int) -> Dict[str, float]:
+    """
+    Juega partidas con el solucionador y cuenta cuántas son útiles.
+
+    Args:
+        config: Configuración del tablero (rows, columns, mines)
+        options: Opciones del constructor de Minesweeper
+        num_games: Número de partidas
+        seed: Semilla de los tableros y de las jugadas al azar
+
+    Returns:
+        Diccionario con partidas útiles, victorias, jugadas y tiempo total
+    """
+    rng = np.random.default_rng(seed)
+    useful, victories, moves = 0, 0, 0
+    start = time.perf_counter()
+    for _ in range(num_games):
+        game = Minesweeper.from_config(config, rng=rng, **options)
+        solver = ConstraintSolver(game)
+        while game.status == GameStatus.ONGOING:
+            move = solver.next_move()
+            if move is None:
+                hidden = np.flatnonzero(game.get_board_state() == game.board.HIDDEN)
+                row, col = divmod(int(hidden[rng.integers(len(hidden))]), game.board.columns)
+                game.open_cell(row, col)
+            elif move[2] == GameAction.OPEN:
+                game.open_cell(move[0], move[1])
+            else:
+                game.mark_cell(move[0], move[1])
+        moves += game.moves_count
+        if game.status == GameStatus.VICTORY or game.moves_count > 1:
+            useful += 1
+        if game.status == GameStatus.VICTORY:
+            victories += 1
+    return {"useful": useful, "victories": victories, "moves": moves,
+            "seconds": time.perf_counter() - start}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=300, help="Partidas por nivel y modo")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de tableros y jugadas")
+    args = parser.parse_args()
+
+    print(f"{'Nivel':<14}{'Minas':<16}{'Útiles':>8}{'Ganancia':>10}{'Victorias':>11}"
+          f"{'Jugadas':>9}{'Partidas/s':>12}{'Útiles/s':>10}")
+    for name, config in PRESETS.items():
+        base_useful = None
+        for mode, options in MODES.items():
+            result = play_games(config, options, args.games, args.seed)
+            if base_useful is None:
+                base_useful = result["useful"]
+            gain = (result["useful"] / base_useful - 1) * 100 if base_useful else 0.0
+            print(f"{name:<14}{mode:<16}{result['useful'] / args.games:>8.1%}{gain:>+9.1f}%"
+                  f"{result['victories'] / args.games:>11.1%}{result['moves'] / args.games:>9.1f}"
+                  f"{args.games / result['seconds']:>12,.0f}{result['useful'] / result['seconds']:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
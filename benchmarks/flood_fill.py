@@ -0,0 +1,50 @@
+"""
+Benchmark del flood fill al abrir un 0 en tableros grandes y poco densos.
+
+Uso:
+    python -m benchmarks.flood_fill
+"""
+
+import time
+
+import numpy as np
+
+from src.game.minesweeper import Minesweeper
+
+
+SIZES = [(16, 30, 99), (100, 100, 100), (300, 300, 500), (1000, 1000, 1000)]
+
+
+def time_first_zero(rows: int, columns: int, mines: int):
+    """
+    Crea un tablero y mide el tiempo de abrir su primer 0.
+
+    Args:
+        rows: Número de filas del tablero
+        columns: Número de columnas del tablero
+        mines: Número de minas
+
+    Returns:
+        Tupla (segundos, celdas descubiertas)
+    """
+    game = Minesweeper(rows, columns, mines)
+    zeros = np.argwhere(game.board._mine_grid == 0)
+    if len(zeros) == 0:
+        return 0.0, 0
+    row, col = zeros[0]
+
+    start = time.perf_counter()
+    game.open_cell(int(row), int(col))
+    elapsed = time.perf_counter() - start
+    return elapsed, int(np.count_nonzero(game.board._visible_grid))
+
+
+def main() -> None:
+    print(f"{'Tablero':<20}{'Descubiertas':>14}{'Tiempo (ms)':>14}")
+    for rows, columns, mines in SIZES:
+        elapsed, opened = time_first_zero(rows, columns, mines)
+        print(f"{f'{rows}x{columns}/{mines}':<20}{opened:>14,}{elapsed * 1000:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark de FrameRenderer: fotogramas por segundo en lote frente a BoardVisualizer.save.
+
+Renderiza todos los estados de partidas EXPERT grabadas en el diario (una
+pasada de GameReplay más un render_batch por partida) y, con --compare,
+guarda unos cuantos de esos estados con matplotlib para comparar.
+
+Uso:
+    python -m benchmarks.frames [--games 5] [--cell-size 16] [--compare]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.journal import record_games
+from src.game.journal import GameReplay, JournalReader
+from src.game.minesweeper import Minesweeper
+from src.utils.frames import FrameRenderer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=5, help="Partidas EXPERT a renderizar")
+    parser.add_argument("--cell-size", type=int, default=16, help="Píxeles por celda")
+    parser.add_argument("--compare", action="store_true", help="Medir también BoardVisualizer.save")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de los tableros")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "games.msj")
+        record_games(filepath, Minesweeper.EXPERT, args.games, args.seed)
+        with JournalReader(filepath) as journal:
+            records = list(journal)
+
+        renderer = FrameRenderer(args.cell_size)
+        frames, elapsed = 0, 0.0
+        for record in records:
+            start = time.perf_counter()
+            frames += len(renderer.render_record(record))
+            elapsed += time.perf_counter() - start
+        height, width = renderer.render_game(records[0].new_game()).shape[:2]
+        print(f"FrameRenderer: {frames} fotogramas de {width}x{height} en {elapsed:.2f} s "
+              f"({frames / elapsed:.0f} fotogramas/s)")
+
+        if args.compare:
+            import matplotlib
+            matplotlib.use("Agg")
+            import matplotlib.pyplot as plt
+            from src.utils.visualization import BoardVisualizer
+
+            replay = GameReplay(max(records, key=len))
+            count = min(10, len(replay))
+            start = time.perf_counter()
+            for move in range(count):
+                visualizer = BoardVisualizer(replay.seek(move).clone())
+                visualizer.save(os.path.join(directory, "frame.png"))
+                plt.close(visualizer.fig)
+            elapsed = time.perf_counter() - start
+            print(f"BoardVisualizer.save: {count} fotogramas en {elapsed:.2f} s "
+                  f"({count / elapsed:.1f} fotogramas/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Tiempo de importación de los módulos del proyecto y detección de imports pesados.
+
+Cada módulo se importa en un subproceso limpio. Se mide el tiempo de
+importación y se comprueba que no arrastra TensorFlow, pandas, scikit-learn
+ni matplotlib. Termina con código 1 si algún módulo no se puede importar,
+supera el presupuesto o carga una dependencia pesada, para poder usarlo
+como comprobación en CI.
+
+Uso:
+    python -m benchmarks.import_time [--budget 0.5] [--repeat 3]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+
+# Módulos que no deben cargar dependencias pesadas al importarse
+MODULES = [
+    "src.game.minesweeper",
+    "src.game.compact_board",
+    "src.game.batched",
+    "src.game.vec_env",
+    "src.game.journal",
+    "src.solver.constraint_solver",
+    "src.solver.probability",
+    "src.solver.planner",
+    "src.ai.numpy_model",
+    "src.ai.inference",
+    "src.ai.dataset",
+    "src.ai.parallel",
+    "src.ui.cli",
+    "src.utils.visualization",
+    "src.utils.frames",
+    "MineSweeper",
+    "pruebas3",
+]
+
+HEAVY_MODULES = ["tensorflow", "pandas", "sklearn", "matplotlib"]
+
+SNIPPET = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"seconds": elapsed, "heavy": heavy}}))
+"""
+
+
+def measure(module: str, repeat: int):
+    """
+    Importa un módulo en subprocesos limpios y mide el mejor tiempo.
+
+    Args:
+        module: Nombre del módulo a importar
+        repeat: Número de subprocesos a lanzar
+
+    Returns:
+        Diccionario con segundos y dependencias pesadas cargadas, o con la
+        salida de error ("error") si el import falla
+    """
+    code = SNIPPET.format(module=module, heavy=HEAVY_MODULES)
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", code],
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            return {"error": result.stderr.strip()}
+        stats = json.loads(result.stdout.strip().splitlines()[-1])
+        if best is None or stats["seconds"] < best["seconds"]:
+            best = stats
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget", type=float, default=0.5, help="Tiempo máximo de importación (s)")
+    parser.add_argument("--repeat", type=int, default=3, help="Subprocesos por módulo (se toma el mejor)")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'Módulo':<32}{'Importación (ms)':>18}  Dependencias pesadas")
+    for module in MODULES:
+        stats = measure(module, args.repeat)
+        if "error" in stats:
+            print(f"{module:<32}{'error':>18}")
+            print(stats["error"])
+            failures.append(module)
+            continue
+        heavy = ", ".join(stats["heavy"]) or "-"
+        print(f"{module:<32}{stats['seconds'] * 1000:>18.1f}  {heavy}")
+        if stats["heavy"] or stats["seconds"] > args.budget:
+            failures.append(module)
+
+    if failures:
+        print(f"\nFuera de presupuesto ({args.budget:.2f} s, imports pesados o errores): {', '.join(failures)}")
+        sys.exit(1)
+    print(f"\nTodos los módulos dentro del presupuesto ({args.budget:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
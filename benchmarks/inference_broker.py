@@ -0,0 +1,108 @@
+"""
+Benchmark de inferencia por lotes con InferenceBroker frente a predict con lote 1.
+
+Simula N partidas concurrentes (hilos) que piden una predicción por
+movimiento y mide throughput y latencia de decisión p50/p99.
+
+Uso:
+    python -m benchmarks.inference_broker [--model minesweeper_ai_model.h5] [--games 64] [--runtime numpy]
+"""
+
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from src.ai.inference import InferenceBroker
+from src.ai.numpy_model import NumpyModel
+
+
+def load_model(path: str, runtime: str = "keras"):
+    """
+    Carga un modelo desde un archivo .h5.
+
+    Args:
+        path: Ruta del modelo
+        runtime: "keras" (TensorFlow) o "numpy" (NumpyModel)
+
+    Returns:
+        Modelo con método predict
+    """
+    if runtime == "numpy":
+        return NumpyModel.load(path)
+    import tensorflow as tf
+    return tf.keras.models.load_model(path)
+
+
+def run_games(model, num_games: int, moves_per_game: int, input_size: int) -> np.ndarray:
+    """
+    Ejecuta num_games hilos que llaman a model.predict una vez por movimiento.
+
+    Args:
+        model: Modelo o InferenceBroker
+        num_games: Número de partidas concurrentes
+        moves_per_game: Predicciones por partida
+        input_size: Tamaño de la entrada del modelo
+
+    Returns:
+        Array con la latencia (segundos) de cada predicción
+    """
+    latencies = [[] for _ in range(num_games)]
+
+    def play(game: int) -> None:
+        rng = np.random.default_rng(game)
+        for _ in range(moves_per_game):
+            state = rng.integers(-1, 9, (1, input_size)).astype(np.float32)
+            start = time.perf_counter()
+            model.predict(state, verbose=0)
+            latencies[game].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=play, args=(game,)) for game in range(num_games)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return np.concatenate([np.array(values) for values in latencies])
+
+
+def report(name: str, latencies: np.ndarray, elapsed: float) -> None:
+    """Imprime throughput y latencias de una configuración."""
+    print(f"{name:<28}{len(latencies) / elapsed:>14,.0f}"
+          f"{np.percentile(latencies, 50) * 1000:>12.2f}{np.percentile(latencies, 99) * 1000:>12.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default="minesweeper_ai_model.h5", help="Modelo .h5")
+    parser.add_argument("--runtime", choices=("keras", "numpy"), default="keras", help="Runtime del modelo")
+    parser.add_argument("--games", type=int, default=64, help="Partidas concurrentes")
+    parser.add_argument("--moves", type=int, default=50, help="Predicciones por partida")
+    parser.add_argument("--max-wait", type=float, default=0.002, help="Espera máxima del lote (s)")
+    args = parser.parse_args()
+
+    model = load_model(args.model, args.runtime)
+    input_size = model.input_shape[-1]
+    model.predict(np.zeros((1, input_size)), verbose=0)  # Calentamiento
+
+    print(f"{'Configuración':<28}{'Predicciones/s':>14}{'p50 (ms)':>12}{'p99 (ms)':>12}")
+
+    start = time.perf_counter()
+    latencies = run_games(model, 1, args.moves * 4, input_size)
+    report("predict lote 1, 1 partida", latencies, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    latencies = run_games(model, args.games, args.moves, input_size)
+    report(f"predict lote 1, {args.games} hilos", latencies, time.perf_counter() - start)
+
+    for max_batch_size in (16, 64, 256):
+        with InferenceBroker(model, max_batch_size=max_batch_size, max_wait=args.max_wait) as broker:
+            start = time.perf_counter()
+            latencies = run_games(broker, args.games, args.moves, input_size)
+            elapsed = time.perf_counter() - start
+            mean_batch = broker.get_stats()["mean_batch_size"]
+        report(f"broker lote<={max_batch_size} (media {mean_batch:.0f})", latencies, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark del diario de partidas: tamaño por partida, escritura, lectura y reproducción.
+
+Graba partidas jugadas con ConstraintSolver (jugadas seguras y, si no hay,
+la celda más segura según ProbabilityEngine), las lee del diario y mide el
+tiempo de llevar la partida a una jugada al azar con GameReplay.seek frente
+a volver a jugarla desde el principio.
+
+Uso:
+    python -m benchmarks.journal [--games 200] [--interval 32]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Dict
+
+from src.game.journal import GameRecorder, GameReplay, JournalReader, JournalWriter
+from src.game.minesweeper import GameAction, GameStatus, Minesweeper
+from src.solver.constraint_solver import ConstraintSolver
+from src.solver.probability import ProbabilityEngine
+
+
+def record_games(filepath: str, config: Dict[str, int], num_games: int, seed: int) -> int:
+    """
+    Juega partidas con el solucionador y las guarda en el diario.
+
+    Args:
+        filepath: Ruta del diario
+        config: Configuración del tablero (rows, columns, mines)
+        num_games: Número de partidas
+        seed: Semilla de la primera partida (las demás usan las siguientes)
+
+    Returns:
+        Número total de jugadas grabadas
+    """
+    engine = ProbabilityEngine()
+    total_moves = 0
+    with JournalWriter(filepath) as journal:
+        for game_seed in range(seed, seed + num_games):
+            recorder = GameRecorder(game_seed, **config, safe_first_click=True)
+            solver = ConstraintSolver(recorder.game)
+            recorder.open_cell(config["rows"] // 2, config["columns"] // 2)
+            while recorder.game.status == GameStatus.ONGOING:
+                move = solver.next_move()
+                if move is None:
+                    recorder.open_cell(*engine.safest_cell(solver))
+                elif move[2] == GameAction.OPEN:
+                    recorder.open_cell(move[0], move[1])
+                else:
+                    recorder.mark_cell(move[0], move[1])
+            record = recorder.finish()
+            total_moves += len(record)
+            journal.append(record)
+    return total_moves
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=200, help="Partidas por nivel")
+    parser.add_argument("--interval", type=int, default=32, help="Jugadas entre puntos de control")
+    parser.add_argument("--seeks", type=int, default=20, help="Saltos al azar por partida")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de tableros y saltos")
+    args = parser.parse_args()
+
+    presets = {"beginner": Minesweeper.BEGINNER, "intermediate": Minesweeper.INTERMEDIATE,
+               "expert": Minesweeper.EXPERT}
+    rng = random.Random(args.seed)
+    print(f"{'Nivel':<14}{'Jugadas':>9}{'B/partida':>11}{'Partidas/MB':>13}"
+          f"{'Lectura µs':>12}{'seek ms':>10}{'Desde 0 ms':>12}")
+    for name, config in presets.items():
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "games.msj")
+            total_moves = record_games(filepath, config, args.games, args.seed)
+            size = os.path.getsize(filepath)
+
+            start = time.perf_counter()
+            with JournalReader(filepath) as journal:
+                records = list(journal)
+            read_seconds = time.perf_counter() - start
+
+        seek_seconds, replay_seconds, seeks = 0.0, 0.0, 0
+        for record in records:
+            replay = GameReplay(record, args.interval)
+            replay.final_state()  # Los puntos de control se crean en la primera pasada
+            targets = [rng.randint(0, len(record)) for _ in range(args.seeks)]
+
+            start = time.perf_counter()
+            for move in targets:
+                replay.seek(move)
+            seek_seconds += time.perf_counter() - start
+
+            start = time.perf_counter()
+            for move in targets:
+                GameReplay(record, len(record) + 1).seek(move)
+            replay_seconds += time.perf_counter() - start
+            seeks += len(targets)
+
+        print(f"{name:<14}{total_moves / args.games:>9.1f}{size / args.games:>11.1f}"
+              f"{args.games / (size / 2 ** 20):>13.0f}{read_seconds / args.games * 1e6:>12.1f}"
+              f"{seek_seconds / seeks * 1000:>10.3f}{replay_seconds / seeks * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Arranque, memoria y exactitud de NumpyModel frente a Keras.
+
+Cada runtime se mide en un subproceso limpio: tiempo hasta tener el modelo
+cargado y una predicción hecha, y memoria residente máxima.
+
+Uso:
+    python -m benchmarks.numpy_model [--model minesweeper_ai_model.h5]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from src.ai.numpy_model import NumpyModel
+
+
+NUMPY_SNIPPET = """
+import time, resource, json
+start = time.perf_counter()
+import numpy as np
+from src.ai.numpy_model import NumpyModel
+model = NumpyModel.load({path!r})
+out = model.predict(np.load({inputs!r}))
+elapsed = time.perf_counter() - start
+np.save({outputs!r}, out)
+print(json.dumps({{"seconds": elapsed, "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}}))
+"""
+
+KERAS_SNIPPET = """
+import time, resource, json
+start = time.perf_counter()
+import numpy as np
+import tensorflow as tf
+model = tf.keras.models.load_model({path!r})
+out = model.predict(np.load({inputs!r}), verbose=0)
+elapsed = time.perf_counter() - start
+np.save({outputs!r}, out)
+print(json.dumps({{"seconds": elapsed, "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}}))
+"""
+
+
+def run_snippet(snippet: str, path: str, inputs: str, outputs: str):
+    """
+    Ejecuta un fragmento de carga y predicción en un subproceso.
+
+    Args:
+        snippet: Código a ejecutar
+        path: Ruta del modelo
+        inputs: Archivo .npy con las entradas
+        outputs: Archivo .npy donde guardar las salidas
+
+    Returns:
+        Diccionario con segundos y memoria, o None si el subproceso falla
+    """
+    code = snippet.format(path=path, inputs=inputs, outputs=outputs)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default="minesweeper_ai_model.h5", help="Modelo .h5")
+    parser.add_argument("--samples", type=int, default=1000, help="Entradas de prueba")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = os.path.join(tmp, "inputs.npy")
+        rng = np.random.default_rng(0)
+        input_size = NumpyModel.load(args.model).input_shape[-1]
+        np.save(inputs, rng.integers(-2, 9, (args.samples, input_size)).astype(np.float32))
+
+        print(f"{'Runtime':<10}{'Arranque (s)':>14}{'RSS máx (MB)':>14}")
+        results = {}
+        for name, snippet in (("numpy", NUMPY_SNIPPET), ("keras", KERAS_SNIPPET)):
+            outputs = os.path.join(tmp, f"{name}.npy")
+            stats = run_snippet(snippet, args.model, inputs, outputs)
+            if stats is None:
+                print(f"{name:<10}{'no disponible':>14}")
+                continue
+            results[name] = np.load(outputs)
+            print(f"{name:<10}{stats['seconds']:>14.2f}{stats['rss_mb']:>14.0f}")
+
+        if len(results) == 2:
+            diff = np.abs(results["numpy"] - results["keras"]).max()
+            print(f"\nDiferencia máxima NumPy vs Keras: {diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
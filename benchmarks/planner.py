@@ -0,0 +1,91 @@
+"""
+Benchmark de MonteCarloPlanner en la heurística de pruebas3: victorias y tiempo por decisión.
+
+Juega las mismas partidas (misma semilla) con pruebas3.get_ai_move usando la
+puntuación de available_cells y usando el planificador cuando no hay jugadas
+seguras.
+
+Uso:
+    python -m benchmarks.planner [--games 100] [--budget 0.1] [--workers 1]
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.game.minesweeper import Minesweeper
+from src.solver.planner import MonteCarloPlanner
+
+
+class _NullModel:
+    """Modelo sustituto: la puntuación de available_cells no usa la predicción."""
+
+    def predict(self, state, verbose=0):
+        return np.zeros((len(state), 2))
+
+
+def play_games(config: Dict[str, int], num_games: int, seed: int,
+               planner: Optional[MonteCarloPlanner]) -> Dict[str, float]:
+    """
+    Juega partidas con pruebas3.get_ai_move.
+
+    Args:
+        config: Configuración del tablero (rows, columns, mines)
+        num_games: Número de partidas
+        seed: Semilla del módulo random (tableros y jugadas)
+        planner: Planificador para las jugadas sin deducción (None para la heurística)
+
+    Returns:
+        Diccionario con victorias, decisiones y tiempo de decisión
+    """
+    import pruebas3
+
+    random.seed(seed)
+    model = _NullModel()
+    victories, decisions, elapsed = 0, 0, 0.0
+    for _ in range(num_games):
+        game = pruebas3.Minesweeper(config["rows"], config["columns"], config["mines"])
+        if planner is not None:
+            planner.reset()
+        for _ in range(config["rows"] * config["columns"]):
+            start = time.perf_counter()
+            move = pruebas3.get_ai_move(game, model, planner)
+            elapsed += time.perf_counter() - start
+            decisions += 1
+            if move is None:
+                break
+            row, col, action = move
+            if action == "open":
+                result = game.open_cell(row, col)
+                if result in ("mine", "Victory"):
+                    break
+            else:
+                game.mark_mine(row, col)
+        if game.check_victory():
+            victories += 1
+    return {"victories": victories, "decisions": decisions, "seconds": elapsed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=100, help="Partidas por nivel y método")
+    parser.add_argument("--budget", type=float, default=0.1, help="Tiempo por decisión del planificador")
+    parser.add_argument("--workers", type=int, default=1, help="Procesos para las simulaciones")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de tableros y jugadas")
+    args = parser.parse_args()
+
+    presets = {"5x5": {"rows": 5, "columns": 5, "mines": 5}, "beginner": Minesweeper.BEGINNER}
+    print(f"{'Nivel':<12}{'Método':<14}{'Victorias':>11}{'ms/decisión':>13}")
+    for name, config in presets.items():
+        with MonteCarloPlanner(time_budget=args.budget, workers=args.workers, seed=args.seed) as planner:
+            for method, used in (("heurística", None), ("planificador", planner)):
+                result = play_games(config, args.games, args.seed, used)
+                print(f"{name:<12}{method:<14}{result['victories'] / args.games:>11.1%}"
+                      f"{result['seconds'] / max(1, result['decisions']) * 1000:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
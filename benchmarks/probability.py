@@ -0,0 +1,54 @@
+"""
+Benchmark del motor de probabilidad en posiciones EXPERT reales.
+
+Juega partidas con ConstraintSolver y, cuando no hay deducciones, adivina la
+celda más segura según ProbabilityEngine. Mide el tiempo de cada cálculo.
+
+Uso:
+    python -m benchmarks.probability [--games 50]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.game.minesweeper import Minesweeper, GameAction, GameStatus
+from src.solver.constraint_solver import ConstraintSolver
+from src.solver.probability import ProbabilityEngine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=50, help="Partidas EXPERT a jugar")
+    args = parser.parse_args()
+
+    config = Minesweeper.EXPERT
+    engine = ProbabilityEngine()
+    timings = []
+    victories = 0
+    for _ in range(args.games):
+        game = Minesweeper(config["rows"], config["columns"], config["mines"])
+        solver = ConstraintSolver(game)
+        while game.status == GameStatus.ONGOING:
+            move = solver.next_move()
+            if move is None:
+                start = time.perf_counter()
+                row, col = engine.safest_cell(solver)
+                timings.append(time.perf_counter() - start)
+                game.open_cell(row, col)
+            elif move[2] == GameAction.OPEN:
+                game.open_cell(move[0], move[1])
+            else:
+                game.mark_cell(move[0], move[1])
+        victories += game.status == GameStatus.VICTORY
+
+    timings_ms = np.array(timings) * 1000
+    print(f"Partidas: {args.games}  Victorias: {victories} ({victories / args.games:.0%})")
+    print(f"Cálculos de probabilidad: {len(timings_ms)}")
+    print(f"Tiempo por cálculo (ms): p50 {np.percentile(timings_ms, 50):.2f}  "
+          f"p99 {np.percentile(timings_ms, 99):.2f}  máx {timings_ms.max():.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark de BoardVisualizer.animate_game: dibujo completo frente a incremental.
+
+Graba una partida EXPERT jugada con el solucionador y la anima sin espera
+entre jugadas con el backend Agg (sin ventana), midiendo fotogramas por
+segundo en cada modo.
+
+Uso:
+    python -m benchmarks.rendering [--moves 100]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from benchmarks.journal import record_games
+from src.game.journal import JournalReader
+from src.game.minesweeper import Minesweeper
+from src.utils.visualization import BoardVisualizer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--moves", type=int, default=100, help="Jugadas animadas")
+    parser.add_argument("--seed", type=int, default=2, help="Semilla del tablero")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "games.msj")
+        record_games(filepath, Minesweeper.EXPERT, 1, args.seed)
+        with JournalReader(filepath) as journal:
+            record = journal[0]
+    actions = record.actions()[:args.moves]
+
+    print(f"{'Modo':<14}{'Jugadas':>9}{'Fotogramas/s':>14}")
+    for name, incremental in (("completo", False), ("incremental", True)):
+        visualizer = BoardVisualizer(record.new_game(), figsize=(12, 7), incremental=incremental)
+        start = time.perf_counter()
+        visualizer.animate_game(actions, delay=0)
+        elapsed = time.perf_counter() - start
+        plt.close(visualizer.fig)
+        print(f"{name:<14}{len(actions):>9}{len(actions) / elapsed:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
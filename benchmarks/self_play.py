@@ -0,0 +1,46 @@
+"""
+Benchmark de auto-juego en paralelo: partidas por segundo según el número de procesos.
+
+Juega las mismas partidas (mismas semillas) con distinto número de procesos,
+comprueba que los resultados son idénticos y mide el escalado.
+
+Uso:
+    python -m benchmarks.self_play [--model minesweeper_ai_model.h5] [--games 2000]
+"""
+
+import argparse
+import os
+import time
+from functools import partial
+
+from src.ai.parallel import game_seeds, play_parallel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default="minesweeper_ai_model.h5", help="Modelo .h5")
+    parser.add_argument("--games", type=int, default=2000, help="Partidas por configuración")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla base")
+    args = parser.parse_args()
+
+    import MineSweeper
+
+    play = partial(MineSweeper.play_game, verbose=False)
+    seeds = game_seeds(args.seed, args.games)
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cores} - {w for w in (2, 4) if w > cores})
+
+    print(f"{'Procesos':<10}{'Partidas/s':>12}{'Aceleración':>13}{'Idénticos':>11}")
+    reference, base_rate = None, None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        results = play_parallel(play, seeds, args.model, workers=workers)
+        rate = len(seeds) / (time.perf_counter() - start)
+        if reference is None:
+            reference, base_rate = results, rate
+        identical = "sí" if results == reference else "NO"
+        print(f"{workers:<10}{rate:>12,.0f}{rate / base_rate:>12.2f}x{identical:>11}")
+
+
+if __name__ == "__main__":
+    main()
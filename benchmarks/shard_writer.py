@@ -0,0 +1,75 @@
+"""
+Benchmark de escritura y lectura de datos de entrenamiento: fragmentos .npy frente a CSV.
+
+Uso:
+    python -m benchmarks.shard_writer [--samples 200000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from src.ai.dataset import ShardReader, ShardWriter
+
+
+def directory_size(path: str) -> int:
+    """Tamaño total en bytes de los archivos de un directorio o de un archivo."""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=200_000, help="Muestras a escribir")
+    parser.add_argument("--cells", type=int, default=25, help="Celdas por estado")
+    parser.add_argument("--shard-size", type=int, default=65536, help="Muestras por fragmento")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    states = rng.integers(-2, 9, (args.samples, args.cells)).astype(np.int8)
+    rows = rng.integers(0, 5, args.samples).astype(np.int16)
+    columns = rng.integers(0, 5, args.samples).astype(np.int16)
+    actions = rng.integers(0, 2, args.samples).astype(np.uint8)
+
+    print(f"{'Formato':<16}{'Escritura (s)':>15}{'Lectura (s)':>13}{'Tamaño (MB)':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        # Fragmentos: se escriben muestra a muestra por partidas de 50 movimientos
+        path = os.path.join(tmp, "shards")
+        start = time.perf_counter()
+        with ShardWriter(path, {"state": ((args.cells,), np.int8), "row": ((), np.int16),
+                                "column": ((), np.int16), "action": ((), np.uint8)},
+                         shard_size=args.shard_size) as writer:
+            for i in range(0, args.samples, 50):
+                writer.extend(state=states[i:i + 50], row=rows[i:i + 50],
+                              column=columns[i:i + 50], action=actions[i:i + 50])
+        write_time = time.perf_counter() - start
+        start = time.perf_counter()
+        total = sum(len(shard["action"]) for shard in ShardReader(path))
+        read_time = time.perf_counter() - start
+        assert total == args.samples
+        print(f"{'fragmentos .npy':<16}{write_time:>15.3f}{read_time:>13.3f}{directory_size(path) / 2**20:>13.1f}")
+
+        try:
+            import pandas as pd
+        except ImportError:
+            print(f"{'CSV (pandas)':<16}{'no disponible':>15}")
+            return
+        path = os.path.join(tmp, "data.csv")
+        start = time.perf_counter()
+        df = pd.DataFrame(states, columns=[f"cell_{i}" for i in range(args.cells)])
+        df["row"], df["column"] = rows, columns
+        df["action"] = np.where(actions == 1, "open", "mark")
+        df.to_csv(path, index=False)
+        write_time = time.perf_counter() - start
+        start = time.perf_counter()
+        pd.read_csv(path)
+        read_time = time.perf_counter() - start
+        print(f"{'CSV (pandas)':<16}{write_time:>15.3f}{read_time:>13.3f}{directory_size(path) / 2**20:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
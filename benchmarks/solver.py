@@ -0,0 +1,114 @@
+"""
+Benchmark de decisiones por segundo: ConstraintSolver frente a la heurística de pruebas3.
+
+Uso:
+    python -m benchmarks.solver [--games 50]
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from src.game.minesweeper import Minesweeper, GameAction, GameStatus
+from src.solver.constraint_solver import ConstraintSolver
+
+
+class _NullModel:
+    """Modelo sustituto para que la heurística no dependa de la inferencia."""
+
+    def predict(self, state, verbose=0):
+        return np.zeros((len(state), 2))
+
+
+def solver_moves_per_second(num_games: int, seed: int = 0) -> float:
+    """
+    Juega partidas EXPERT con ConstraintSolver y mide decisiones por segundo.
+
+    Cuando no hay deducciones se abre una celda oculta al azar (no se cuenta
+    en el tiempo de decisión).
+
+    Args:
+        num_games: Número de partidas a jugar
+        seed: Semilla para las jugadas al azar
+
+    Returns:
+        Decisiones del solucionador por segundo
+    """
+    rng = random.Random(seed)
+    config = Minesweeper.EXPERT
+    decisions, elapsed = 0, 0.0
+    for _ in range(num_games):
+        game = Minesweeper(config["rows"], config["columns"], config["mines"])
+        solver = ConstraintSolver(game)
+        while game.status == GameStatus.ONGOING:
+            start = time.perf_counter()
+            move = solver.next_move()
+            elapsed += time.perf_counter() - start
+            decisions += 1
+
+            if move is None:
+                hidden = np.argwhere(game.get_board_state() == game.board.HIDDEN)
+                row, col = hidden[rng.randrange(len(hidden))]
+                game.open_cell(int(row), int(col))
+            elif move[2] == GameAction.OPEN:
+                game.open_cell(move[0], move[1])
+            else:
+                game.mark_cell(move[0], move[1])
+    return decisions / elapsed
+
+
+def heuristic_moves_per_second(num_games: int, seed: int = 0) -> float:
+    """
+    Juega partidas EXPERT con pruebas3.get_ai_move y mide decisiones por segundo.
+
+    Args:
+        num_games: Número de partidas a jugar
+        seed: Semilla del módulo random
+
+    Returns:
+        Decisiones de la heurística por segundo
+    """
+    import pruebas3
+
+    random.seed(seed)
+    config = Minesweeper.EXPERT
+    model = _NullModel()
+    decisions, elapsed = 0, 0.0
+    for _ in range(num_games):
+        game = pruebas3.Minesweeper(config["rows"], config["columns"], config["mines"])
+        moves = 0
+        while not game.lose and not game.check_victory() and moves < config["rows"] * config["columns"]:
+            start = time.perf_counter()
+            move = pruebas3.get_ai_move(game, model)
+            elapsed += time.perf_counter() - start
+            decisions += 1
+            if move is None:
+                break
+
+            row, col, action = move
+            if action == "open":
+                game.open_cell(row, col)
+            else:
+                game.mark_mine(row, col)
+            moves += 1
+    return decisions / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=50, help="Partidas EXPERT por método")
+    args = parser.parse_args()
+
+    print(f"{'Método':<28}{'Decisiones/s':>14}")
+    print(f"{'ConstraintSolver':<28}{solver_moves_per_second(args.games):>14,.0f}")
+    try:
+        rate = heuristic_moves_per_second(args.games)
+        print(f"{'pruebas3.get_ai_move':<28}{rate:>14,.0f}")
+    except ImportError as e:
+        print(f"{'pruebas3.get_ai_move':<28}{'no disponible':>14} ({e})")
+
+
+if __name__ == "__main__":
+    main()
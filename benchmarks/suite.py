@@ -0,0 +1,334 @@
+"""
+Suite reproducible de benchmarks del motor y de la IA con comparación contra una línea base.
+
+Mide, con semillas fijas y para cada configuración predefinida y tableros
+grandes personalizados: generación de tableros, open_cell con y sin flood
+fill, comprobación de victoria, get_state_representation y la heurística
+pruebas3.get_ai_move; además, la inferencia de NumpyModel. Los resultados
+(operaciones por segundo, mayor es mejor) se guardan en JSON y se comparan
+con una línea base mostrando la variación en porcentaje.
+
+Uso:
+    python -m benchmarks.suite [--output resultados.json] [--baseline benchmarks/baseline.json]
+    python -m benchmarks.suite --save-baseline     # actualiza benchmarks/baseline.json
+    python -m benchmarks.suite --quick --fail-on-regression 25
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict
+
+import numpy as np
+
+from src.game.board import Board, _DEFAULT_RNG
+from src.game.minesweeper import Minesweeper
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+CONFIGS = {
+    "beginner": Minesweeper.BEGINNER,
+    "intermediate": Minesweeper.INTERMEDIATE,
+    "expert": Minesweeper.EXPERT,
+    "large": {"rows": 100, "columns": 100, "mines": 2000},
+    "huge": {"rows": 300, "columns": 300, "mines": 18000},
+}
+
+
+def seed_everything(seed: int) -> None:
+    """
+    Fija las semillas del módulo random y del generador de tableros.
+
+    Args:
+        seed: Semilla
+    """
+    random.seed(seed)
+    # El generador de Board es compartido: se reinicia su estado en el sitio
+    _DEFAULT_RNG.bit_generator.state = np.random.default_rng(seed).bit_generator.state
+
+
+def best_rate(measure: Callable[[], Dict[str, float]], repeats: int) -> float:
+    """
+    Ejecuta una medición varias veces y devuelve la mejor tasa.
+
+    Args:
+        measure: Función que devuelve {"ops": operaciones, "seconds": tiempo}
+        repeats: Número de repeticiones
+
+    Returns:
+        Operaciones por segundo de la mejor repetición
+    """
+    rates = []
+    for _ in range(repeats):
+        result = measure()
+        rates.append(result["ops"] / result["seconds"] if result["seconds"] > 0 else 0.0)
+    return max(rates)
+
+
+def bench_board_generation(config: Dict[str, int], boards: int, seed: int) -> Dict[str, float]:
+    """Construye tableros completos (minas y números)."""
+    seed_everything(seed)
+    start = time.perf_counter()
+    for _ in range(boards):
+        Board(config["rows"], config["columns"], config["mines"])
+    return {"ops": boards, "seconds": time.perf_counter() - start}
+
+
+def bench_open_numbers(config: Dict[str, int], boards: int, seed: int) -> Dict[str, float]:
+    """Abre celdas numeradas (sin flood fill) en orden aleatorio."""
+    seed_everything(seed)
+    ops, elapsed = 0, 0.0
+    for _ in range(boards):
+        game = Minesweeper(config["rows"], config["columns"], config["mines"])
+        values = game.board.get_cell_values(np.arange(config["rows"] * config["columns"]))
+        cells = np.flatnonzero(values > 0).tolist()
+        random.shuffle(cells)
+        for cell in cells:
+            row, col = divmod(cell, config["columns"])
+            start = time.perf_counter()
+            game.open_cell(row, col)
+            elapsed += time.perf_counter() - start
+            ops += 1
+    return {"ops": ops, "seconds": elapsed}
+
+
+def bench_open_zeros(config: Dict[str, int], boards: int, seed: int) -> Dict[str, float]:
+    """Abre ceros cerrados (cada apertura dispara un flood fill)."""
+    seed_everything(seed)
+    ops, elapsed = 0, 0.0
+    for _ in range(boards):
+        game = Minesweeper(config["rows"], config["columns"], config["mines"])
+        values = game.board.get_cell_values(np.arange(config["rows"] * config["columns"]))
+        cells = np.flatnonzero(values == 0).tolist()
+        random.shuffle(cells)
+        for cell in cells:
+            row, col = divmod(cell, config["columns"])
+            if game.board.is_visible(row, col):
+                continue
+            start = time.perf_counter()
+            game.open_cell(row, col)
+            elapsed += time.perf_counter() - start
+            ops += 1
+    return {"ops": ops, "seconds": elapsed}
+
+
+def _half_played(config: Dict[str, int], seed: int) -> Minesweeper:
+    """Crea una partida con la mitad de las celdas seguras abiertas."""
+    seed_everything(seed)
+    game = Minesweeper(config["rows"], config["columns"], config["mines"])
+    values = game.board.get_cell_values(np.arange(config["rows"] * config["columns"]))
+    safe = np.flatnonzero(values >= 0).tolist()
+    random.shuffle(safe)
+    for cell in safe[:len(safe) // 2]:
+        game.open_cell(*divmod(cell, config["columns"]))
+    return game
+
+
+def bench_victory_check(config: Dict[str, int], calls: int, seed: int) -> Dict[str, float]:
+    """Comprueba la victoria en una partida a medias."""
+    board = _half_played(config, seed).board
+    start = time.perf_counter()
+    for _ in range(calls):
+        board.are_all_safe_cells_visible()
+    return {"ops": calls, "seconds": time.perf_counter() - start}
+
+
+def bench_state_representation(config: Dict[str, int], calls: int, seed: int) -> Dict[str, float]:
+    """Obtiene copias de la observación de una partida a medias."""
+    board = _half_played(config, seed).board
+    start = time.perf_counter()
+    for _ in range(calls):
+        board.get_state_representation(copy=True)
+    return {"ops": calls, "seconds": time.perf_counter() - start}
+
+
+class _NullModel:
+    """Modelo sustituto para que la heurística no dependa de la inferencia."""
+
+    def predict(self, state, verbose=0):
+        return np.zeros((len(state), 2))
+
+
+def bench_heuristic(config: Dict[str, int], decisions: int, seed: int) -> Dict[str, float]:
+    """Decisiones de pruebas3.get_ai_move jugando partidas completas."""
+    import pruebas3
+
+    random.seed(seed)
+    model = _NullModel()
+    ops, elapsed = 0, 0.0
+    while ops < decisions:
+        game = pruebas3.Minesweeper(config["rows"], config["columns"], config["mines"])
+        while ops < decisions and not game.lose and not game.check_victory():
+            start = time.perf_counter()
+            move = pruebas3.get_ai_move(game, model)
+            elapsed += time.perf_counter() - start
+            ops += 1
+            if move is None:
+                break
+            row, col, action = move
+            if action == "open":
+                game.open_cell(row, col)
+            else:
+                game.mark_mine(row, col)
+    return {"ops": ops, "seconds": elapsed}
+
+
+def bench_inference(model_path: str, batch_size: int, calls: int, seed: int) -> Dict[str, float]:
+    """Predicciones por segundo de NumpyModel con el lote indicado."""
+    from src.ai.numpy_model import NumpyModel
+
+    model = NumpyModel.load(model_path)
+    rng = np.random.default_rng(seed)
+    states = rng.integers(-2, 9, (batch_size, model.input_shape[-1])).astype(np.float32)
+    start = time.perf_counter()
+    for _ in range(calls):
+        model.predict(states, verbose=0)
+    return {"ops": calls * batch_size, "seconds": time.perf_counter() - start}
+
+
+def run_suite(scale: float, repeats: int, seed: int, model_path: str) -> Dict[str, Dict[str, float]]:
+    """
+    Ejecuta todos los benchmarks.
+
+    Args:
+        scale: Factor del volumen de trabajo (1.0 normal, menor para una pasada rápida)
+        repeats: Repeticiones de cada medición (se toma la mejor)
+        seed: Semilla de todas las mediciones
+        model_path: Modelo .h5 para la inferencia
+
+    Returns:
+        Diccionario {nombre: {"value": operaciones/s, "unit": unidad}}
+    """
+    def n(amount: int) -> int:
+        return max(1, int(amount * scale))
+
+    # Trabajo por configuración, ajustado al tamaño del tablero
+    work = {
+        "beginner": (400, 100, 50),
+        "intermediate": (200, 40, 30),
+        "expert": (100, 20, 20),
+        "large": (10, 2, 5),
+        "huge": (2, 1, 2),
+    }
+
+    results: Dict[str, Dict[str, float]] = {}
+
+    def record(name: str, unit: str, measure: Callable[[], Dict[str, float]]) -> None:
+        try:
+            value = best_rate(measure, repeats)
+        except ImportError as e:
+            print(f"  {name:<44}{'no disponible':>16}  ({e})")
+            return
+        results[name] = {"value": value, "unit": unit}
+        print(f"  {name:<44}{value:>16,.1f}  {unit}")
+
+    for name, config in CONFIGS.items():
+        boards, games, decisions_scale = work[name]
+        print(f"{name} ({config['rows']}x{config['columns']}, {config['mines']} minas)")
+        record(f"board_generation/{name}", "tableros/s",
+               lambda: bench_board_generation(config, n(boards), seed))
+        record(f"open_cell_number/{name}", "aperturas/s",
+               lambda: bench_open_numbers(config, n(games), seed))
+        record(f"open_cell_flood/{name}", "aperturas/s",
+               lambda: bench_open_zeros(config, n(games), seed))
+        record(f"victory_check/{name}", "llamadas/s",
+               lambda: bench_victory_check(config, n(100_000), seed))
+        record(f"state_representation/{name}", "llamadas/s",
+               lambda: bench_state_representation(config, n(2_000), seed))
+        record(f"heuristic/{name}", "decisiones/s",
+               lambda: bench_heuristic(config, n(10 * decisions_scale), seed))
+
+    if os.path.exists(model_path):
+        print(f"inferencia ({model_path})")
+        for batch_size in (1, 256):
+            record(f"inference_numpy/batch{batch_size}", "predicciones/s",
+                   lambda: bench_inference(model_path, batch_size, n(20_000 // batch_size + 20), seed))
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+    """
+    Compara los resultados con una línea base e imprime la variación.
+
+    Args:
+        results: Resultados actuales
+        baseline: Resultados de la línea base
+
+    Returns:
+        Diccionario {nombre: variación en %} (positivo = más rápido)
+    """
+    changes = {}
+    print(f"\n{'Benchmark':<46}{'Base':>14}{'Actual':>14}{'Cambio':>10}")
+    for name, result in results.items():
+        if name not in baseline or baseline[name]["value"] <= 0:
+            continue
+        base = baseline[name]["value"]
+        change = (result["value"] - base) / base * 100
+        changes[name] = change
+        print(f"{name:<46}{base:>14,.1f}{result['value']:>14,.1f}{change:>+9.1f}%")
+    return changes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default=None, help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Línea base JSON para comparar")
+    parser.add_argument("--save-baseline", action="store_true", help="Guarda los resultados como línea base")
+    parser.add_argument("--model", default="minesweeper_ai_model.h5", help="Modelo .h5 para la inferencia")
+    parser.add_argument("--seed", type=int, default=1234, help="Semilla de todas las mediciones")
+    parser.add_argument("--repeats", type=int, default=3, help="Repeticiones por medición (se toma la mejor)")
+    parser.add_argument("--quick", action="store_true", help="Pasada rápida con menos trabajo")
+    parser.add_argument("--fail-on-regression", type=float, default=None, metavar="PCT",
+                        help="Termina con código 1 si algún benchmark empeora más de PCT %%")
+    args = parser.parse_args()
+
+    results = run_suite(0.2 if args.quick else 1.0, args.repeats, args.seed, args.model)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "seed": args.seed,
+            "quick": args.quick,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResultados guardados en {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nLínea base guardada en {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo hay línea base en {args.baseline} (usa --save-baseline para crearla)")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    for key in ("seed", "quick"):
+        if baseline["meta"].get(key) != report["meta"][key]:
+            print(f"\nAviso: la línea base usa {key}={baseline['meta'].get(key)}; la comparación no es homogénea")
+    changes = compare(results, baseline["results"])
+
+    if args.fail_on_regression is not None:
+        regressions = [name for name, change in changes.items() if change < -args.fail_on_regression]
+        if regressions:
+            print(f"\nRegresiones de más del {args.fail_on_regression:.0f}%: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
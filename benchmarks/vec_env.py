@@ -0,0 +1,59 @@
+"""
+Benchmark de MinesweeperVecEnv: pasos de entorno por segundo según el número de entornos.
+
+Cada entorno abre una celda elegida al azar en cada paso; las
+partidas terminadas se reinician automáticamente.
+
+Uso:
+    python -m benchmarks.vec_env [--preset expert] [--steps 200]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.game.vec_env import MinesweeperVecEnv
+
+
+def steps_per_second(num_envs: int, preset: str, steps: int, seed: int = 0) -> float:
+    """
+    Mide pasos de entorno (entornos x pasos) por segundo.
+
+    Args:
+        num_envs: Número de entornos simultáneos
+        preset: Configuración del tablero
+        steps: Número de llamadas a step
+        seed: Semilla de tableros y acciones
+
+    Returns:
+        Pasos de entorno por segundo
+    """
+    env = MinesweeperVecEnv(num_envs, preset=preset, seed=seed)
+    rng = np.random.default_rng(seed)
+    cells = env.rows * env.columns
+    observations, _ = env.reset()
+
+    # Acciones al azar precalculadas: la política no cuenta en el tiempo
+    actions = rng.integers(0, cells, (steps, num_envs))
+
+    start = time.perf_counter()
+    for step in range(steps):
+        observations, rewards, terminated, truncated, infos = env.step(actions[step])
+    elapsed = time.perf_counter() - start
+    return num_envs * steps / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--preset", default="expert", choices=sorted(MinesweeperVecEnv.PRESETS))
+    parser.add_argument("--steps", type=int, default=200, help="Llamadas a step por configuración")
+    args = parser.parse_args()
+
+    print(f"{'Entornos':<10}{'Pasos/s':>14}")
+    for num_envs in (1, 64, 1024):
+        print(f"{num_envs:<10}{steps_per_second(num_envs, args.preset, args.steps):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,20 @@
 import random
 import numpy as np
-import pandas as pd
-import tensorflow as tf
-import matplotlib.pyplot as plt
-from sklearn.preprocessing import LabelEncoder
+
+from src.ai.numpy_model import NumpyModel
+from src.game.board import Board
+from src.game.neighbors import get_neighbor_table
+from src.utils.profiling import PROFILER, phase, profiled
+
+# pandas y matplotlib se importan en las funciones que los usan
 
 class Minesweeper:
     def __init__(self, rows, columns, num_mines):
         self.rows = rows
         self.columns = columns
         self.num_mines = num_mines
+        # Vecinos precalculados, compartidos por todas las partidas del mismo tamaño
+        self.neighbors = get_neighbor_table(rows, columns)
         self.board = self._create_board()
         self.visible = [[False for _ in range(columns)] for _ in range(rows)]
         self.marked = [[False for _ in range(columns)] for _ in range(rows)]
@@ -22,10 +27,9 @@ class Minesweeper:
         
         for row, col in mine_positions:
             board[row][col] = -1
-            for i in range(max(0, row-1), min(self.rows, row+2)):
-                for j in range(max(0, col-1), min(self.columns, col+2)):
-                    if board[i][j] != -1:
-                        board[i][j] += 1
+            for i, j in self.neighbors.adjacent(row, col):
+                if board[i][j] != -1:
+                    board[i][j] += 1
         
         return board
 
@@ -40,10 +44,9 @@ class Minesweeper:
 
         self.visible[row][column] = True
         if self.board[row][column] == 0:
-            for i in range(max(0, row-1), min(self.rows, row+2)):
-                for j in range(max(0, column-1), min(self.columns, column+2)):
-                    if not self.visible[i][j]:
-                        self.open_cell(i, j)
+            for i, j in self.neighbors.adjacent(row, column):
+                if not self.visible[i][j]:
+                    self.open_cell(i, j)
         
         return "Victory" if self.check_victory() else "continue"
     
@@ -80,7 +83,14 @@ class Minesweeper:
                     return False
         return True
 
-def get_ai_move(game, model):
+def board_observation(game):
+    # Tablero visible con las constantes de src.game.board.Board (para MonteCarloPlanner)
+    board = np.array(game.board)
+    return np.where(np.array(game.visible), board,
+                    np.where(np.array(game.marked), Board.MARKED, Board.HIDDEN))
+
+@profiled("decide")
+def get_ai_move(game, model, planner=None):
     try:
         # Si es el primer movimiento, elegir una esquina o borde
         num_visible = sum(sum(row) for row in game.visible)
@@ -100,6 +110,7 @@ def get_ai_move(game, model):
             return row, col, "open"
 
         # Analizar el tablero actual para tomar decisiones informadas
+        neighbors = get_neighbor_table(game.rows, game.columns)
         safe_moves = []  # Lista de casillas seguras para abrir
         mine_locations = []  # Lista de casillas que definitivamente tienen minas
         
@@ -112,18 +123,13 @@ def get_ai_move(game, model):
                     marked_count = 0
                     hidden_count = 0
                     
-                    for di in [-1, 0, 1]:
-                        for dj in [-1, 0, 1]:
-                            if di == 0 and dj == 0:
-                                continue
-                            ni, nj = i + di, j + dj
-                            if 0 <= ni < game.rows and 0 <= nj < game.columns:
-                                if not game.visible[ni][nj]:
-                                    if game.marked[ni][nj]:
-                                        marked_count += 1
-                                    else:
-                                        hidden_count += 1
-                                        adjacent_cells.append((ni, nj))
+                    for ni, nj in neighbors.adjacent(i, j):
+                        if not game.visible[ni][nj]:
+                            if game.marked[ni][nj]:
+                                marked_count += 1
+                            else:
+                                hidden_count += 1
+                                adjacent_cells.append((ni, nj))
                     
                     # Si el número coincide con las minas marcadas y hay celdas ocultas
                     if game.board[i][j] == marked_count and hidden_count > 0:
@@ -143,10 +149,19 @@ def get_ai_move(game, model):
             row, col = random.choice(mine_locations)
             return row, col, "mark"
         else:
-            # Si no hay movimientos obvios, usar el modelo para predecir
-            flattened_board = [cell for row in game.board for cell in row]
-            state = np.array(flattened_board).reshape(1, -1)
-            prediction = model.predict(state, verbose=0)
+            # Si no hay movimientos obvios y hay planificador, simular las celdas candidatas
+            # en colocaciones de minas coherentes con el tablero visible
+            if planner is not None:
+                cell = planner.choose(board_observation(game), game.num_mines)
+                if cell is not None:
+                    return cell[0], cell[1], "open"
+            
+            # Si no, usar el modelo para predecir
+            with phase("observation"):
+                flattened_board = [cell for row in game.board for cell in row]
+                state = np.array(flattened_board).reshape(1, -1)
+            with phase("inference"):
+                prediction = model.predict(state, verbose=0)
             
             # Encontrar la celda no abierta más prometedora
             available_cells = []
@@ -156,17 +171,13 @@ def get_ai_move(game, model):
                         # Calcular puntuación basada en celdas adyacentes conocidas
                         score = 0
                         nearby_numbers = False
-                        for di in [-1, 0, 1]:
-                            for dj in [-1, 0, 1]:
-                                ni, nj = i + di, j + dj
-                                if (0 <= ni < game.rows and 
-                                    0 <= nj < game.columns and 
-                                    game.visible[ni][nj]):
-                                    if game.board[ni][nj] > 0:
-                                        nearby_numbers = True
-                                        score += 2
-                                    elif game.board[ni][nj] == 0:
-                                        score += 1
+                        for ni, nj in neighbors.adjacent(i, j):
+                            if game.visible[ni][nj]:
+                                if game.board[ni][nj] > 0:
+                                    nearby_numbers = True
+                                    score += 2
+                                elif game.board[ni][nj] == 0:
+                                    score += 1
                         if nearby_numbers:
                             available_cells.append((i, j, score))
             
@@ -189,9 +200,16 @@ def get_ai_move(game, model):
         print(f"Error en predicción: {e}")
         return None
 
-def play_multiple_games(model, num_games=100, rows=5, columns=5, num_mines=5, max_moves_per_game=None):
+def play_multiple_games(model, num_games=100, rows=5, columns=5, num_mines=5, max_moves_per_game=None,
+                        planner=None, profile=False, profile_output=None):
+    import pandas as pd
+    
     if max_moves_per_game is None:
         max_moves_per_game = rows * columns  # Un movimiento por cada celda
+    
+    # Con profile, se mide el tiempo por fase de todas las partidas
+    if profile:
+        PROFILER.enable()
         
     victories = 0
     total_moves = 0
@@ -202,11 +220,13 @@ def play_multiple_games(model, num_games=100, rows=5, columns=5, num_mines=5, ma
         moves = 0
         try:
             game = Minesweeper(rows, columns, num_mines)
+            if planner is not None:
+                planner.reset()
             
             while not game.lose and not game.check_victory() and moves < max_moves_per_game:
                 game.display_board()
                 
-                move = get_ai_move(game, model)
+                move = get_ai_move(game, model, planner)
                 if move is None:
                     print("No hay más movimientos disponibles")
                     break
@@ -241,9 +261,19 @@ def play_multiple_games(model, num_games=100, rows=5, columns=5, num_mines=5, ma
             print(f"Error en el juego {game_num + 1}: {e}")
             continue
     
+    if profile:
+        PROFILER.disable()
+        print("\n=== Tiempo por fase ===")
+        print(PROFILER.format_table())
+        if profile_output is not None:
+            PROFILER.dump_json(profile_output)
+            print(f"\nPerfil guardado en '{profile_output}'")
+    
     return pd.DataFrame(games_data)
 
 def analyze_and_visualize_results(stats_df):
+    import matplotlib.pyplot as plt
+    
     if not stats_df.empty:
         # Crear figura con dos subplots
         plt.figure(figsize=(15, 6))
@@ -294,9 +324,9 @@ if __name__ == "__main__":
         BOARD_COLS = 5
         NUM_MINES = 5
         
-        # Cargar modelo
+        # Cargar modelo (solo inferencia: basta con el runtime de NumPy)
         print(f"Cargando modelo desde {MODEL_PATH}...")
-        model = tf.keras.models.load_model(MODEL_PATH)
+        model = NumpyModel.load(MODEL_PATH)
         
         # Jugar partidas y obtener estadísticas
         print(f"\nJugando {NUM_GAMES} partidas para evaluar el modelo...")
@@ -0,0 +1,386 @@
+"""
+Almacenamiento de datos de entrenamiento en fragmentos (shards) de arrays NumPy.
+"""
+
+import json
+import os
+import queue
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Descripción de un campo: (forma de una muestra, dtype)
+FieldSpec = Tuple[Tuple[int, ...], Any]
+
+
+def _shard_path(directory: str, field: str, index: int) -> str:
+    """Ruta del archivo .npy de un campo en un fragmento."""
+    return os.path.join(directory, f"{field}-{index:05d}.npy")
+
+
+class ShardWriter:
+    """
+    Escritor en streaming de muestras de entrenamiento tipadas.
+    
+    Acumula las muestras en buffers preasignados de shard_size filas y, al
+    llenarse, guarda cada campo como un archivo .npy sin comprimir (que luego
+    puede abrirse con memory-mapping). Al cerrar escribe manifest.json con los
+    campos, los fragmentos y metadatos libres. La memoria usada es constante:
+    un fragmento por campo, independientemente del número de partidas.
+    """
+    
+    def __init__(self, directory: str, fields: Dict[str, FieldSpec], shard_size: int = 65536,
+                 metadata: Optional[Dict[str, Any]] = None):
+        """
+        Inicializa el escritor.
+        
+        Args:
+            directory: Directorio de salida (se crea si no existe)
+            fields: Diccionario {nombre: (forma de una muestra, dtype)}
+            shard_size: Número de muestras por fragmento
+            metadata: Información adicional guardada en el manifiesto
+                (por ejemplo, los nombres de las etiquetas)
+        
+        Raises:
+            ValueError: Si no hay campos o shard_size no es positivo
+        """
+        if not fields:
+            raise ValueError("El escritor necesita al menos un campo")
+        if shard_size <= 0:
+            raise ValueError("shard_size debe ser positivo")
+        
+        self.directory = directory
+        self.shard_size = shard_size
+        self.metadata = dict(metadata or {})
+        self.fields = {name: (tuple(shape), np.dtype(dtype)) for name, (shape, dtype) in fields.items()}
+        
+        os.makedirs(directory, exist_ok=True)
+        self._buffers = {name: np.empty((shard_size,) + shape, dtype=dtype)
+                         for name, (shape, dtype) in self.fields.items()}
+        self._filled = 0
+        self._shards: List[int] = []
+        self._closed = False
+    
+    @property
+    def num_samples(self) -> int:
+        """Número total de muestras escritas (incluidas las pendientes)."""
+        return sum(self._shards) + self._filled
+    
+    def append(self, **sample: Any) -> None:
+        """
+        Añade una muestra.
+        
+        Args:
+            **sample: Un valor por campo, con la forma de una muestra
+        """
+        self.extend(**{name: np.asarray(value)[np.newaxis] for name, value in sample.items()})
+    
+    def extend(self, **arrays: Any) -> None:
+        """
+        Añade varias muestras a la vez.
+        
+        Args:
+            **arrays: Un array por campo con las muestras en el primer eje
+        
+        Raises:
+            ValueError: Si faltan campos o los arrays tienen distinta longitud
+            RuntimeError: Si el escritor está cerrado
+        """
+        if self._closed:
+            raise RuntimeError("El escritor de fragmentos está cerrado")
+        if set(arrays) != set(self.fields):
+            raise ValueError(f"Se esperaban los campos {sorted(self.fields)}, no {sorted(arrays)}")
+        
+        lengths = {len(array) for array in arrays.values()}
+        if len(lengths) != 1:
+            raise ValueError("Todos los campos deben tener el mismo número de muestras")
+        count = lengths.pop()
+        
+        start = 0
+        while start < count:
+            take = min(count - start, self.shard_size - self._filled)
+            for name, array in arrays.items():
+                self._buffers[name][self._filled:self._filled + take] = array[start:start + take]
+            self._filled += take
+            start += take
+            if self._filled == self.shard_size:
+                self.flush()
+    
+    def flush(self) -> None:
+        """Guarda en disco las muestras pendientes como un nuevo fragmento."""
+        if self._filled == 0:
+            return
+        index = len(self._shards)
+        for name, buffer in self._buffers.items():
+            np.save(_shard_path(self.directory, name, index), buffer[:self._filled])
+        self._shards.append(self._filled)
+        self._filled = 0
+    
+    def close(self) -> None:
+        """Guarda el último fragmento y escribe el manifiesto."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._buffers = {}
+        
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "fields": {name: {"shape": list(shape), "dtype": dtype.str}
+                       for name, (shape, dtype) in self.fields.items()},
+            "shards": self._shards,
+            "num_samples": sum(self._shards),
+            "metadata": self.metadata,
+        }
+        path = os.path.join(self.directory, MANIFEST_NAME)
+        with open(path + ".tmp", "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(path + ".tmp", path)
+    
+    def __enter__(self) -> 'ShardWriter':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ShardReader:
+    """
+    Lector de los fragmentos escritos por ShardWriter.
+    
+    Recorre los fragmentos en orden cargando uno cada vez, de modo que la
+    memoria usada no depende del tamaño total del conjunto de datos.
+    """
+    
+    def __init__(self, directory: str):
+        """
+        Abre un directorio de fragmentos.
+        
+        Args:
+            directory: Directorio con manifest.json
+        
+        Raises:
+            FileNotFoundError: Si no existe el manifiesto
+            ValueError: Si la versión del manifiesto no está soportada
+        """
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Versión de manifiesto no soportada: {manifest.get('version')}")
+        
+        self.fields: Dict[str, FieldSpec] = {name: (tuple(spec["shape"]), np.dtype(spec["dtype"]))
+                                             for name, spec in manifest["fields"].items()}
+        self.shards: List[int] = manifest["shards"]
+        self.metadata: Dict[str, Any] = manifest.get("metadata", {})
+    
+    def __len__(self) -> int:
+        return sum(self.shards)
+    
+    def load_shard(self, index: int, fields: Optional[Sequence[str]] = None,
+                   mmap_mode: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """
+        Carga un fragmento.
+        
+        Args:
+            index: Índice del fragmento
+            fields: Campos a cargar (None para todos)
+            mmap_mode: Modo de np.load ('r' para memory-mapping) o None
+        
+        Returns:
+            Diccionario {campo: array con las muestras del fragmento}
+        """
+        names = self.fields if fields is None else fields
+        return {name: np.load(_shard_path(self.directory, name, index), mmap_mode=mmap_mode)
+                for name in names}
+    
+    def __iter__(self) -> Iterator[Dict[str, np.ndarray]]:
+        """Itera los fragmentos en orden como diccionarios {campo: array}."""
+        for index in range(len(self.shards)):
+            yield self.load_shard(index)
+    
+    def read_all(self, fields: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Carga todo el conjunto de datos en memoria.
+        
+        Args:
+            fields: Campos a cargar (None para todos)
+        
+        Returns:
+            Diccionario {campo: array con todas las muestras}
+        """
+        names = list(self.fields if fields is None else fields)
+        parts: Dict[str, List[np.ndarray]] = {name: [] for name in names}
+        for index in range(len(self.shards)):
+            for name, array in self.load_shard(index, names).items():
+                parts[name].append(array)
+        return {name: (np.concatenate(arrays) if arrays
+                       else np.empty((0,) + self.fields[name][0], dtype=self.fields[name][1]))
+                for name, arrays in parts.items()}
+
+
+class ShardDataset:
+    """
+    Conjunto de datos de entrenamiento sobre fragmentos abiertos con memory-mapping.
+    
+    Los fragmentos no se cargan en memoria: cada mini-lote se obtiene
+    indexando los arrays mapeados, así que el tamaño del conjunto no está
+    limitado por la RAM. Un hilo de fondo prepara los lotes por adelantado
+    (prefetch lotes en cola) mientras el modelo entrena con los anteriores.
+    """
+    
+    def __init__(self, source: Union[str, ShardReader], inputs: str = "state", target: str = "action",
+                 batch_size: int = 32, shuffle: bool = True, prefetch: int = 4,
+                 seed: Optional[int] = None, indices: Optional[np.ndarray] = None):
+        """
+        Abre el conjunto de datos.
+        
+        Args:
+            source: Directorio de fragmentos o ShardReader
+            inputs: Campo con las entradas del modelo (se convierten a float32)
+            target: Campo con las etiquetas
+            batch_size: Muestras por mini-lote
+            shuffle: Si True, el orden de las muestras cambia en cada época
+            prefetch: Número máximo de lotes preparados por adelantado
+            seed: Semilla del barajado
+            indices: Subconjunto de muestras a usar (None para todas)
+        """
+        self.reader = source if isinstance(source, ShardReader) else ShardReader(source)
+        self.inputs = inputs
+        self.target = target
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.prefetch = prefetch
+        self.rng = np.random.default_rng(seed)
+        
+        self._arrays = [self.reader.load_shard(index, (inputs, target), mmap_mode="r")
+                        for index in range(len(self.reader.shards))]
+        self._offsets = np.concatenate(([0], np.cumsum(self.reader.shards))).astype(np.int64)
+        self.indices = (np.arange(self._offsets[-1]) if indices is None
+                        else np.asarray(indices, dtype=np.int64))
+    
+    @property
+    def input_shape(self) -> Tuple[int, ...]:
+        """Forma de una muestra de entrada."""
+        return self.reader.fields[self.inputs][0]
+    
+    @property
+    def num_samples(self) -> int:
+        """Número de muestras del conjunto."""
+        return len(self.indices)
+    
+    def __len__(self) -> int:
+        """Número de mini-lotes por época."""
+        return -(-self.num_samples // self.batch_size)
+    
+    def split(self, validation_split: float) -> Tuple['ShardDataset', 'ShardDataset']:
+        """
+        Separa las últimas muestras como conjunto de validación (como Keras).
+        
+        Args:
+            validation_split: Fracción de muestras para validación
+        
+        Returns:
+            Tupla (entrenamiento, validación); la validación no se baraja
+        """
+        cut = int(self.num_samples * (1 - validation_split))
+        options = dict(inputs=self.inputs, target=self.target, batch_size=self.batch_size,
+                       prefetch=self.prefetch)
+        train = ShardDataset(self.reader, shuffle=self.shuffle, indices=self.indices[:cut], **options)
+        train.rng = self.rng
+        validation = ShardDataset(self.reader, shuffle=False, indices=self.indices[cut:], **options)
+        return train, validation
+    
+    def _gather(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Lee de los fragmentos mapeados las muestras indicadas.
+        
+        Args:
+            indices: Índices globales de las muestras, ordenados
+        
+        Returns:
+            Tupla (entradas float32, etiquetas)
+        """
+        shards = np.searchsorted(self._offsets, indices, side="right") - 1
+        x = np.empty((len(indices),) + self.input_shape, dtype=np.float32)
+        y = np.empty(len(indices), dtype=self.reader.fields[self.target][1])
+        
+        # Las muestras de cada fragmento se leen juntas y en orden
+        bounds = np.flatnonzero(np.diff(shards)) + 1
+        for start, end in zip(np.concatenate(([0], bounds)), np.concatenate((bounds, [len(indices)]))):
+            shard = shards[start]
+            local = indices[start:end] - self._offsets[shard]
+            arrays = self._arrays[shard]
+            x[start:end] = arrays[self.inputs][local]
+            y[start:end] = arrays[self.target][local]
+        return x, y
+    
+    def _epoch_batches(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Genera los mini-lotes de una época en el hilo actual."""
+        order = self.rng.permutation(self.indices) if self.shuffle else self.indices
+        for start in range(0, len(order), self.batch_size):
+            yield self._gather(np.sort(order[start:start + self.batch_size]))
+    
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Itera los mini-lotes de una época preparados por un hilo de fondo.
+        
+        Yields:
+            Tuplas (entradas float32 de forma (lote, ...), etiquetas)
+        """
+        batches: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, self.prefetch))
+        stop = threading.Event()
+        done = object()
+        
+        def offer(item: Any) -> bool:
+            # Espera hueco en la cola salvo que el consumidor haya terminado
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce() -> None:
+            try:
+                for batch in self._epoch_batches():
+                    if not offer(batch):
+                        return
+                offer(done)
+            except Exception as e:
+                offer(e)
+        
+        thread = threading.Thread(target=produce, name="ShardDatasetPrefetch", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Si el consumidor abandona la época, el hilo se detiene
+            stop.set()
+            thread.join()
+    
+    def repeat(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Itera los mini-lotes indefinidamente, barajando en cada época.
+        
+        Pensado para model.fit(dataset.repeat(), steps_per_epoch=len(dataset)).
+        
+        Yields:
+            Tuplas (entradas, etiquetas)
+        """
+        if self.num_samples == 0:
+            return
+        while True:
+            yield from self
@@ -0,0 +1,191 @@
+"""
+Inferencia por lotes compartida entre partidas concurrentes.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.profiling import PhaseStats
+
+
+class InferenceBroker:
+    """
+    Agrupa las peticiones de inferencia de muchas partidas en un solo forward.
+    
+    Las partidas (hilos) envían su estado con submit() o predict() y un hilo
+    de fondo acumula peticiones hasta llenar max_batch_size o hasta que la
+    más antigua lleva max_wait segundos esperando. Entonces ejecuta una sola
+    llamada a model.predict con todo el lote y devuelve a cada partida su fila.
+    
+    predict() tiene la misma firma que model.predict de Keras, así que el
+    broker puede pasarse como modelo a get_ai_move sin cambiar su código.
+    
+    Si un lote falla (en el modelo o al apilar estados de formas distintas),
+    la excepción se entrega a todas sus peticiones y el hilo sigue atendiendo
+    las siguientes. Las latencias se guardan como una muestra acotada
+    (PhaseStats), así que la memoria no crece con la vida del broker.
+    """
+    
+    def __init__(self, model: Any, max_batch_size: int = 64, max_wait: float = 0.002,
+                 max_samples: int = 10_000):
+        """
+        Inicializa el broker y arranca el hilo de inferencia.
+        
+        Args:
+            model: Objeto con método predict(batch, verbose=0)
+            max_batch_size: Número máximo de estados por forward
+            max_wait: Tiempo máximo (segundos) que espera un lote incompleto
+            max_samples: Latencias guardadas como máximo para los percentiles
+        """
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        
+        self._requests: "queue.Queue[Optional[Tuple[np.ndarray, Future, float]]]" = queue.Queue()
+        self._latencies = PhaseStats(max_samples)
+        self._batches = 0
+        self._batched_requests = 0
+        self._started = time.perf_counter()
+        self._closed = False
+        # Protege _closed frente a close(): ninguna petición entra tras el centinela
+        self._lock = threading.Lock()
+        
+        self._thread = threading.Thread(target=self._run, name="InferenceBroker", daemon=True)
+        self._thread.start()
+    
+    def submit(self, state: np.ndarray) -> Future:
+        """
+        Encola un estado para la próxima inferencia por lotes.
+        
+        Args:
+            state: Estado de una partida (una fila de entrada del modelo)
+        
+        Returns:
+            Future que se resuelve con la salida del modelo para ese estado
+        """
+        future: Future = Future()
+        request = (np.asarray(state).reshape(-1), future, time.perf_counter())
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("El broker de inferencia está cerrado")
+            self._requests.put(request)
+        return future
+    
+    def predict(self, state: np.ndarray, verbose: int = 0) -> np.ndarray:
+        """
+        Inferencia bloqueante compatible con model.predict.
+        
+        Args:
+            state: Array (n, entradas) con uno o varios estados
+            verbose: Ignorado; se acepta por compatibilidad con Keras
+        
+        Returns:
+            Array (n, salidas) con la predicción de cada estado
+        """
+        futures = [self.submit(row) for row in np.atleast_2d(state)]
+        return np.stack([future.result() for future in futures])
+    
+    def _run(self) -> None:
+        """Bucle del hilo de inferencia: agrupa peticiones y ejecuta el modelo."""
+        while True:
+            request = self._requests.get()
+            if request is None:
+                break
+            
+            batch = [request]
+            deadline = request[2] + self.max_wait
+            stop = False
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.perf_counter()
+                try:
+                    request = self._requests.get(timeout=timeout) if timeout > 0 else self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                batch.append(request)
+            
+            try:
+                self._process(batch)
+            except Exception as e:
+                # Un lote defectuoso no debe detener el hilo ni dejar futures sin resolver
+                self._fail(batch, e)
+            if stop:
+                break
+    
+    def _process(self, batch: List[Tuple[np.ndarray, Future, float]]) -> None:
+        """
+        Ejecuta un forward con el lote y reparte los resultados.
+        
+        Args:
+            batch: Lista de (estado, future, instante de envío)
+        """
+        try:
+            states = np.stack([state for state, _, _ in batch])
+            outputs = np.asarray(self.model.predict(states, verbose=0))
+        except Exception as e:
+            self._fail(batch, e)
+            return
+        
+        now = time.perf_counter()
+        for (_, future, submitted), output in zip(batch, outputs):
+            future.set_result(output)
+            self._latencies.add(now - submitted)
+        self._batches += 1
+        self._batched_requests += len(batch)
+    
+    @staticmethod
+    def _fail(batch: List[Tuple[np.ndarray, Future, float]], error: Exception) -> None:
+        """
+        Entrega una excepción a las peticiones del lote que siguen sin resolver.
+        
+        Args:
+            batch: Lista de (estado, future, instante de envío)
+            error: Excepción a propagar
+        """
+        for _, future, _ in batch:
+            if not future.done():
+                future.set_exception(error)
+    
+    def close(self) -> None:
+        """Procesa las peticiones pendientes y detiene el hilo de inferencia."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._requests.put(None)
+        self._thread.join()
+    
+    def __enter__(self) -> 'InferenceBroker':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Obtiene estadísticas de rendimiento desde la creación del broker.
+        
+        Returns:
+            Diccionario con peticiones, lotes, tamaño medio de lote,
+            throughput (peticiones/s) y latencias p50/p99 en milisegundos
+            (estimadas sobre la muestra acotada)
+        """
+        elapsed = time.perf_counter() - self._started
+        samples = self._latencies.samples
+        latencies = np.array(samples) * 1000 if samples else np.zeros(1)
+        requests = self._latencies.count
+        return {
+            "requests": requests,
+            "batches": self._batches,
+            "mean_batch_size": self._batched_requests / self._batches if self._batches else 0.0,
+            "throughput": requests / elapsed if elapsed > 0 else 0.0,
+            "latency_p50_ms": float(np.percentile(latencies, 50)),
+            "latency_p99_ms": float(np.percentile(latencies, 99)),
+        }
@@ -0,0 +1,128 @@
+"""
+Ejecución de los modelos .h5 del proyecto con NumPy, sin TensorFlow.
+"""
+
+import json
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+
+def _relu(x: np.ndarray) -> np.ndarray:
+    return np.maximum(x, 0, out=x)
+
+
+def _softmax(x: np.ndarray) -> np.ndarray:
+    x = x - x.max(axis=-1, keepdims=True)
+    np.exp(x, out=x)
+    x /= x.sum(axis=-1, keepdims=True)
+    return x
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+ACTIVATIONS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "linear": lambda x: x,
+    "relu": _relu,
+    "softmax": _softmax,
+    "sigmoid": _sigmoid,
+    "tanh": np.tanh,
+}
+
+
+class NumpyModel:
+    """
+    Modelo secuencial de capas Dense ejecutado con multiplicaciones de NumPy.
+    
+    Lee una sola vez la arquitectura y los pesos de un archivo .h5 guardado
+    por Keras (como minesweeper_ai_model.h5) y reproduce el forward en
+    float32. Expone predict() con la misma firma que Keras, así que puede
+    sustituir al modelo en get_ai_move y en InferenceBroker.
+    """
+    
+    def __init__(self, layers: List[Tuple[np.ndarray, np.ndarray, str]]):
+        """
+        Inicializa el modelo a partir de sus capas.
+        
+        Args:
+            layers: Lista de (kernel, bias, activación) de cada capa Dense
+        """
+        for _, _, activation in layers:
+            if activation not in ACTIVATIONS:
+                raise ValueError(f"Activación no soportada: {activation}")
+        self.layers = [(kernel.astype(np.float32), bias.astype(np.float32), activation)
+                       for kernel, bias, activation in layers]
+    
+    @classmethod
+    def load(cls, filepath: str) -> 'NumpyModel':
+        """
+        Carga un modelo secuencial de capas Dense desde un archivo .h5 de Keras.
+        
+        Solo necesita h5py; no importa TensorFlow.
+        
+        Args:
+            filepath: Ruta del archivo .h5
+        
+        Returns:
+            Instancia de NumpyModel
+        
+        Raises:
+            ImportError: Si h5py no está instalado
+            ValueError: Si el modelo contiene capas distintas de Dense
+        """
+        try:
+            import h5py
+        except ImportError as e:
+            raise ImportError("NumpyModel.load necesita h5py (pip install h5py)") from e
+        
+        with h5py.File(filepath, "r") as f:
+            config = json.loads(f.attrs["model_config"])
+            weights = f["model_weights"]
+            
+            layers = []
+            for layer in config["config"]["layers"]:
+                class_name = layer["class_name"]
+                if class_name == "InputLayer":
+                    continue
+                if class_name != "Dense":
+                    raise ValueError(f"Capa no soportada por NumpyModel: {class_name}")
+                
+                name = layer["config"]["name"]
+                group = weights[name]
+                names = [n.decode() if isinstance(n, bytes) else n for n in group.attrs["weight_names"]]
+                kernel = np.array(group[names[0]])
+                if layer["config"].get("use_bias", True):
+                    bias = np.array(group[names[1]])
+                else:
+                    bias = np.zeros(kernel.shape[1], dtype=np.float32)
+                layers.append((kernel, bias, layer["config"].get("activation", "linear")))
+        
+        return cls(layers)
+    
+    @property
+    def input_shape(self) -> Tuple[None, int]:
+        """Forma de la entrada (None, características), como en Keras."""
+        return (None, self.layers[0][0].shape[0])
+    
+    def predict(self, x: np.ndarray, verbose: int = 0, batch_size: int = None) -> np.ndarray:
+        """
+        Ejecuta el forward sobre un lote de entradas.
+        
+        Args:
+            x: Array (n, características) o un único vector de entrada
+            verbose: Ignorado; se acepta por compatibilidad con Keras
+            batch_size: Ignorado; el lote completo se procesa de una vez
+        
+        Returns:
+            Array float32 (n, salidas) con la salida de la última capa
+        """
+        out = np.atleast_2d(np.asarray(x, dtype=np.float32))
+        for kernel, bias, activation in self.layers:
+            out = out @ kernel
+            out += bias
+            out = ACTIVATIONS[activation](out)
+        return out
+    
+    __call__ = predict
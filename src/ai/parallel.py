@@ -0,0 +1,120 @@
+"""
+Ejecución de partidas de auto-juego repartidas en un pool de procesos.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Sequence, TypeVar
+
+import numpy as np
+
+from src.ai.numpy_model import NumpyModel
+
+
+T = TypeVar("T")
+
+# Modelo cargado una sola vez en cada proceso del pool
+_worker_model: Any = None
+
+
+def game_seeds(seed: Optional[int], num_games: int) -> List[int]:
+    """
+    Genera una semilla independiente para cada partida.
+    
+    Las semillas dependen solo de la semilla base y del índice de la partida,
+    así que una partida juega igual sea cual sea el proceso que la ejecute.
+    
+    Args:
+        seed: Semilla base (None para semillas aleatorias)
+        num_games: Número de partidas
+    
+    Returns:
+        Lista con una semilla entera por partida
+    """
+    states = np.random.SeedSequence(seed).generate_state(num_games, dtype=np.uint64)
+    return [int(state) for state in states]
+
+
+def resolve_model(model: Any) -> Any:
+    """
+    Obtiene el modelo de un proceso a partir de una ruta o de un modelo serializable.
+    
+    Args:
+        model: Ruta de un archivo .h5 (se carga con NumpyModel) o modelo con predict
+    
+    Returns:
+        Modelo con método predict
+    """
+    if isinstance(model, (str, os.PathLike)):
+        return NumpyModel.load(model)
+    return model
+
+
+def _init_worker(model: Any) -> None:
+    """Inicializador del pool: carga el modelo del proceso."""
+    global _worker_model
+    _worker_model = resolve_model(model)
+
+
+def _run_game(play_game: Callable[[Any, int], T], seed: int) -> T:
+    """Juega una partida en un proceso del pool con su modelo."""
+    return play_game(_worker_model, seed)
+
+
+def iter_parallel(play_game: Callable[[Any, int], T], seeds: Sequence[int], model: Any,
+                  workers: Optional[int] = None, chunksize: Optional[int] = None) -> Iterator[T]:
+    """
+    Juega una partida por semilla repartiéndolas entre varios procesos.
+    
+    Cada proceso carga el modelo una sola vez y ejecuta play_game(modelo,
+    semilla) para las partidas que le tocan. Los resultados se entregan en
+    el orden de las semillas a medida que terminan, de modo que pueden
+    escribirse en streaming y, para las mismas semillas, no dependen del
+    número de procesos.
+    
+    Args:
+        play_game: Función de nivel de módulo (serializable con pickle) que
+            juega una partida y devuelve su resultado
+        seeds: Semilla de cada partida
+        model: Ruta de un modelo .h5 o modelo serializable con pickle
+            (por ejemplo NumpyModel); los modelos de Keras deben pasarse por ruta
+        workers: Número de procesos (None usa todos los núcleos; 1 juega en
+            el proceso actual)
+        chunksize: Partidas enviadas a la vez a cada proceso (None reparte
+            unos cuatro bloques por proceso)
+    
+    Yields:
+        Resultado de cada partida, en el orden de seeds
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    if workers <= 1:
+        local_model = resolve_model(model)
+        for seed in seeds:
+            yield play_game(local_model, seed)
+        return
+    
+    if chunksize is None:
+        chunksize = max(1, len(seeds) // (workers * 4))
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(model,)) as pool:
+        yield from pool.map(_run_game, [play_game] * len(seeds), seeds, chunksize=chunksize)
+
+
+def play_parallel(play_game: Callable[[Any, int], T], seeds: Sequence[int], model: Any,
+                  workers: Optional[int] = None, chunksize: Optional[int] = None) -> List[T]:
+    """
+    Igual que iter_parallel, pero devuelve todos los resultados en una lista.
+    
+    Args:
+        play_game: Función que juega una partida (ver iter_parallel)
+        seeds: Semilla de cada partida
+        model: Ruta de un modelo .h5 o modelo serializable con pickle
+        workers: Número de procesos (None usa todos los núcleos)
+        chunksize: Partidas enviadas a la vez a cada proceso
+    
+    Returns:
+        Lista con el resultado de cada partida, en el orden de seeds
+    """
+    return list(iter_parallel(play_game, seeds, model, workers, chunksize))
@@ -0,0 +1,272 @@
+"""
+Motor de Buscaminas que avanza N partidas a la vez.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from src.game.board import Board, count_adjacent_mines
+from src.game.minesweeper import GameAction, GameStatus
+
+
+class BatchedMinesweeper:
+    """
+    Conjunto de N partidas de Buscaminas almacenadas como arrays apilados.
+
+    Cada partida ocupa un índice de la primera dimensión de las matrices
+    (N, filas, columnas). El método step recibe una acción por partida y
+    devuelve estado, recompensa y observación de todas las partidas como
+    arrays, sin bucles de Python por partida.
+    """
+
+    # Recompensas por paso
+    REWARD_DEFEAT = -1.0
+    REWARD_VICTORY = 1.0
+    REWARD_PROGRESS = 0.1
+    REWARD_NO_PROGRESS = -0.1
+
+    _ONGOING = GameStatus.ONGOING.value
+    _VICTORY = GameStatus.VICTORY.value
+    _DEFEAT = GameStatus.DEFEAT.value
+
+    def __init__(self, num_games: int, rows: int, columns: int, num_mines: int,
+                 rng: Optional[np.random.Generator] = None):
+        """
+        Inicializa N partidas de Buscaminas con la misma configuración.
+
+        Args:
+            num_games: Número de partidas simultáneas
+            rows: Número de filas de cada tablero
+            columns: Número de columnas de cada tablero
+            num_mines: Número de minas de cada tablero
+            rng: Generador de NumPy para colocar las minas
+        """
+        self.num_games = num_games
+        self.rows = rows
+        self.columns = columns
+        self.num_mines = min(num_mines, rows * columns - 1)  # Evitar tablero lleno de minas
+        self._rng = rng if rng is not None else np.random.default_rng()
+
+        shape = (num_games, rows, columns)
+        self._mine_grid = np.zeros(shape, dtype=np.int8)  # -1 para minas, >=0 para número
+        self._visible_grid = np.zeros(shape, dtype=bool)
+        self._marked_grid = np.zeros(shape, dtype=bool)
+
+        self.status = np.full(num_games, self._ONGOING, dtype=np.int8)
+        self.moves_count = np.zeros(num_games, dtype=np.int64)
+
+        self.reset()
+
+    @classmethod
+    def from_config(cls, num_games: int, config: Dict[str, int],
+                    rng: Optional[np.random.Generator] = None) -> 'BatchedMinesweeper':
+        """
+        Crea N partidas a partir de una configuración predefinida de Minesweeper.
+
+        Args:
+            num_games: Número de partidas simultáneas
+            config: Diccionario como Minesweeper.BEGINNER o Minesweeper.EXPERT
+            rng: Generador de NumPy para colocar las minas
+
+        Returns:
+            Instancia de BatchedMinesweeper
+        """
+        return cls(num_games, config["rows"], config["columns"], config["mines"], rng=rng)
+
+    def reset(self, indices: Optional[np.ndarray] = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Reinicia las partidas indicadas con tableros nuevos.
+
+        Args:
+            indices: Índices o máscara booleana de las partidas a reiniciar (todas si es None)
+            out: Array (N, filas, columnas) donde escribir la observación
+
+        Returns:
+            Observación de todas las partidas tras el reinicio
+        """
+        if indices is None:
+            indices = np.arange(self.num_games)
+        indices = np.flatnonzero(indices) if np.asarray(indices).dtype == bool else np.asarray(indices)
+
+        if len(indices):
+            self._place_mines(indices)
+            self._visible_grid[indices] = False
+            self._marked_grid[indices] = False
+            self.status[indices] = self._ONGOING
+            self.moves_count[indices] = 0
+
+        return self.get_state_representation(out)
+
+    def _place_mines(self, indices: np.ndarray) -> None:
+        """
+        Coloca minas y calcula números en los tableros indicados.
+
+        Args:
+            indices: Índices de las partidas a regenerar
+        """
+        cells = self.rows * self.columns
+        mines = np.zeros((len(indices), cells), dtype=bool)
+
+        if self.num_mines > 0:
+            # Las num_mines claves aleatorias más pequeñas de cada fila marcan las minas
+            keys = self._rng.random((len(indices), cells))
+            positions = np.argpartition(keys, self.num_mines - 1, axis=1)[:, :self.num_mines]
+            np.put_along_axis(mines, positions, True, axis=1)
+
+        mines = mines.reshape(len(indices), self.rows, self.columns)
+        self._mine_grid[indices] = np.where(mines, -1, count_adjacent_mines(mines))
+
+    def step(self, rows: Sequence[int], cols: Sequence[int],
+             actions: Union[Sequence[int], Sequence[GameAction]],
+             out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Aplica una acción a cada partida.
+
+        Las acciones sobre partidas terminadas, coordenadas inválidas o celdas
+        que no admiten la acción se ignoran, igual que en Minesweeper.
+
+        Args:
+            rows: Fila de la acción de cada partida
+            cols: Columna de la acción de cada partida
+            actions: GameAction (o su valor entero) de cada partida
+            out: Array (N, filas, columnas) donde escribir la observación
+
+        Returns:
+            Tupla (estado, recompensa, observación) con arrays de tamaño N
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        actions = self._action_values(actions)
+
+        games = np.arange(self.num_games)
+        reward = np.zeros(self.num_games, dtype=np.float32)
+
+        # Acciones aplicables: partida en curso y coordenadas dentro del tablero
+        in_bounds = (rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.columns)
+        active = (self.status == self._ONGOING) & in_bounds
+        r = np.where(in_bounds, rows, 0)
+        c = np.where(in_bounds, cols, 0)
+        visible = self._visible_grid[games, r, c]
+        marked = self._marked_grid[games, r, c]
+
+        is_open = active & (actions == GameAction.OPEN.value) & ~visible & ~marked
+        is_mark = active & (actions == GameAction.MARK.value) & ~visible
+        reward[(self.status == self._ONGOING) & ~is_open & ~is_mark] = self.REWARD_NO_PROGRESS
+        self.moves_count += is_open | is_mark
+
+        # Marcar o desmarcar
+        mark_games = np.flatnonzero(is_mark)
+        self._marked_grid[mark_games, r[mark_games], c[mark_games]] = ~marked[mark_games]
+
+        # Abrir celdas
+        open_games = np.flatnonzero(is_open)
+        if len(open_games):
+            values = self._mine_grid[open_games, r[open_games], c[open_games]]
+
+            lost = open_games[values == -1]
+            if len(lost):
+                self.status[lost] = self._DEFEAT
+                self._visible_grid[lost] |= self._mine_grid[lost] == -1  # Mostrar todas las minas
+                reward[lost] = self.REWARD_DEFEAT
+
+            safe = open_games[values != -1]
+            if len(safe):
+                self._visible_grid[safe, r[safe], c[safe]] = True
+                zeros = safe[values[values != -1] == 0]
+                if len(zeros):
+                    self._flood_fill(zeros, r[zeros], c[zeros])
+                reward[safe] = self.REWARD_PROGRESS
+
+                # Verificar victoria en las partidas que han abierto celdas
+                safe_visible = np.count_nonzero(self._visible_grid[safe] & (self._mine_grid[safe] != -1), axis=(1, 2))
+                won = safe[safe_visible == self.rows * self.columns - self.num_mines]
+                self.status[won] = self._VICTORY
+                reward[won] = self.REWARD_VICTORY
+
+        return self.status.copy(), reward, self.get_state_representation(out)
+
+    def _flood_fill(self, games: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> None:
+        """
+        Abre las regiones conectadas a los ceros recién abiertos en varias partidas.
+
+        Se expande la frontera de ceros de todas las partidas a la vez hasta que
+        no aparecen celdas nuevas, lo que equivale al flood fill recursivo.
+
+        Args:
+            games: Índices de las partidas con un cero recién abierto
+            rows: Fila del cero de cada partida
+            cols: Columna del cero de cada partida
+        """
+        visible = self._visible_grid[games]
+        blocked = visible | self._marked_grid[games]
+        is_zero = self._mine_grid[games] == 0
+
+        frontier = np.zeros_like(visible)
+        frontier[np.arange(len(games)), rows, cols] = True
+
+        while frontier.any():
+            # Vecinos de la frontera (dilatación 3x3)
+            padded = np.pad(frontier, [(0, 0), (1, 1), (1, 1)])
+            grown = np.zeros_like(frontier)
+            for di in (0, 1, 2):
+                for dj in (0, 1, 2):
+                    grown |= padded[:, di:di + self.rows, dj:dj + self.columns]
+
+            new_cells = grown & ~blocked
+            blocked |= new_cells
+            visible |= new_cells
+            frontier = new_cells & is_zero
+
+        self._visible_grid[games] = visible
+
+    @staticmethod
+    def _action_values(actions: Union[Sequence[int], Sequence[GameAction]]) -> np.ndarray:
+        """
+        Convierte una secuencia de GameAction o enteros en un array de valores.
+
+        Args:
+            actions: Acciones de cada partida
+
+        Returns:
+            Array entero con el valor de cada acción
+        """
+        if isinstance(actions, np.ndarray) and actions.dtype != object:
+            return actions
+        return np.array([a.value if isinstance(a, GameAction) else a for a in actions], dtype=np.int64)
+
+    def get_state_representation(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Obtiene la representación visible de todas las partidas.
+
+        Usa las mismas constantes que Board.get_state_representation.
+
+        Args:
+            out: Array (N, filas, columnas) donde escribir el resultado
+
+        Returns:
+            Array (N, filas, columnas) con la observación de cada partida
+        """
+        if out is None:
+            out = np.empty(self._mine_grid.shape, dtype=np.int8)
+        out[...] = Board.HIDDEN
+        out[self._marked_grid] = Board.MARKED
+        np.copyto(out, self._mine_grid, where=self._visible_grid)
+        return out
+
+    def get_statuses(self) -> List[GameStatus]:
+        """
+        Obtiene el estado de cada partida como GameStatus.
+
+        Returns:
+            Lista con el GameStatus de cada partida
+        """
+        return [GameStatus(value) for value in self.status]
+
+    def get_remaining_mines(self) -> np.ndarray:
+        """
+        Obtiene el número de minas que faltan por marcar en cada partida.
+
+        Returns:
+            Array con las minas restantes de cada partida
+        """
+        return self.num_mines - np.count_nonzero(self._marked_grid, axis=(1, 2))
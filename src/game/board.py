@@ -2,8 +2,101 @@
 Módulo de representación del tablero de Buscaminas.
 """
 import numpy as np
-import random
-from typing import List, Tuple, Set, Optional
+from typing import Any, Dict, List, Sequence, Tuple, Set, Optional, Union
+
+from src.game.neighbors import NEIGHBOR_OFFSETS, NeighborTable, get_neighbor_table
+from src.utils.profiling import profiled
+
+
+# Generador compartido por los tableros que no reciben uno propio
+_DEFAULT_RNG = np.random.default_rng()
+
+# Generador de NumPy o semilla entera con la que crear uno
+RngLike = Union[np.random.Generator, int, None]
+
+
+def resolve_rng(rng: RngLike) -> np.random.Generator:
+    """
+    Obtiene el generador con el que un tablero coloca sus minas.
+    
+    Args:
+        rng: Generador de NumPy, semilla entera o None (generador compartido)
+    
+    Returns:
+        Generador de NumPy
+    """
+    if rng is None:
+        return _DEFAULT_RNG
+    return np.random.default_rng(rng)
+
+
+def choose_mine_cells(rng: np.random.Generator, num_cells: int, num_mines: int,
+                      exclude: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Elige las celdas con mina de un tablero.
+    
+    Args:
+        rng: Generador de NumPy
+        num_cells: Número de celdas del tablero
+        num_mines: Número de minas
+        exclude: Índices planos de celdas que no pueden tener mina (opcional)
+    
+    Returns:
+        Índices planos distintos de las celdas con mina
+    """
+    if exclude is None or len(exclude) == 0:
+        # Elegir índices planos distintos sin construir la lista de coordenadas
+        return rng.choice(num_cells, size=num_mines, replace=False)
+    candidates = np.delete(np.arange(num_cells), exclude)
+    return candidates[rng.choice(len(candidates), size=num_mines, replace=False)]
+
+
+# Desplazamientos (fila, columna) de las 8 celdas vecinas
+_NEIGHBOR_OFFSETS = NEIGHBOR_OFFSETS
+
+
+def _neighbor_slices(rows: int, columns: int, offsets):
+    """
+    Genera pares de slices (origen, destino) que alinean cada celda con su vecina.
+    
+    Args:
+        rows: Número de filas del tablero
+        columns: Número de columnas del tablero
+        offsets: Desplazamientos (fila, columna) de la vecina
+    
+    Yields:
+        Tuplas (origen, destino) de slices 2D del mismo tamaño
+    """
+    for di, dj in offsets:
+        src = (slice(max(0, -di), rows - max(0, di)), slice(max(0, -dj), columns - max(0, dj)))
+        dst = (slice(max(0, di), rows - max(0, -di)), slice(max(0, dj), columns - max(0, -dj)))
+        yield src, dst
+
+
+def count_adjacent_mines(mines: np.ndarray) -> np.ndarray:
+    """
+    Cuenta las minas vecinas de cada celda sumando desplazamientos del tablero.
+    
+    Acepta tableros apilados: solo las dos últimas dimensiones se consideran
+    filas y columnas, de modo que (N, filas, columnas) también es válido.
+    
+    Args:
+        mines: Array booleano con True en las celdas que contienen mina
+    
+    Returns:
+        Array entero con el número de minas adyacentes de cada celda
+    """
+    rows, columns = mines.shape[-2:]
+    pad = [(0, 0)] * (mines.ndim - 2) + [(1, 1), (1, 1)]
+    padded = np.pad(mines.astype(np.int8), pad)
+    
+    counts = np.zeros(mines.shape, dtype=np.int8)
+    for di in (0, 1, 2):
+        for dj in (0, 1, 2):
+            if di == 1 and dj == 1:
+                continue
+            counts += padded[..., di:di + rows, dj:dj + columns]
+    return counts
 
 
 class Board:
@@ -19,7 +112,17 @@ class Board:
     MINE = -2
     MARKED = -3
     
-    def __init__(self, rows: int, columns: int, num_mines: int):
+    # La tabla de vecinos ocupa unos 32 bytes por celda: en tableros mayores
+    # los vecinos se calculan al vuelo
+    MAX_TABLE_CELLS = 1 << 16
+    
+    # Matrices que cambian durante la partida; el resto del tablero (minas,
+    # números, regiones de ceros y vecinos) no cambia una vez colocadas las minas
+    _MUTABLE_ARRAYS = ("_visible_grid", "_marked_grid", "_state_grid")
+    
+    @profiled("board_generation")
+    def __init__(self, rows: int, columns: int, num_mines: int, rng: RngLike = None,
+                 lazy: bool = False):
         """
         Inicializa un nuevo tablero de Buscaminas.
         
@@ -27,6 +130,9 @@ class Board:
             rows: Número de filas del tablero
             columns: Número de columnas del tablero
             num_mines: Número de minas a colocar
+            rng: Generador de NumPy o semilla para colocar las minas (None usa
+                el generador compartido del módulo)
+            lazy: Si es True, las minas no se colocan hasta llamar a place_mines
         """
         self.rows = rows
         self.columns = columns
@@ -37,43 +143,172 @@ class Board:
         self._visible_grid = np.zeros((rows, columns), dtype=bool)  # True si es visible
         self._marked_grid = np.zeros((rows, columns), dtype=bool)  # True si está marcada
         
+        # Observación del jugador, actualizada solo en las celdas que cambian
+        self._state_grid = np.full((rows, columns), self.HIDDEN, dtype=int)
+        self._state_view = self._state_grid.view()
+        self._state_view.flags.writeable = False
+        
+        # Contadores incrementales para comprobar victoria y minas restantes en O(1)
+        self._safe_cells = rows * columns - self.num_mines
+        self._revealed_safe_count = 0
+        self._marked_count = 0
+        
+        # Regiones de ceros para el flood fill (se calculan al abrir el primer 0)
+        self._region_labels = None
+        
+        # Tabla de vecinos compartida con los demás tableros de la misma forma
+        # (se obtiene en el primer uso, ver _neighbor_table)
+        self.neighbors: Optional[NeighborTable] = None
+        
         # Colocar minas y calcular números
-        self._place_mines()
-        self._calculate_adjacent_mines()
+        self._rng = resolve_rng(rng)
+        self.mines_placed = False
+        if not lazy:
+            self.place_mines()
+    
+    @profiled("mine_placement")
+    def place_mines(self, exclude: Optional[np.ndarray] = None) -> None:
+        """
+        Coloca las minas aleatoriamente y calcula los números del tablero.
         
-    def _place_mines(self) -> None:
-        """Coloca las minas aleatoriamente en el tablero."""
-        # Crear lista de todas las posiciones posibles
-        all_positions = [(i, j) for i in range(self.rows) for j in range(self.columns)]
+        Los tableros creados con lazy=True lo llaman al abrir la primera
+        celda, excluyéndola para que la primera jugada nunca sea una mina.
         
-        # Seleccionar posiciones para las minas
-        mine_positions = random.sample(all_positions, self.num_mines)
+        Args:
+            exclude: Índices planos de celdas que no pueden tener mina (opcional)
+        
+        Raises:
+            RuntimeError: Si las minas ya estaban colocadas
+            ValueError: Si las celdas excluidas no dejan sitio para todas las minas
+        """
+        if self.mines_placed:
+            raise RuntimeError("Las minas del tablero ya están colocadas")
+        num_cells = self.rows * self.columns
+        if exclude is not None and num_cells - len(np.unique(exclude)) < self.num_mines:
+            raise ValueError(f"No caben {self.num_mines} minas fuera de {len(exclude)} celdas excluidas")
         
-        # Colocar las minas
-        for row, col in mine_positions:
-            self._mine_grid[row, col] = -1  # -1 representa una mina
+        mine_positions = choose_mine_cells(self._rng, num_cells, self.num_mines, exclude)
+        # Matriz nueva: los clones creados antes de colocar las minas comparten la anterior
+        self._mine_grid = np.zeros((self.rows, self.columns), dtype=int)
+        self._mine_grid.flat[mine_positions] = -1  # -1 representa una mina
+        self._calculate_adjacent_mines()
+        self.mines_placed = True
     
     def _calculate_adjacent_mines(self) -> None:
         """Calcula el número de minas adyacentes para cada celda."""
-        # Iterar sobre cada celda
-        for i in range(self.rows):
-            for j in range(self.columns):
-                # Saltar si la celda contiene una mina
-                if self._mine_grid[i, j] == -1:
-                    continue
-                
-                # Contar minas adyacentes
-                count = 0
-                for di in [-1, 0, 1]:
-                    for dj in [-1, 0, 1]:
-                        if di == 0 and dj == 0:
-                            continue
-                        ni, nj = i + di, j + dj
-                        if 0 <= ni < self.rows and 0 <= nj < self.columns:
-                            if self._mine_grid[ni, nj] == -1:
-                                count += 1
-                
-                self._mine_grid[i, j] = count
+        mines = self._mine_grid == -1
+        self._mine_grid = np.where(mines, -1, count_adjacent_mines(mines)).astype(int)
+    
+    @profiled("zero_regions")
+    def _label_zero_regions(self) -> None:
+        """
+        Etiqueta las regiones conectadas de ceros y las celdas que abren.
+        
+        Al abrir un cero se descubre toda su región de ceros más el borde de
+        números que la rodea. Ambas cosas se guardan en formato CSR: las celdas
+        de la región k son _region_cells[_region_ptr[k]:_region_ptr[k + 1]].
+        
+        Se ejecuta una sola vez por tablero, la primera vez que se abre un 0,
+        para no encarecer la generación de tableros que nunca lo necesitan.
+        """
+        num_cells = self.rows * self.columns
+        zero = self._mine_grid == 0
+        flat = np.arange(num_cells).reshape(self.rows, self.columns)
+        
+        # Pares de ceros adyacentes (basta con 4 direcciones para cubrir las 8)
+        first, second = [], []
+        for src, dst in _neighbor_slices(self.rows, self.columns, ((0, 1), (1, 0), (1, 1), (1, -1))):
+            both = zero[src] & zero[dst]
+            first.append(flat[src][both])
+            second.append(flat[dst][both])
+        first = np.concatenate(first)
+        second = np.concatenate(second)
+        
+        # Union-find vectorizado: enganchar raíces a la menor y comprimir caminos
+        parent = np.arange(num_cells)
+        while True:
+            root_a, root_b = parent[first], parent[second]
+            differ = root_a != root_b
+            if not differ.any():
+                break
+            np.minimum.at(parent, np.maximum(root_a[differ], root_b[differ]),
+                          np.minimum(root_a[differ], root_b[differ]))
+            while True:
+                grandparent = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
+        
+        # Etiquetas consecutivas para las regiones
+        zero_cells = flat[zero]
+        roots = parent[zero_cells]
+        is_root = np.zeros(num_cells, dtype=bool)
+        is_root[roots] = True
+        labels = (np.cumsum(is_root) - 1)[roots]
+        num_regions = int(np.count_nonzero(is_root))
+        self._region_labels = np.full((self.rows, self.columns), -1, dtype=np.int64)
+        self._region_labels[zero] = labels
+        
+        # Borde: regiones distintas entre los 8 vecinos de cada celda que no es 0
+        padded = np.pad(self._region_labels, 1, constant_values=-1)
+        neighbor_labels = np.stack([padded[1 + di:1 + di + self.rows, 1 + dj:1 + dj + self.columns][~zero]
+                                    for di, dj in _NEIGHBOR_OFFSETS])
+        neighbor_labels.sort(axis=0)
+        distinct = neighbor_labels >= 0
+        distinct[1:] &= neighbor_labels[1:] != neighbor_labels[:-1]
+        border_cells = np.broadcast_to(flat[~zero], neighbor_labels.shape)[distinct]
+        
+        # Celdas de cada región (sus ceros y después su borde) agrupadas por etiqueta
+        region_of = np.concatenate([labels, neighbor_labels[distinct]])
+        order = np.argsort(region_of, kind='stable')
+        self._region_cells = np.concatenate([zero_cells, border_cells])[order]
+        self._region_ptr = np.zeros(num_regions + 1, dtype=np.int64)
+        np.cumsum(np.bincount(region_of, minlength=num_regions), out=self._region_ptr[1:])
+    
+    def get_zero_region(self, row: int, col: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Obtiene las celdas que se descubren al abrir un cero.
+        
+        Args:
+            row: Fila de una celda con valor 0
+            col: Columna de una celda con valor 0
+        
+        Returns:
+            Tupla (ceros, celdas) con los índices planos de los ceros de la región
+            y de todas las celdas que abre (los ceros más su borde de números)
+        """
+        if self._region_labels is None:
+            self._label_zero_regions()
+        
+        label = self._region_labels[row, col]
+        cells = self._region_cells[self._region_ptr[label]:self._region_ptr[label + 1]]
+        num_zeros = np.count_nonzero(self._region_labels.flat[cells] == label)
+        return cells[:num_zeros], cells
+    
+    def reveal_zero_region(self, row: int, col: int) -> Optional[np.ndarray]:
+        """
+        Descubre de una vez la región precalculada de un 0 recién abierto.
+        
+        Solo es equivalente al flood fill celda a celda si ninguna celda de la
+        región está marcada y ningún otro cero de la región es ya visible; en
+        otro caso no modifica nada y devuelve None.
+        
+        Args:
+            row: Fila del 0 (ya visible)
+            col: Columna del 0
+        
+        Returns:
+            Índices planos de las celdas descubiertas, o None si la región
+            debe recorrerse celda a celda
+        """
+        zeros, cells = self.get_zero_region(row, col)
+        visible = self._visible_grid.ravel()
+        if self._marked_grid.ravel()[cells].any() or np.count_nonzero(visible[zeros]) != 1:
+            return None
+        
+        opened = cells[~visible[cells]]
+        self.set_cells_visible(opened)
+        return opened
     
     def get_cell_value(self, row: int, col: int) -> int:
         """
@@ -82,12 +317,24 @@ class Board:
         Args:
             row: Fila de la celda
             col: Columna de la celda
-            
+        
         Returns:
             Valor de la celda (-1 para mina, >=0 para número)
         """
         return self._mine_grid[row, col]
     
+    def get_cell_values(self, cells: np.ndarray) -> np.ndarray:
+        """
+        Obtiene el valor de varias celdas del tablero.
+        
+        Args:
+            cells: Índices planos (fila * columnas + columna) de las celdas
+        
+        Returns:
+            Array con el valor de cada celda (-1 para mina, >=0 para número)
+        """
+        return self._mine_grid.flat[cells]
+    
     def is_mine(self, row: int, col: int) -> bool:
         """
         Verifica si una celda contiene una mina.
@@ -95,12 +342,21 @@ class Board:
         Args:
             row: Fila de la celda
             col: Columna de la celda
-            
+        
         Returns:
             True si la celda contiene una mina, False en caso contrario
         """
         return self._mine_grid[row, col] == -1
     
+    def get_mine_cells(self) -> np.ndarray:
+        """
+        Obtiene las posiciones de todas las minas.
+        
+        Returns:
+            Índices planos (fila * columnas + columna) de las celdas con mina
+        """
+        return np.flatnonzero(self._mine_grid == -1)
+    
     def is_visible(self, row: int, col: int) -> bool:
         """
         Verifica si una celda es visible para el jugador.
@@ -108,7 +364,7 @@ class Board:
         Args:
             row: Fila de la celda
             col: Columna de la celda
-            
+        
         Returns:
             True si la celda es visible, False en caso contrario
         """
@@ -121,7 +377,7 @@ class Board:
         Args:
             row: Fila de la celda
             col: Columna de la celda
-            
+        
         Returns:
             True si la celda está marcada, False en caso contrario
         """
@@ -135,7 +391,23 @@ class Board:
             row: Fila de la celda
             col: Columna de la celda
         """
-        self._visible_grid[row, col] = True
+        if not self._visible_grid[row, col]:
+            self._visible_grid[row, col] = True
+            self._state_grid[row, col] = self._mine_grid[row, col]
+            if self._mine_grid[row, col] != -1:
+                self._revealed_safe_count += 1
+    
+    def set_cells_visible(self, cells: np.ndarray) -> None:
+        """
+        Establece varias celdas como visibles en una sola operación.
+        
+        Args:
+            cells: Índices planos (fila * columnas + columna) de las celdas
+        """
+        cells = cells[~self._visible_grid.flat[cells]]
+        self._visible_grid.flat[cells] = True
+        self._state_grid.flat[cells] = self._mine_grid.flat[cells]
+        self._revealed_safe_count += int(np.count_nonzero(self._mine_grid.flat[cells] != -1))
     
     def toggle_mark(self, row: int, col: int) -> None:
         """
@@ -145,19 +417,95 @@ class Board:
             row: Fila de la celda
             col: Columna de la celda
         """
-        self._marked_grid[row, col] = not self._marked_grid[row, col]
+        marked = not self._marked_grid[row, col]
+        self._marked_grid[row, col] = marked
+        self._marked_count += 1 if marked else -1
+        if not self._visible_grid[row, col]:
+            self._state_grid[row, col] = self.MARKED if marked else self.HIDDEN
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Guarda el estado mutable del tablero (celdas visibles, marcas y contadores).
+        
+        La colocación de las minas no forma parte de la copia: restaurar una
+        copia tomada antes de colocarlas no las retira.
+        
+        Returns:
+            Diccionario con copias de las matrices mutables y los contadores
+        """
+        state = {name: getattr(self, name).copy() for name in self._MUTABLE_ARRAYS}
+        state["revealed_safe_count"] = self._revealed_safe_count
+        state["marked_count"] = self._marked_count
+        return state
+    
+    def restore(self, state: Dict[str, Any]) -> None:
+        """
+        Vuelve al estado guardado con snapshot.
+        
+        Copia los datos en las matrices existentes, así que las vistas
+        obtenidas antes (como la de get_state_representation) siguen siendo válidas.
+        
+        Args:
+            state: Estado devuelto por snapshot en este tablero o en un clon suyo
+        """
+        for name in self._MUTABLE_ARRAYS:
+            np.copyto(getattr(self, name), state[name])
+        self._revealed_safe_count = state["revealed_safe_count"]
+        self._marked_count = state["marked_count"]
+    
+    def clone(self) -> 'Board':
+        """
+        Crea una copia independiente del tablero para búsquedas con anticipación.
+        
+        Solo se copian las matrices mutables; las minas, los números, las
+        regiones de ceros y la tabla de vecinos se comparten con el original.
+        
+        Returns:
+            Tablero de la misma clase con el mismo estado
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        for name in self._MUTABLE_ARRAYS:
+            setattr(clone, name, getattr(self, name).copy())
+        clone._refresh_views()
+        return clone
+    
+    def _refresh_views(self) -> None:
+        """Vuelve a crear la vista de solo lectura de la observación tras copiarla."""
+        self._state_view = self._state_grid.view()
+        self._state_view.flags.writeable = False
+    
+    def _neighbor_table(self) -> Optional[NeighborTable]:
+        """
+        Obtiene la tabla de vecinos, construyéndola en el primer uso.
+        
+        Returns:
+            Tabla de vecinos compartida, o None si el tablero tiene más de
+            MAX_TABLE_CELLS celdas
+        """
+        if self.neighbors is None and self.rows * self.columns <= self.MAX_TABLE_CELLS:
+            self.neighbors = get_neighbor_table(self.rows, self.columns)
+        return self.neighbors
     
-    def get_adjacent_cells(self, row: int, col: int) -> List[Tuple[int, int]]:
+    def get_adjacent_cells(self, row: int, col: int) -> Sequence[Tuple[int, int]]:
         """
         Obtiene las coordenadas de las celdas adyacentes a una posición.
         
         Args:
             row: Fila de la celda
             col: Columna de la celda
-            
+        
         Returns:
-            Lista de tuplas (fila, columna) de las celdas adyacentes
+            Secuencia de tuplas (fila, columna) de las celdas adyacentes (la
+            de la tabla de vecinos, compartida: no debe modificarse)
         """
+        neighbors = self.neighbors
+        if neighbors is None:
+            neighbors = self._neighbor_table()
+        if neighbors is not None:
+            return neighbors.adjacent(row, col)
+        
+        # Tableros sin tabla de vecinos (más de MAX_TABLE_CELLS celdas)
         adjacent = []
         for di in [-1, 0, 1]:
             for dj in [-1, 0, 1]:
@@ -168,25 +516,23 @@ class Board:
                     adjacent.append((ni, nj))
         return adjacent
     
-    def get_state_representation(self) -> np.ndarray:
+    def get_state_representation(self, copy: bool = False) -> np.ndarray:
         """
         Obtiene una representación del estado actual del tablero para la IA.
         
+        Por defecto devuelve una vista de solo lectura, sin copia, que sigue
+        reflejando el tablero tras los siguientes movimientos. Quien necesite
+        conservar el estado de un instante concreto debe pedir una copia.
+        
+        Args:
+            copy: Si es True, devuelve una copia independiente y modificable
+        
         Returns:
             Array de NumPy con la representación del estado
         """
-        state = np.zeros((self.rows, self.columns), dtype=int)
-        
-        for i in range(self.rows):
-            for j in range(self.columns):
-                if self._visible_grid[i, j]:
-                    state[i, j] = self._mine_grid[i, j]
-                elif self._marked_grid[i, j]:
-                    state[i, j] = self.MARKED
-                else:
-                    state[i, j] = self.HIDDEN
-        
-        return state
+        if copy:
+            return self._state_grid.copy()
+        return self._state_view
     
     def get_remaining_mines(self) -> int:
         """
@@ -195,7 +541,16 @@ class Board:
         Returns:
             Número de minas restantes (puede ser negativo si se han marcado demasiadas celdas)
         """
-        return self.num_mines - np.sum(self._marked_grid)
+        return self.num_mines - self._marked_count
+    
+    def get_hidden_count(self) -> int:
+        """
+        Obtiene el número de celdas ocultas sin marcar mientras el juego sigue en curso.
+        
+        Returns:
+            Número de celdas que el jugador todavía puede abrir o marcar
+        """
+        return self.rows * self.columns - self._revealed_safe_count - self._marked_count
     
     def are_all_safe_cells_visible(self) -> bool:
         """
@@ -204,8 +559,40 @@ class Board:
         Returns:
             True si todas las celdas seguras son visibles, False en caso contrario
         """
-        for i in range(self.rows):
-            for j in range(self.columns):
-                if self._mine_grid[i, j] != -1 and not self._visible_grid[i, j]:
-                    return False
-        return True 
\ No newline at end of file
+        return self._revealed_safe_count == self._safe_cells
+    
+    def get_memory_usage(self) -> int:
+        """
+        Obtiene la memoria ocupada por los arrays del tablero.
+        
+        Returns:
+            Número de bytes de las matrices del tablero y de las regiones de ceros
+        """
+        arrays = [self._mine_grid, self._visible_grid, self._marked_grid, self._state_grid]
+        if self._region_labels is not None:
+            arrays += [self._region_labels, self._region_cells, self._region_ptr]
+        return sum(array.nbytes for array in arrays)
+    
+    def check_consistency(self) -> None:
+        """
+        Comprueba que los contadores y la observación coinciden con las matrices.
+        
+        Recorre el tablero completo, así que está pensado para modo depuración.
+        
+        Raises:
+            AssertionError: Si algún contador o celda no coincide con su valor recalculado
+        """
+        revealed_safe = int(np.count_nonzero(self._visible_grid & (self._mine_grid != -1)))
+        if revealed_safe != self._revealed_safe_count:
+            raise AssertionError(
+                f"Celdas seguras visibles: contador {self._revealed_safe_count}, tablero {revealed_safe}")
+        
+        marked = int(np.count_nonzero(self._marked_grid))
+        if marked != self._marked_count:
+            raise AssertionError(f"Celdas marcadas: contador {self._marked_count}, tablero {marked}")
+        
+        expected = np.where(self._visible_grid, self._mine_grid,
+                            np.where(self._marked_grid, self.MARKED, self.HIDDEN))
+        mismatched = np.argwhere(expected != self._state_grid)
+        if len(mismatched):
+            raise AssertionError(f"Observación desactualizada en las celdas {mismatched[:5].tolist()}")
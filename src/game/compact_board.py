@@ -0,0 +1,389 @@
+"""
+Módulo de representación compacta del tablero de Buscaminas.
+"""
+import numpy as np
+from typing import Optional, Tuple
+
+from src.game.board import Board, RngLike, choose_mine_cells, count_adjacent_mines, resolve_rng, _NEIGHBOR_OFFSETS
+from src.utils.profiling import profiled
+
+
+class CompactBoard(Board):
+    """
+    Tablero de Buscaminas con almacenamiento compacto.
+    
+    Guarda el número de minas adyacentes en una matriz uint8 y las minas,
+    celdas visibles y celdas marcadas en planos de bits empaquetados (un bit
+    por celda), unos 1,4 bytes por celda frente a los 18 de Board. Expone la
+    misma API que Board, pero la observación se construye bajo demanda en
+    lugar de mantenerse en memoria.
+    
+    Como en Board, la tabla de vecinos compartida solo se usa hasta
+    MAX_TABLE_CELLS celdas; en tableros mayores los vecinos se calculan al
+    vuelo.
+    """
+    
+    _MUTABLE_ARRAYS = ("_visible_bits", "_marked_bits")
+    
+    @profiled("board_generation")
+    def __init__(self, rows: int, columns: int, num_mines: int, rng: RngLike = None,
+                 lazy: bool = False):
+        """
+        Inicializa un nuevo tablero compacto de Buscaminas.
+        
+        Args:
+            rows: Número de filas del tablero
+            columns: Número de columnas del tablero
+            num_mines: Número de minas a colocar
+            rng: Generador de NumPy o semilla para colocar las minas (None usa
+                el generador compartido del módulo)
+            lazy: Si es True, las minas no se colocan hasta llamar a place_mines
+        """
+        self.rows = rows
+        self.columns = columns
+        self.num_mines = min(num_mines, rows * columns - 1)  # Evitar tablero lleno de minas
+        
+        num_cells = rows * columns
+        plane_size = (num_cells + 7) // 8
+        
+        # Planos de bits: el bit (i & 7) del byte (i >> 3) corresponde a la celda plana i
+        self._mine_bits = np.zeros(plane_size, dtype=np.uint8)
+        self._visible_bits = np.zeros(plane_size, dtype=np.uint8)
+        self._marked_bits = np.zeros(plane_size, dtype=np.uint8)
+        
+        self.neighbors = None  # Se obtiene en el primer uso (ver Board._neighbor_table)
+        
+        # Contadores incrementales para comprobar victoria y minas restantes en O(1)
+        self._safe_cells = num_cells - self.num_mines
+        self._revealed_safe_count = 0
+        self._marked_count = 0
+        
+        # Colocar minas y calcular números
+        self._numbers = np.zeros(num_cells, dtype=np.uint8)
+        self._rng = resolve_rng(rng)
+        self.mines_placed = False
+        if not lazy:
+            self.place_mines()
+    
+    @profiled("mine_placement")
+    def place_mines(self, exclude: Optional[np.ndarray] = None) -> None:
+        """
+        Coloca las minas aleatoriamente y calcula los números del tablero.
+        
+        Args:
+            exclude: Índices planos de celdas que no pueden tener mina (opcional)
+        
+        Raises:
+            RuntimeError: Si las minas ya estaban colocadas
+            ValueError: Si las celdas excluidas no dejan sitio para todas las minas
+        """
+        if self.mines_placed:
+            raise RuntimeError("Las minas del tablero ya están colocadas")
+        num_cells = self.rows * self.columns
+        if exclude is not None and num_cells - len(np.unique(exclude)) < self.num_mines:
+            raise ValueError(f"No caben {self.num_mines} minas fuera de {len(exclude)} celdas excluidas")
+        
+        mines = np.zeros((self.rows, self.columns), dtype=bool)
+        mines.flat[choose_mine_cells(self._rng, num_cells, self.num_mines, exclude)] = True
+        # Plano nuevo: los clones creados antes de colocar las minas comparten el anterior
+        self._mine_bits = np.packbits(mines, axis=None, bitorder='little')
+        self._numbers = count_adjacent_mines(mines).view(np.uint8).ravel()
+        self.mines_placed = True
+    
+    @staticmethod
+    def _test_bits(plane: np.ndarray, cells: np.ndarray) -> np.ndarray:
+        """
+        Lee los bits de varias celdas de un plano.
+        
+        Args:
+            plane: Plano de bits empaquetado
+            cells: Índices planos de las celdas
+        
+        Returns:
+            Array booleano con el bit de cada celda
+        """
+        return ((plane[cells >> 3] >> (cells & 7).astype(np.uint8)) & 1).astype(bool)
+    
+    @staticmethod
+    def _set_bits(plane: np.ndarray, cells: np.ndarray) -> None:
+        """
+        Activa los bits de varias celdas de un plano.
+        
+        Args:
+            plane: Plano de bits empaquetado
+            cells: Índices planos de las celdas
+        """
+        np.bitwise_or.at(plane, cells >> 3, np.left_shift(1, cells & 7).astype(np.uint8))
+    
+    def _unpack(self, plane: np.ndarray) -> np.ndarray:
+        """
+        Desempaqueta un plano de bits en una matriz booleana del tamaño del tablero.
+        
+        Args:
+            plane: Plano de bits empaquetado
+        
+        Returns:
+            Matriz booleana (filas, columnas)
+        """
+        bits = np.unpackbits(plane, count=self.rows * self.columns, bitorder='little')
+        return bits.view(bool).reshape(self.rows, self.columns)
+    
+    def _bit(self, plane: np.ndarray, row: int, col: int) -> bool:
+        """
+        Lee el bit de una celda de un plano.
+        
+        Args:
+            plane: Plano de bits empaquetado
+            row: Fila de la celda
+            col: Columna de la celda
+        
+        Returns:
+            Valor del bit de la celda
+        """
+        index = row * self.columns + col
+        return bool(plane[index >> 3] >> (index & 7) & 1)
+    
+    def get_zero_region(self, row: int, col: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Obtiene las celdas que se descubren al abrir un cero.
+        
+        El tablero compacto no precalcula regiones: las recorre por capas
+        sin modificar el tablero.
+        
+        Args:
+            row: Fila de una celda con valor 0
+            col: Columna de una celda con valor 0
+        
+        Returns:
+            Tupla (ceros, celdas) con los índices planos de los ceros de la región
+            y de todas las celdas que abre (los ceros más su borde de números)
+        """
+        start = np.array([row * self.columns + col])
+        seen = np.zeros_like(self._mine_bits)
+        self._set_bits(seen, start)
+        
+        zeros, cells = [start], [start]
+        frontier = start
+        while len(frontier):
+            neighbors = self._neighbors_of(frontier)
+            neighbors = neighbors[~self._test_bits(seen, neighbors)]
+            self._set_bits(seen, neighbors)
+            cells.append(neighbors)
+            frontier = neighbors[self._numbers[neighbors] == 0]
+            zeros.append(frontier)
+        return np.concatenate(zeros), np.concatenate(cells)
+    
+    def _neighbors_of(self, cells: np.ndarray) -> np.ndarray:
+        """
+        Obtiene los vecinos distintos de un conjunto de celdas.
+        
+        Args:
+            cells: Índices planos de las celdas
+        
+        Returns:
+            Índices planos ordenados de todas sus celdas vecinas
+        """
+        table = self._neighbor_table()
+        if table is not None:
+            return table.neighbors_of(cells)
+        
+        rows, cols = np.divmod(cells, self.columns)
+        neighbors = []
+        for di, dj in _NEIGHBOR_OFFSETS:
+            inside = (rows + di >= 0) & (rows + di < self.rows) & (cols + dj >= 0) & (cols + dj < self.columns)
+            neighbors.append((cells + di * self.columns + dj)[inside])
+        return np.unique(np.concatenate(neighbors))
+    
+    def reveal_zero_region(self, row: int, col: int) -> Optional[np.ndarray]:
+        """
+        Descubre la región de un 0 recién abierto expandiéndola por capas.
+        
+        Cada capa abre a la vez todos los vecinos ocultos y sin marcar de los
+        ceros abiertos en la capa anterior, lo que equivale al flood fill celda
+        a celda sin recursión ni tablas precalculadas.
+        
+        Args:
+            row: Fila del 0 (ya visible)
+            col: Columna del 0
+        
+        Returns:
+            Índices planos de las celdas descubiertas
+        """
+        opened = []
+        frontier = np.array([row * self.columns + col])
+        while len(frontier):
+            neighbors = self._neighbors_of(frontier)
+            closed = ~self._test_bits(self._visible_bits, neighbors) & ~self._test_bits(self._marked_bits, neighbors)
+            neighbors = neighbors[closed]
+            
+            # Los vecinos de un 0 nunca son minas
+            self._set_bits(self._visible_bits, neighbors)
+            self._revealed_safe_count += len(neighbors)
+            opened.append(neighbors)
+            frontier = neighbors[self._numbers[neighbors] == 0]
+        return np.concatenate(opened)
+    
+    def get_cell_value(self, row: int, col: int) -> int:
+        """
+        Obtiene el valor de una celda del tablero.
+        
+        Args:
+            row: Fila de la celda
+            col: Columna de la celda
+        
+        Returns:
+            Valor de la celda (-1 para mina, >=0 para número)
+        """
+        if self._bit(self._mine_bits, row, col):
+            return -1
+        return int(self._numbers[row * self.columns + col])
+    
+    def get_cell_values(self, cells: np.ndarray) -> np.ndarray:
+        """
+        Obtiene el valor de varias celdas del tablero.
+        
+        Args:
+            cells: Índices planos (fila * columnas + columna) de las celdas
+        
+        Returns:
+            Array con el valor de cada celda (-1 para mina, >=0 para número)
+        """
+        values = self._numbers[cells].astype(np.int64)
+        values[self._test_bits(self._mine_bits, cells)] = -1
+        return values
+    
+    def is_mine(self, row: int, col: int) -> bool:
+        """
+        Verifica si una celda contiene una mina.
+        
+        Args:
+            row: Fila de la celda
+            col: Columna de la celda
+        
+        Returns:
+            True si la celda contiene una mina, False en caso contrario
+        """
+        return self._bit(self._mine_bits, row, col)
+    
+    def get_mine_cells(self) -> np.ndarray:
+        """
+        Obtiene las posiciones de todas las minas.
+        
+        Returns:
+            Índices planos (fila * columnas + columna) de las celdas con mina
+        """
+        return np.flatnonzero(self._unpack(self._mine_bits))
+    
+    def is_visible(self, row: int, col: int) -> bool:
+        """
+        Verifica si una celda es visible para el jugador.
+        
+        Args:
+            row: Fila de la celda
+            col: Columna de la celda
+        
+        Returns:
+            True si la celda es visible, False en caso contrario
+        """
+        return self._bit(self._visible_bits, row, col)
+    
+    def is_marked(self, row: int, col: int) -> bool:
+        """
+        Verifica si una celda está marcada como posible mina.
+        
+        Args:
+            row: Fila de la celda
+            col: Columna de la celda
+        
+        Returns:
+            True si la celda está marcada, False en caso contrario
+        """
+        return self._bit(self._marked_bits, row, col)
+    
+    def set_visible(self, row: int, col: int) -> None:
+        """
+        Establece una celda como visible.
+        
+        Args:
+            row: Fila de la celda
+            col: Columna de la celda
+        """
+        if not self.is_visible(row, col):
+            index = row * self.columns + col
+            self._visible_bits[index >> 3] |= 1 << (index & 7)
+            if not self.is_mine(row, col):
+                self._revealed_safe_count += 1
+    
+    def set_cells_visible(self, cells: np.ndarray) -> None:
+        """
+        Establece varias celdas como visibles en una sola operación.
+        
+        Args:
+            cells: Índices planos (fila * columnas + columna) de las celdas
+        """
+        cells = np.unique(cells)
+        cells = cells[~self._test_bits(self._visible_bits, cells)]
+        self._set_bits(self._visible_bits, cells)
+        self._revealed_safe_count += int(np.count_nonzero(~self._test_bits(self._mine_bits, cells)))
+    
+    def toggle_mark(self, row: int, col: int) -> None:
+        """
+        Alterna el estado de marcado de una celda.
+        
+        Args:
+            row: Fila de la celda
+            col: Columna de la celda
+        """
+        index = row * self.columns + col
+        self._marked_bits[index >> 3] ^= 1 << (index & 7)
+        self._marked_count += 1 if self.is_marked(row, col) else -1
+    
+    def get_state_representation(self, copy: bool = False) -> np.ndarray:
+        """
+        Obtiene una representación del estado actual del tablero para la IA.
+        
+        Se construye en cada llamada como matriz int8, por lo que siempre es
+        una copia independiente.
+        
+        Args:
+            copy: Se acepta por compatibilidad con Board; el resultado ya es una copia
+        
+        Returns:
+            Array de NumPy con la representación del estado
+        """
+        values = np.where(self._unpack(self._mine_bits), -1,
+                          self._numbers.reshape(self.rows, self.columns).view(np.int8))
+        state = np.where(self._unpack(self._marked_bits), self.MARKED, self.HIDDEN).astype(np.int8)
+        np.copyto(state, values, where=self._unpack(self._visible_bits))
+        return state
+    
+    def _refresh_views(self) -> None:
+        """El tablero compacto no mantiene vistas de la observación que haya que rehacer."""
+    
+    def get_memory_usage(self) -> int:
+        """
+        Obtiene la memoria ocupada por los arrays del tablero.
+        
+        Returns:
+            Número de bytes de la matriz de números y de los planos de bits
+        """
+        return sum(array.nbytes for array in (self._numbers, self._mine_bits, self._visible_bits, self._marked_bits))
+    
+    def check_consistency(self) -> None:
+        """
+        Comprueba que los contadores incrementales coinciden con los planos de bits.
+        
+        Recorre el tablero completo, así que está pensado para modo depuración.
+        
+        Raises:
+            AssertionError: Si algún contador no coincide con su valor recalculado
+        """
+        mines = self._unpack(self._mine_bits)
+        revealed_safe = int(np.count_nonzero(self._unpack(self._visible_bits) & ~mines))
+        if revealed_safe != self._revealed_safe_count:
+            raise AssertionError(
+                f"Celdas seguras visibles: contador {self._revealed_safe_count}, tablero {revealed_safe}")
+        
+        marked = int(np.count_nonzero(self._unpack(self._marked_bits)))
+        if marked != self._marked_count:
+            raise AssertionError(f"Celdas marcadas: contador {self._marked_count}, tablero {marked}")
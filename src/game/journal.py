@@ -0,0 +1,438 @@
+"""
+Diario binario de partidas (semilla, configuración y jugadas) y reproductor con puntos de control.
+"""
+
+import os
+import struct
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+
+from src.game.minesweeper import GameAction, GameStatus, Minesweeper
+
+
+MAGIC = b"MSJ\x01"
+
+# Cabecera de cada partida: tamaño de las jugadas en bytes, filas, columnas,
+# minas, semilla, opciones, resultado y número de jugadas
+_HEADER = struct.Struct("<IHHIQBBI")
+
+FLAG_SAFE_FIRST_CLICK = 1
+FLAG_SAFE_NEIGHBORS = 2
+FLAG_WIDE_MOVES = 4  # Jugadas en uint32 (tableros de más de 32768 celdas)
+
+
+def _scan_games(file: BinaryIO) -> Tuple[List[int], int]:
+    """
+    Recorre las cabeceras de un diario saltando las jugadas.
+    
+    Args:
+        file: Archivo del diario abierto en modo binario
+    
+    Returns:
+        Tupla (posición de cada partida completa, final de la última)
+    
+    Raises:
+        ValueError: Si el archivo no es un diario
+    """
+    file.seek(0)
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{file.name} no es un diario de partidas")
+    
+    size = os.fstat(file.fileno()).st_size
+    offsets: List[int] = []
+    offset = len(MAGIC)
+    while offset + _HEADER.size <= size:
+        file.seek(offset)
+        end = offset + _HEADER.size + struct.unpack("<I", file.read(4))[0]
+        if end > size:
+            break
+        offsets.append(offset)
+        offset = end
+    return offsets, offset
+
+
+class GameRecord:
+    """
+    Partida guardada en el diario: lo necesario para volver a jugarla.
+    
+    El tablero se reconstruye con la semilla (Minesweeper con rng=semilla),
+    así que solo se guardan las jugadas, cada una como un entero
+    celda * 2 + acción (uint16 si el tablero tiene hasta 32768 celdas).
+    """
+    
+    def __init__(self, seed: int, rows: int, columns: int, num_mines: int, moves: np.ndarray,
+                 safe_first_click: bool = False, safe_neighbors: bool = False,
+                 status: GameStatus = GameStatus.ONGOING):
+        """
+        Inicializa el registro de una partida.
+        
+        Args:
+            seed: Semilla entera con la que se creó el tablero
+            rows: Número de filas
+            columns: Número de columnas
+            num_mines: Número de minas
+            moves: Jugadas codificadas (ver encode_move)
+            safe_first_click: Opción safe_first_click de la partida
+            safe_neighbors: Opción safe_neighbors de la partida
+            status: Resultado de la partida
+        """
+        self.seed = seed
+        self.rows = rows
+        self.columns = columns
+        self.num_mines = num_mines
+        self.moves = moves
+        self.safe_first_click = safe_first_click
+        self.safe_neighbors = safe_neighbors
+        self.status = status
+    
+    def __len__(self) -> int:
+        return len(self.moves)
+    
+    @staticmethod
+    def encode_move(row: int, col: int, action: GameAction, columns: int) -> int:
+        """
+        Codifica una jugada como entero.
+        
+        Args:
+            row: Fila de la celda
+            col: Columna de la celda
+            action: GameAction.OPEN o GameAction.MARK
+            columns: Número de columnas del tablero
+        
+        Returns:
+            celda * 2 + acción
+        """
+        return (row * columns + col) * 2 + action.value
+    
+    def decode_move(self, index: int) -> Tuple[int, int, GameAction]:
+        """
+        Obtiene una jugada de la partida.
+        
+        Args:
+            index: Número de la jugada (desde 0)
+        
+        Returns:
+            Tupla (fila, columna, acción)
+        """
+        cell, action = divmod(int(self.moves[index]), 2)
+        row, col = divmod(cell, self.columns)
+        return row, col, GameAction(action)
+    
+    def actions(self) -> List[Tuple[int, int, str]]:
+        """
+        Obtiene las jugadas en el formato de BoardVisualizer.animate_game.
+        
+        Returns:
+            Lista de tuplas (fila, columna, "open" o "mark")
+        """
+        names = {GameAction.OPEN: "open", GameAction.MARK: "mark"}
+        return [(row, col, names[action]) for row, col, action in map(self.decode_move, range(len(self)))]
+    
+    def new_game(self, compact: bool = False) -> Minesweeper:
+        """
+        Crea la partida en su estado inicial (mismo tablero que la original).
+        
+        Args:
+            compact: Si es True, usa CompactBoard
+        
+        Returns:
+            Partida sin jugadas ni manejadores de eventos
+        """
+        return Minesweeper(self.rows, self.columns, self.num_mines, compact=compact, rng=self.seed,
+                           safe_first_click=self.safe_first_click, safe_neighbors=self.safe_neighbors)
+
+
+class GameRecorder:
+    """
+    Juega una partida creada a partir de una semilla y anota sus jugadas.
+    
+    Uso:
+        recorder = GameRecorder(seed, **Minesweeper.BEGINNER)
+        recorder.open_cell(3, 4)
+        journal.append(recorder.finish())
+    """
+    
+    def __init__(self, seed: int, rows: int, columns: int, mines: int, safe_first_click: bool = False,
+                 safe_neighbors: bool = False, compact: bool = False):
+        """
+        Crea la partida que se va a grabar.
+        
+        Args:
+            seed: Semilla entera del tablero
+            rows: Número de filas
+            columns: Número de columnas
+            mines: Número de minas
+            safe_first_click: Opción safe_first_click de Minesweeper
+            safe_neighbors: Opción safe_neighbors de Minesweeper
+            compact: Si es True, usa CompactBoard
+        """
+        self.record = GameRecord(seed, rows, columns, mines, np.zeros(0, dtype=np.uint32),
+                                 safe_first_click, safe_neighbors)
+        self.game = self.record.new_game(compact)
+        self._moves: List[int] = []
+    
+    def open_cell(self, row: int, col: int) -> GameStatus:
+        """
+        Abre una celda y anota la jugada.
+        
+        Args:
+            row: Fila de la celda
+            col: Columna de la celda
+        
+        Returns:
+            Estado del juego tras la acción
+        """
+        self._moves.append(GameRecord.encode_move(row, col, GameAction.OPEN, self.game.board.columns))
+        return self.game.open_cell(row, col)
+    
+    def mark_cell(self, row: int, col: int) -> None:
+        """
+        Marca o desmarca una celda y anota la jugada.
+        
+        Args:
+            row: Fila de la celda
+            col: Columna de la celda
+        """
+        self._moves.append(GameRecord.encode_move(row, col, GameAction.MARK, self.game.board.columns))
+        self.game.mark_cell(row, col)
+    
+    def finish(self) -> GameRecord:
+        """
+        Obtiene el registro de la partida con las jugadas anotadas hasta ahora.
+        
+        Returns:
+            GameRecord listo para JournalWriter.append
+        """
+        self.record.moves = np.array(self._moves, dtype=np.uint32)
+        self.record.status = self.game.status
+        return self.record
+
+
+class JournalWriter:
+    """
+    Escritor del diario: añade partidas al final de un archivo binario.
+    
+    Cada partida ocupa una cabecera de 26 bytes más 2 bytes por jugada en
+    tableros de hasta 32768 celdas, así que una partida de principiante
+    ronda los 70 bytes y un MB guarda miles de partidas. El archivo solo
+    crece: abrir un diario existente continúa a partir de su última partida
+    completa.
+    """
+    
+    def __init__(self, filepath: str):
+        """
+        Abre (o crea) el diario.
+        
+        Args:
+            filepath: Ruta del archivo
+        
+        Raises:
+            ValueError: Si el archivo existe y no es un diario
+        """
+        self.filepath = filepath
+        self._file: BinaryIO = open(filepath, "r+b" if os.path.exists(filepath) else "w+b")
+        if not self._file.read(len(MAGIC)):
+            self._file.write(MAGIC)
+        else:
+            try:
+                _, end = _scan_games(self._file)
+            except ValueError:
+                self._file.close()
+                raise
+            # Descartar una partida incompleta al final (escritura interrumpida)
+            self._file.truncate(end)
+        self._file.seek(0, os.SEEK_END)
+    
+    def append(self, record: GameRecord) -> None:
+        """
+        Añade una partida al diario.
+        
+        Args:
+            record: Partida a guardar
+        """
+        wide = record.rows * record.columns * 2 > np.iinfo(np.uint16).max
+        moves = np.asarray(record.moves, dtype=np.uint32 if wide else np.uint16)
+        flags = ((FLAG_SAFE_FIRST_CLICK if record.safe_first_click else 0)
+                 | (FLAG_SAFE_NEIGHBORS if record.safe_neighbors else 0)
+                 | (FLAG_WIDE_MOVES if wide else 0))
+        payload = moves.astype(moves.dtype.newbyteorder("<"), copy=False).tobytes()
+        self._file.write(_HEADER.pack(len(payload), record.rows, record.columns, record.num_mines,
+                                      record.seed, flags, record.status.value, len(moves)))
+        self._file.write(payload)
+    
+    def flush(self) -> None:
+        """Vacía el buffer del archivo."""
+        self._file.flush()
+    
+    def close(self) -> None:
+        """Cierra el archivo."""
+        if not self._file.closed:
+            self._file.close()
+    
+    def __enter__(self) -> 'JournalWriter':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class JournalReader:
+    """
+    Lector del diario con acceso aleatorio a las partidas.
+    
+    Al abrirlo recorre solo las cabeceras (saltando las jugadas) para
+    construir el índice de posiciones de cada partida.
+    """
+    
+    def __init__(self, filepath: str):
+        """
+        Abre el diario y construye el índice de partidas.
+        
+        Args:
+            filepath: Ruta del archivo
+        
+        Raises:
+            ValueError: Si el archivo no es un diario
+        """
+        self.filepath = filepath
+        self._file: BinaryIO = open(filepath, "rb")
+        try:
+            self._offsets, _ = _scan_games(self._file)
+        except ValueError:
+            self._file.close()
+            raise
+    
+    def __len__(self) -> int:
+        return len(self._offsets)
+    
+    def __getitem__(self, index: int) -> GameRecord:
+        """
+        Lee una partida del diario.
+        
+        Args:
+            index: Número de la partida (admite índices negativos)
+        
+        Returns:
+            GameRecord de la partida
+        """
+        self._file.seek(self._offsets[index])
+        (payload_size, rows, columns, num_mines, seed, flags,
+         status, num_moves) = _HEADER.unpack(self._file.read(_HEADER.size))
+        dtype = np.dtype("<u4") if flags & FLAG_WIDE_MOVES else np.dtype("<u2")
+        moves = np.frombuffer(self._file.read(payload_size), dtype=dtype, count=num_moves)
+        return GameRecord(seed, rows, columns, num_mines, moves,
+                          bool(flags & FLAG_SAFE_FIRST_CLICK), bool(flags & FLAG_SAFE_NEIGHBORS),
+                          GameStatus(status))
+    
+    def __iter__(self) -> Iterator[GameRecord]:
+        for index in range(len(self)):
+            yield self[index]
+    
+    def close(self) -> None:
+        """Cierra el archivo."""
+        if not self._file.closed:
+            self._file.close()
+    
+    def __enter__(self) -> 'JournalReader':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class GameReplay:
+    """
+    Reproductor de una partida del diario con puntos de control.
+    
+    Las jugadas se aplican a una partida sin manejadores de eventos, así que
+    el coste de cada una es el del motor. Cada checkpoint_interval jugadas
+    se guarda un snapshot del estado; seek(k) restaura el punto de control
+    anterior a k y aplica como mucho checkpoint_interval - 1 jugadas, en
+    lugar de volver a jugar la partida desde el principio.
+    """
+    
+    def __init__(self, record: GameRecord, checkpoint_interval: int = 32, compact: bool = False):
+        """
+        Prepara la reproducción de una partida.
+        
+        Args:
+            record: Partida a reproducir
+            checkpoint_interval: Jugadas entre puntos de control
+            compact: Si es True, usa CompactBoard
+        
+        Raises:
+            ValueError: Si checkpoint_interval no es positivo
+        """
+        if checkpoint_interval <= 0:
+            raise ValueError("checkpoint_interval debe ser positivo")
+        self.record = record
+        self.checkpoint_interval = checkpoint_interval
+        self.game = record.new_game(compact)
+        self.position = 0
+        self._columns = record.columns
+        self._checkpoints: List[Dict[str, Any]] = [self.game.snapshot()]
+    
+    def __len__(self) -> int:
+        return len(self.record)
+    
+    def _step(self) -> None:
+        """Aplica la siguiente jugada y guarda un punto de control si toca."""
+        cell, action = divmod(int(self.record.moves[self.position]), 2)
+        row, col = divmod(cell, self._columns)
+        if action == GameAction.OPEN.value:
+            self.game.open_cell(row, col)
+        else:
+            self.game.mark_cell(row, col)
+        self.position += 1
+        
+        if (self.position % self.checkpoint_interval == 0
+                and self.position // self.checkpoint_interval == len(self._checkpoints)):
+            self._checkpoints.append(self.game.snapshot())
+    
+    def seek(self, move: int) -> Minesweeper:
+        """
+        Lleva la partida al estado tras un número de jugadas.
+        
+        Args:
+            move: Número de jugadas aplicadas, entre 0 y len(self)
+        
+        Returns:
+            La partida del reproductor en ese estado (se modifica en la
+            siguiente llamada: usar clone() para conservarla)
+        
+        Raises:
+            IndexError: Si move está fuera de rango
+        """
+        if not 0 <= move <= len(self):
+            raise IndexError(f"Jugada {move} fuera de rango (0-{len(self)})")
+        
+        checkpoint = min(move // self.checkpoint_interval, len(self._checkpoints) - 1)
+        start = checkpoint * self.checkpoint_interval
+        if move < self.position or start > self.position:
+            self.game.restore(self._checkpoints[checkpoint])
+            self.position = start
+        while self.position < move:
+            self._step()
+        return self.game
+    
+    def final_state(self) -> Minesweeper:
+        """
+        Lleva la partida al estado tras su última jugada.
+        
+        Returns:
+            La partida del reproductor al final
+        """
+        return self.seek(len(self))
+    
+    def states(self, moves: Optional[Sequence[int]] = None) -> Iterator[Tuple[int, Minesweeper]]:
+        """
+        Recorre estados de la partida.
+        
+        Args:
+            moves: Números de jugada a visitar (None recorre todos en orden)
+        
+        Yields:
+            Tuplas (número de jugadas, partida en ese estado)
+        """
+        for move in (range(len(self) + 1) if moves is None else moves):
+            yield move, self.seek(move)
@@ -6,7 +6,9 @@ from enum import Enum
 from typing import Tuple, List, Callable, Optional, Dict, Any
 import numpy as np
 
-from src.game.board import Board
+from src.game.board import Board, RngLike
+from src.game.compact_board import CompactBoard
+from src.utils.profiling import profiled
 
 
 class GameStatus(Enum):
@@ -30,6 +32,7 @@ class GameEvent(Enum):
     GAME_STARTED = 3
     GAME_WON = 4
     GAME_LOST = 5
+    CELLS_OPENED = 6  # Todas las celdas abiertas por una acción, como arrays
 
 
 class Minesweeper:
@@ -45,7 +48,9 @@ class Minesweeper:
     INTERMEDIATE = {"rows": 16, "columns": 16, "mines": 40}
     EXPERT = {"rows": 16, "columns": 30, "mines": 99}
     
-    def __init__(self, rows: int, columns: int, num_mines: int):
+    def __init__(self, rows: int, columns: int, num_mines: int, debug: bool = False,
+                 compact: bool = False, rng: RngLike = None, safe_first_click: bool = False,
+                 safe_neighbors: bool = False):
         """
         Inicializa un nuevo juego de Buscaminas.
         
@@ -53,8 +58,20 @@ class Minesweeper:
             rows: Número de filas del tablero
             columns: Número de columnas del tablero
             num_mines: Número de minas a colocar
+            debug: Si es True, verifica los contadores del tablero tras cada acción
+            compact: Si es True, usa CompactBoard (números uint8 y planos de bits)
+            rng: Generador de NumPy o semilla para colocar las minas (None usa
+                el generador compartido)
+            safe_first_click: Si es True, las minas se colocan al abrir la
+                primera celda y nunca en ella
+            safe_neighbors: Con safe_first_click, excluye también las vecinas de
+                la primera celda (si quedan celdas suficientes para las minas),
+                de modo que la primera jugada siempre abre un 0
         """
-        self.board = Board(rows, columns, num_mines)
+        board_class = CompactBoard if compact else Board
+        self.board = board_class(rows, columns, num_mines, rng=rng, lazy=safe_first_click)
+        self.safe_neighbors = safe_neighbors
+        self.debug = debug
         self.status = GameStatus.ONGOING
         self.first_move = True
         self.moves_count = 0
@@ -72,6 +89,31 @@ class Minesweeper:
         """
         self.event_handlers[event].append(handler)
     
+    def unregister_event_handler(self, event: GameEvent, handler: Callable) -> None:
+        """
+        Elimina un manejador registrado para un evento.
+        
+        Args:
+            event: Tipo de evento
+            handler: Manejador a eliminar
+        """
+        if handler in self.event_handlers[event]:
+            self.event_handlers[event].remove(handler)
+    
+    def has_event_handlers(self, event: GameEvent) -> bool:
+        """
+        Indica si hay algún manejador registrado para un evento.
+        
+        Permite evitar el cálculo de los datos de un evento que nadie escucha.
+        
+        Args:
+            event: Tipo de evento
+        
+        Returns:
+            True si el evento tiene al menos un manejador
+        """
+        return bool(self.event_handlers[event])
+    
     def _trigger_event(self, event: GameEvent, **kwargs) -> None:
         """
         Dispara un evento notificando a todos los manejadores registrados.
@@ -80,9 +122,13 @@ class Minesweeper:
             event: Tipo de evento que ha ocurrido
             **kwargs: Datos adicionales del evento
         """
-        for handler in self.event_handlers[event]:
+        handlers = self.event_handlers[event]
+        if not handlers:
+            return
+        for handler in handlers:
             handler(event=event, **kwargs)
     
+    @profiled("open_cell")
     def open_cell(self, row: int, col: int) -> GameStatus:
         """
         Abre una celda en el tablero.
@@ -90,7 +136,7 @@ class Minesweeper:
         Args:
             row: Fila de la celda
             col: Columna de la celda
-            
+        
         Returns:
             Estado actual del juego tras la acción
         """
@@ -114,20 +160,39 @@ class Minesweeper:
         # Incrementar contador de movimientos
         self.moves_count += 1
         
+        # Colocación diferida de las minas fuera de la primera celda abierta
+        if not self.board.mines_placed:
+            self.board.place_mines(self._first_click_exclusion(row, col))
+        
         # Verificar si es una mina
         if self.board.is_mine(row, col):
             self.status = GameStatus.DEFEAT
             self._show_all_mines()
+            if self.debug:
+                self.board.check_consistency()
             self._trigger_event(GameEvent.GAME_LOST, row=row, col=col)
             return self.status
         
         # Hacer visible la celda
         self.board.set_visible(row, col)
-        self._trigger_event(GameEvent.CELL_OPENED, row=row, col=col, value=self.board.get_cell_value(row, col))
+        value = self.board.get_cell_value(row, col)
+        if self.event_handlers[GameEvent.CELL_OPENED]:
+            self._trigger_event(GameEvent.CELL_OPENED, row=row, col=col, value=value)
         
         # Si el valor es 0, abrir celdas adyacentes (algoritmo de flood fill)
-        if self.board.get_cell_value(row, col) == 0:
-            self._flood_fill(row, col)
+        opened = self._flood_fill(row, col) if value == 0 else None
+        
+        # Un único evento con todas las celdas abiertas por la acción
+        if self.event_handlers[GameEvent.CELLS_OPENED]:
+            cells = np.array([row * self.board.columns + col], dtype=np.int64)
+            if opened is not None and len(opened):
+                cells = np.concatenate((cells, opened))
+            rows, cols = np.divmod(cells, self.board.columns)
+            self._trigger_event(GameEvent.CELLS_OPENED, rows=rows, cols=cols,
+                                values=self.board.get_cell_values(cells))
+        
+        if self.debug:
+            self.board.check_consistency()
         
         # Verificar victoria
         if self.board.are_all_safe_cells_visible():
@@ -136,6 +201,27 @@ class Minesweeper:
         
         return self.status
     
+    def _first_click_exclusion(self, row: int, col: int) -> np.ndarray:
+        """
+        Obtiene las celdas que no pueden tener mina al colocarlas en la primera jugada.
+        
+        Args:
+            row: Fila de la primera celda abierta
+            col: Columna de la primera celda abierta
+        
+        Returns:
+            Índices planos de la celda y, con safe_neighbors, de sus vecinas
+        """
+        board = self.board
+        cells = [(row, col)]
+        if self.safe_neighbors:
+            neighbors = board.get_adjacent_cells(row, col)
+            # Como en el juego clásico, en tableros muy llenos solo se protege la celda
+            if board.rows * board.columns - 1 - len(neighbors) >= board.num_mines:
+                cells += neighbors
+        return np.array([i * board.columns + j for i, j in cells], dtype=np.int64)
+    
+    @profiled("mark_cell")
     def mark_cell(self, row: int, col: int) -> None:
         """
         Marca o desmarca una celda como posible mina.
@@ -168,56 +254,176 @@ class Minesweeper:
         was_marked = self.board.is_marked(row, col)
         self.board.toggle_mark(row, col)
         
+        if self.debug:
+            self.board.check_consistency()
+        
         # Notificar evento correspondiente
         if was_marked:
             self._trigger_event(GameEvent.CELL_UNMARKED, row=row, col=col)
         else:
             self._trigger_event(GameEvent.CELL_MARKED, row=row, col=col)
     
-    def _flood_fill(self, row: int, col: int) -> None:
+    @profiled("flood_fill")
+    def _flood_fill(self, row: int, col: int) -> np.ndarray:
         """
-        Algoritmo de flood fill para abrir celdas adyacentes a un 0.
+        Abre las celdas conectadas a un 0 sin recursión.
+        
+        Si ninguna celda de la región precalculada está marcada ni ya abierta,
+        se descubre toda la región de una vez. En caso contrario se recorre con
+        una pila explícita respetando las marcas, igual que el algoritmo clásico.
+        
+        Con suscriptores de CELL_OPENED la región se abre celda a celda en el
+        mismo orden en profundidad que el flood fill recursivo original, y cada
+        evento llega cuando solo están abiertas las celdas anteriores.
         
         Args:
             row: Fila de la celda inicial
             col: Columna de la celda inicial
+        
+        Returns:
+            Índices planos de las celdas abiertas (sin la celda inicial)
         """
-        # Obtener celdas adyacentes
-        for ni, nj in self.board.get_adjacent_cells(row, col):
-            # Si la celda adyacente no es visible y no está marcada
-            if not self.board.is_visible(ni, nj) and not self.board.is_marked(ni, nj):
-                # Hacer visible la celda
-                self.board.set_visible(ni, nj)
-                self._trigger_event(GameEvent.CELL_OPENED, row=ni, col=nj, value=self.board.get_cell_value(ni, nj))
-                
-                # Si es un 0, continuar el flood fill
-                if self.board.get_cell_value(ni, nj) == 0:
-                    self._flood_fill(ni, nj)
+        if self.event_handlers[GameEvent.CELL_OPENED]:
+            return self._flood_fill_events(row, col)
+        opened = self.board.reveal_zero_region(row, col)
+        if opened is None:
+            opened = self._flood_fill_iterative(row, col)
+        return opened
+    
+    def _flood_fill_events(self, row: int, col: int) -> np.ndarray:
+        """
+        Flood fill en profundidad que notifica CELL_OPENED al abrir cada celda.
+        
+        La pila guarda el iterador de vecinos de cada 0 pendiente, así que el
+        recorrido es exactamente el de la versión recursiva.
+        
+        Args:
+            row: Fila del 0 inicial (ya visible)
+            col: Columna del 0 inicial
+        
+        Returns:
+            Índices planos de las celdas abiertas
+        """
+        board = self.board
+        opened = []
+        stack = [iter(board.get_adjacent_cells(row, col))]
+        while stack:
+            for ni, nj in stack[-1]:
+                # Si la celda adyacente no es visible y no está marcada
+                if not board.is_visible(ni, nj) and not board.is_marked(ni, nj):
+                    board.set_visible(ni, nj)
+                    opened.append(ni * board.columns + nj)
+                    value = board.get_cell_value(ni, nj)
+                    self._trigger_event(GameEvent.CELL_OPENED, row=ni, col=nj, value=value)
+                    
+                    # Si es un 0, continuar el flood fill desde ella
+                    if value == 0:
+                        stack.append(iter(board.get_adjacent_cells(ni, nj)))
+                        break
+            else:
+                stack.pop()
+        return np.array(opened, dtype=np.int64)
+    
+    def _flood_fill_iterative(self, row: int, col: int) -> np.ndarray:
+        """
+        Flood fill con pila explícita para regiones con celdas marcadas o abiertas.
+        
+        Args:
+            row: Fila del 0 inicial (ya visible)
+            col: Columna del 0 inicial
+        
+        Returns:
+            Índices planos de las celdas abiertas
+        """
+        board = self.board
+        opened = []
+        stack = [(row, col)]
+        while stack:
+            row, col = stack.pop()
+            for ni, nj in board.get_adjacent_cells(row, col):
+                # Si la celda adyacente no es visible y no está marcada
+                if not board.is_visible(ni, nj) and not board.is_marked(ni, nj):
+                    board.set_visible(ni, nj)
+                    opened.append(ni * board.columns + nj)
+                    
+                    # Si es un 0, continuar el flood fill desde ella
+                    if board.get_cell_value(ni, nj) == 0:
+                        stack.append((ni, nj))
+        return np.array(opened, dtype=np.int64)
     
     def _show_all_mines(self) -> None:
         """Hace visibles todas las minas del tablero."""
-        for i in range(self.board.rows):
-            for j in range(self.board.columns):
-                if self.board.is_mine(i, j):
-                    self.board.set_visible(i, j)
+        self.board.set_cells_visible(self.board.get_mine_cells())
     
-    def get_board_state(self) -> np.ndarray:
+    def get_board_state(self, copy: bool = False) -> np.ndarray:
         """
         Obtiene la representación actual del tablero.
         
+        Args:
+            copy: Si es True, devuelve una copia en lugar de la vista de solo lectura
+        
         Returns:
             Matriz de NumPy con el estado actual del tablero
         """
-        return self.board.get_state_representation()
+        return self.board.get_state_representation(copy=copy)
     
-    def get_visible_board(self) -> np.ndarray:
+    def get_visible_board(self, copy: bool = False) -> np.ndarray:
         """
         Obtiene una representación del tablero visible para el jugador.
         
+        Args:
+            copy: Si es True, devuelve una copia en lugar de la vista de solo lectura
+        
         Returns:
             Matriz de NumPy con el tablero visible
         """
-        return self.board.get_state_representation()
+        return self.board.get_state_representation(copy=copy)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Guarda el estado de la partida para volver a él con restore.
+        
+        Returns:
+            Diccionario con el estado del tablero y de la partida
+        """
+        return {
+            "board": self.board.snapshot(),
+            "status": self.status,
+            "first_move": self.first_move,
+            "moves_count": self.moves_count,
+        }
+    
+    def restore(self, state: Dict[str, Any]) -> None:
+        """
+        Vuelve al estado guardado con snapshot.
+        
+        No dispara eventos: los observadores con estado propio (como
+        ConstraintSolver) no se enteran del cambio.
+        
+        Args:
+            state: Estado devuelto por snapshot en esta partida o en un clon suyo
+        """
+        self.board.restore(state["board"])
+        self.status = state["status"]
+        self.first_move = state["first_move"]
+        self.moves_count = state["moves_count"]
+    
+    def clone(self) -> 'Minesweeper':
+        """
+        Crea una copia ligera de la partida para búsquedas con anticipación.
+        
+        El clon comparte con el original la colocación de las minas y solo
+        copia el estado mutable del tablero. No hereda los manejadores de
+        eventos, así que jugar en él no notifica a nadie.
+        
+        Returns:
+            Nueva partida en el mismo estado y sin manejadores de eventos
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.board = self.board.clone()
+        clone.event_handlers = {event: [] for event in self.event_handlers}
+        return clone
     
     def get_game_statistics(self) -> Dict[str, Any]:
         """
@@ -236,31 +442,54 @@ class Minesweeper:
         }
     
     @classmethod
-    def create_beginner_game(cls) -> 'Minesweeper':
+    def from_config(cls, config: Dict[str, int], **kwargs) -> 'Minesweeper':
+        """
+        Crea un juego a partir de una configuración como BEGINNER.
+        
+        Args:
+            config: Diccionario con "rows", "columns" y "mines"
+            **kwargs: Opciones adicionales del constructor (rng, safe_first_click, ...)
+        
+        Returns:
+            Instancia de Minesweeper con esa configuración
+        """
+        return cls(config["rows"], config["columns"], config["mines"], **kwargs)
+    
+    @classmethod
+    def create_beginner_game(cls, **kwargs) -> 'Minesweeper':
         """
         Crea un juego de nivel principiante.
         
+        Args:
+            **kwargs: Opciones adicionales del constructor (rng, safe_first_click, ...)
+        
         Returns:
             Instancia de Minesweeper con configuración de principiante
         """
-        return cls(**cls.BEGINNER)
+        return cls.from_config(cls.BEGINNER, **kwargs)
     
     @classmethod
-    def create_intermediate_game(cls) -> 'Minesweeper':
+    def create_intermediate_game(cls, **kwargs) -> 'Minesweeper':
         """
         Crea un juego de nivel intermedio.
         
+        Args:
+            **kwargs: Opciones adicionales del constructor (rng, safe_first_click, ...)
+        
         Returns:
             Instancia de Minesweeper con configuración intermedia
         """
-        return cls(**cls.INTERMEDIATE)
+        return cls.from_config(cls.INTERMEDIATE, **kwargs)
     
     @classmethod
-    def create_expert_game(cls) -> 'Minesweeper':
+    def create_expert_game(cls, **kwargs) -> 'Minesweeper':
         """
         Crea un juego de nivel experto.
         
+        Args:
+            **kwargs: Opciones adicionales del constructor (rng, safe_first_click, ...)
+        
         Returns:
             Instancia de Minesweeper con configuración experta
         """
-        return cls(**cls.EXPERT) 
\ No newline at end of file
+        return cls.from_config(cls.EXPERT, **kwargs)
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""
+Tablas precalculadas de vecinos compartidas por los tableros de la misma forma.
+"""
+
+from functools import lru_cache
+from typing import List, Optional, Tuple
+import numpy as np
+
+
+# Desplazamientos (fila, columna) de las 8 celdas vecinas, en orden de filas
+NEIGHBOR_OFFSETS = tuple((di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if (di, dj) != (0, 0))
+
+
+class NeighborTable:
+    """
+    Índices de las celdas vecinas de cada celda de un tablero de filas x columnas.
+    
+    indices es una matriz (celdas, 8) con los índices planos de los vecinos de
+    cada celda, en el orden de NEIGHBOR_OFFSETS y rellenada al final con el
+    centinela num_cells (una celda ficticia fuera del tablero); counts guarda
+    cuántos vecinos reales tiene cada celda. Los arrays son de solo lectura
+    porque la tabla se comparte entre todos los tableros de la misma forma:
+    se obtiene con get_neighbor_table.
+    
+    Para operar con los vecinos de forma vectorizada basta con añadir al
+    final del array de valores un elemento para el centinela (ver gather).
+    """
+    
+    def __init__(self, rows: int, columns: int):
+        """
+        Calcula la tabla de vecinos.
+        
+        Args:
+            rows: Número de filas del tablero
+            columns: Número de columnas del tablero
+        """
+        self.rows = rows
+        self.columns = columns
+        self.num_cells = rows * columns
+        self.sentinel = self.num_cells
+        
+        # int32 basta salvo en tableros de más de 2^31 celdas
+        dtype = np.int32 if self.num_cells < np.iinfo(np.int32).max else np.int64
+        cell_rows, cell_cols = np.divmod(np.arange(self.num_cells, dtype=dtype), columns)
+        neighbors = np.empty((self.num_cells, len(NEIGHBOR_OFFSETS)), dtype=dtype)
+        valid = np.empty(neighbors.shape, dtype=bool)
+        for k, (di, dj) in enumerate(NEIGHBOR_OFFSETS):
+            ni, nj = cell_rows + di, cell_cols + dj
+            valid[:, k] = (ni >= 0) & (ni < rows) & (nj >= 0) & (nj < columns)
+            neighbors[:, k] = ni * columns + nj
+        
+        # Compactar los vecinos válidos al principio de cada fila manteniendo el orden
+        order = np.argsort(~valid, axis=1, kind='stable')
+        self.indices = np.where(np.take_along_axis(valid, order, axis=1),
+                                np.take_along_axis(neighbors, order, axis=1), self.sentinel).astype(dtype)
+        self.counts = valid.sum(axis=1).astype(np.int8)
+        self.indices.flags.writeable = False
+        self.counts.flags.writeable = False
+        
+        # Listas de coordenadas para el código celda a celda (se crean al pedirlas)
+        self._adjacent: List[Optional[Tuple[Tuple[int, int], ...]]] = [None] * self.num_cells
+    
+    def adjacent(self, row: int, col: int) -> Tuple[Tuple[int, int], ...]:
+        """
+        Obtiene las coordenadas de las celdas vecinas de una celda.
+        
+        Args:
+            row: Fila de la celda
+            col: Columna de la celda
+        
+        Returns:
+            Tupla de pares (fila, columna) compartida entre llamadas
+        """
+        index = row * self.columns + col
+        cells = self._adjacent[index]
+        if cells is None:
+            columns = self.columns
+            cells = tuple(divmod(int(n), columns) for n in self.indices[index, :self.counts[index]])
+            self._adjacent[index] = cells
+        return cells
+    
+    def adjacent_indices(self, index: int) -> np.ndarray:
+        """
+        Obtiene los índices planos de los vecinos de una celda.
+        
+        Args:
+            index: Índice plano de la celda
+        
+        Returns:
+            Vista de solo lectura con los índices de sus vecinos
+        """
+        return self.indices[index, :self.counts[index]]
+    
+    def neighbors_of(self, cells: np.ndarray) -> np.ndarray:
+        """
+        Obtiene los vecinos distintos de un conjunto de celdas.
+        
+        Args:
+            cells: Índices planos de las celdas
+        
+        Returns:
+            Índices planos ordenados de todas sus celdas vecinas
+        """
+        neighbors = np.unique(self.indices[cells])
+        return neighbors[:-1] if len(neighbors) and neighbors[-1] == self.sentinel else neighbors
+    
+    def gather(self, values: np.ndarray, fill=0) -> np.ndarray:
+        """
+        Obtiene los valores de los vecinos de todas las celdas.
+        
+        Args:
+            values: Array plano con un valor por celda
+            fill: Valor que toman los vecinos de relleno (centinela)
+        
+        Returns:
+            Matriz (celdas, 8) con el valor de cada vecino
+        """
+        padded = np.empty(self.num_cells + 1, dtype=values.dtype)
+        padded[:-1] = values.ravel()
+        padded[-1] = fill
+        return padded[self.indices]
+    
+    def neighbor_sum(self, values: np.ndarray) -> np.ndarray:
+        """
+        Suma los valores de los vecinos de cada celda.
+        
+        Args:
+            values: Array plano con un valor por celda (booleanos para contar)
+        
+        Returns:
+            Array plano con la suma de los vecinos de cada celda
+        """
+        dtype = np.int64 if values.dtype == bool else values.dtype
+        return self.gather(values.astype(dtype, copy=False)).sum(axis=1)
+    
+    def scatter_add(self, out: np.ndarray, cells: np.ndarray, amount=1) -> None:
+        """
+        Suma una cantidad a los vecinos de unas celdas (con repeticiones).
+        
+        Args:
+            out: Array plano con un valor por celda que se modifica en el sitio
+            cells: Índices planos de las celdas cuyos vecinos se incrementan
+            amount: Cantidad sumada a cada vecino por cada celda
+        """
+        targets = self.indices[cells].ravel()
+        np.add.at(out, targets[targets != self.sentinel], amount)
+
+
+@lru_cache(maxsize=32)
+def get_neighbor_table(rows: int, columns: int) -> NeighborTable:
+    """
+    Obtiene la tabla de vecinos compartida para una forma de tablero.
+    
+    Args:
+        rows: Número de filas del tablero
+        columns: Número de columnas del tablero
+    
+    Returns:
+        NeighborTable de esa forma (la misma instancia en cada llamada)
+    """
+    return NeighborTable(rows, columns)
@@ -0,0 +1,179 @@
+"""
+Entorno vectorizado de Buscaminas con interfaz tipo Gym.
+"""
+
+from typing import Any, Dict, Optional, Tuple, Union
+import numpy as np
+
+from src.game.batched import BatchedMinesweeper
+from src.game.board import Board
+from src.game.minesweeper import GameAction, GameStatus, Minesweeper
+
+
+class MinesweeperVecEnv:
+    """
+    N entornos de Buscaminas que avanzan a la vez sobre BatchedMinesweeper.
+    
+    Sigue la interfaz de los entornos vectorizados de Gymnasium: reset()
+    devuelve (observaciones, infos) y step() devuelve (observaciones,
+    recompensas, terminados, truncados, infos). Las partidas que terminan se
+    reinician automáticamente en el mismo paso; su última observación y su
+    resultado quedan en infos["final_observation"] e infos["final_status"].
+    
+    Las observaciones, recompensas, banderas e infos se escriben en buffers
+    preasignados que se reutilizan en cada paso: quien necesite conservarlos
+    entre pasos debe copiarlos.
+    
+    Cada acción es un entero en [0, 2 * filas * columnas): los valores
+    menores que filas * columnas abren esa celda (índice plano) y el resto
+    marcan la celda (valor - filas * columnas).
+    """
+    
+    PRESETS: Dict[str, Dict[str, int]] = {
+        "beginner": Minesweeper.BEGINNER,
+        "intermediate": Minesweeper.INTERMEDIATE,
+        "expert": Minesweeper.EXPERT,
+    }
+    
+    def __init__(self, num_envs: int, preset: Optional[str] = "beginner",
+                 rows: Optional[int] = None, columns: Optional[int] = None,
+                 num_mines: Optional[int] = None, max_steps: Optional[int] = None,
+                 seed: Optional[int] = None):
+        """
+        Inicializa los entornos.
+        
+        Args:
+            num_envs: Número de entornos simultáneos
+            preset: "beginner", "intermediate" o "expert"; se ignora si se
+                indican rows, columns y num_mines
+            rows: Número de filas (configuración personalizada)
+            columns: Número de columnas (configuración personalizada)
+            num_mines: Número de minas (configuración personalizada)
+            max_steps: Pasos máximos por partida antes de truncarla (None sin límite)
+            seed: Semilla del generador de tableros
+        
+        Raises:
+            ValueError: Si el preset no existe o la configuración está incompleta
+        """
+        custom = (rows, columns, num_mines)
+        if all(value is not None for value in custom):
+            config = {"rows": rows, "columns": columns, "mines": num_mines}
+        elif any(value is not None for value in custom):
+            raise ValueError("Una configuración personalizada necesita rows, columns y num_mines")
+        elif preset is not None and preset.lower() in self.PRESETS:
+            config = self.PRESETS[preset.lower()]
+        else:
+            raise ValueError(f"Preset desconocido: {preset}")
+        
+        self.num_envs = num_envs
+        self.max_steps = max_steps
+        self.game = BatchedMinesweeper.from_config(num_envs, config, rng=np.random.default_rng(seed))
+        self.rows = self.game.rows
+        self.columns = self.game.columns
+        self.num_actions = 2 * self.rows * self.columns
+        
+        # Buffers reutilizados entre pasos
+        shape = (num_envs, self.rows, self.columns)
+        self._observations = np.empty(shape, dtype=np.int8)
+        self._rewards = np.zeros(num_envs, dtype=np.float32)
+        self._terminated = np.zeros(num_envs, dtype=bool)
+        self._truncated = np.zeros(num_envs, dtype=bool)
+        self._episode_steps = np.zeros(num_envs, dtype=np.int64)
+        self._row = np.empty(num_envs, dtype=np.int64)
+        self._col = np.empty(num_envs, dtype=np.int64)
+        self._action = np.empty(num_envs, dtype=np.int64)
+        self._infos: Dict[str, Any] = {
+            "final_observation": np.full(shape, Board.HIDDEN, dtype=np.int8),
+            "final_status": np.full(num_envs, GameStatus.ONGOING.value, dtype=np.int8),
+            "episode_length": np.zeros(num_envs, dtype=np.int64),
+            "_final": np.zeros(num_envs, dtype=bool),
+        }
+    
+    @property
+    def observation_shape(self) -> Tuple[int, int]:
+        """Forma de la observación de un entorno (filas, columnas)."""
+        return (self.rows, self.columns)
+    
+    def encode_action(self, row: Union[int, np.ndarray], col: Union[int, np.ndarray],
+                      action: GameAction = GameAction.OPEN) -> Union[int, np.ndarray]:
+        """
+        Convierte (fila, columna, acción) en el entero de acción del entorno.
+        
+        Args:
+            row: Fila (o array de filas)
+            col: Columna (o array de columnas)
+            action: GameAction.OPEN o GameAction.MARK
+        
+        Returns:
+            Acción codificada
+        """
+        return action.value * self.rows * self.columns + row * self.columns + col
+    
+    def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Reinicia todos los entornos.
+        
+        Args:
+            seed: Nueva semilla del generador de tableros (opcional)
+        
+        Returns:
+            Tupla (observaciones (N, filas, columnas), infos)
+        """
+        if seed is not None:
+            self.game._rng = np.random.default_rng(seed)
+        self.game.reset(out=self._observations)
+        self._episode_steps[:] = 0
+        self._infos["_final"][:] = False
+        return self._observations, self._infos
+    
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+        """
+        Aplica una acción en cada entorno y reinicia los que terminan.
+        
+        Args:
+            actions: Array (N,) de acciones codificadas (ver encode_action)
+        
+        Returns:
+            Tupla (observaciones, recompensas, terminados, truncados, infos)
+        """
+        cells = self.rows * self.columns
+        np.divmod(actions, cells, out=(self._action, self._col))
+        np.divmod(self._col, self.columns, out=(self._row, self._col))
+        
+        status, reward, _ = self.game.step(self._row, self._col, self._action, out=self._observations)
+        np.copyto(self._rewards, reward)
+        self._episode_steps += 1
+        
+        np.not_equal(status, GameStatus.ONGOING.value, out=self._terminated)
+        self._truncated[:] = False
+        if self.max_steps is not None:
+            np.greater_equal(self._episode_steps, self.max_steps, out=self._truncated)
+            self._truncated &= ~self._terminated
+        
+        final = self._infos["_final"]
+        np.logical_or(self._terminated, self._truncated, out=final)
+        if final.any():
+            done = np.flatnonzero(final)
+            self._infos["final_observation"][done] = self._observations[done]
+            self._infos["final_status"][done] = status[done]
+            self._infos["episode_length"][done] = self._episode_steps[done]
+            self._episode_steps[done] = 0
+            self.game.reset(done, out=self._observations)
+        
+        return self._observations, self._rewards, self._terminated, self._truncated, self._infos
+    
+    def action_masks(self) -> np.ndarray:
+        """
+        Obtiene las acciones válidas de cada entorno.
+        
+        Abrir es válido en celdas ocultas sin marcar; marcar, en celdas ocultas.
+        
+        Returns:
+            Array booleano (N, 2 * filas * columnas)
+        """
+        observations = self._observations.reshape(self.num_envs, -1)
+        hidden = observations == Board.HIDDEN
+        masks = np.empty((self.num_envs, self.num_actions), dtype=bool)
+        masks[:, :hidden.shape[1]] = hidden
+        masks[:, hidden.shape[1]:] = hidden | (observations == Board.MARKED)
+        return masks
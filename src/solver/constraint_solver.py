@@ -0,0 +1,295 @@
+"""
+Solucionador determinista de Buscaminas por propagación de restricciones.
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from src.game.board import count_adjacent_mines
+from src.game.minesweeper import Minesweeper, GameAction, GameEvent
+from src.utils.profiling import profiled
+
+
+Cell = Tuple[int, int]
+
+
+class ConstraintSolver:
+    """
+    Solucionador incremental basado en las restricciones de las celdas numeradas.
+    
+    Cada número visible impone una restricción: entre sus vecinos ocultos sin
+    marcar hay exactamente (número - vecinos marcados) minas. El solucionador
+    mantiene la frontera (celdas ocultas junto a números visibles) a partir de
+    los eventos del juego y solo vuelve a evaluar las restricciones cuyo
+    vecindario ha cambiado, por lo que el coste de cada movimiento depende del
+    cambio y no del tamaño del tablero.
+    
+    Aplica dos reglas:
+        - Punto único: si faltan 0 minas, todos los vecinos son seguros; si
+          faltan tantas como vecinos desconocidos, todos son minas.
+        - Pareja: para dos números que comparten celdas desconocidas, acota
+          las minas de la intersección y deduce las celdas exclusivas de cada
+          uno. Incluye el caso de subconjunto (A contenido en B).
+    """
+    
+    def __init__(self, game: Minesweeper):
+        """
+        Inicializa el solucionador y lo suscribe a los eventos del juego.
+        
+        Args:
+            game: Juego de Buscaminas a resolver
+        """
+        self.game = game
+        self.board = game.board
+        
+        self.frontier: Set[Cell] = set()  # Celdas ocultas sin marcar junto a números visibles
+        self.safe_cells: Set[Cell] = set()  # Celdas deducidas como seguras pendientes de abrir
+        self.mine_cells: Set[Cell] = set()  # Celdas deducidas como minas pendientes de marcar
+        self._dirty: Set[Cell] = set()  # Restricciones que hay que volver a evaluar
+        
+        # Estado inicial (único recorrido completo del tablero)
+        for row in range(self.board.rows):
+            for col in range(self.board.columns):
+                if self.board.is_visible(row, col) and self.board.get_cell_value(row, col) > 0:
+                    self._add_constraint(row, col)
+        
+        game.register_event_handler(GameEvent.CELLS_OPENED, self._on_cells_opened)
+        game.register_event_handler(GameEvent.CELL_MARKED, self._on_mark_changed)
+        game.register_event_handler(GameEvent.CELL_UNMARKED, self._on_mark_changed)
+    
+    def _add_constraint(self, row: int, col: int) -> None:
+        """
+        Registra una celda numerada visible y añade sus vecinos ocultos a la frontera.
+        
+        Args:
+            row: Fila de la celda numerada
+            col: Columna de la celda numerada
+        """
+        self._dirty.add((row, col))
+        for cell in self.board.get_adjacent_cells(row, col):
+            if not self.board.is_visible(*cell) and not self.board.is_marked(*cell):
+                self.frontier.add(cell)
+    
+    def _mark_neighbors_dirty(self, row: int, col: int) -> None:
+        """
+        Marca para reevaluar las restricciones de los números vecinos de una celda.
+        
+        Args:
+            row: Fila de la celda que ha cambiado
+            col: Columna de la celda que ha cambiado
+        """
+        for ni, nj in self.board.get_adjacent_cells(row, col):
+            if self.board.is_visible(ni, nj) and self.board.get_cell_value(ni, nj) > 0:
+                self._dirty.add((ni, nj))
+    
+    def _on_cells_opened(self, **kwargs) -> None:
+        """
+        Manejador para el evento con todas las celdas abiertas por una acción.
+        
+        Se suscribe al evento en bloque y no al de cada celda para que el
+        juego pueda abrir las regiones de ceros sin recorrerlas celda a celda.
+        Las celdas vecinas de las abiertas se buscan de una vez sobre el
+        rectángulo que las contiene, así que solo se consulta el tablero en
+        el borde de la región abierta.
+        """
+        rows, cols, values = kwargs['rows'], kwargs['cols'], kwargs['values']
+        opened = list(zip(rows.tolist(), cols.tolist()))
+        self.frontier.difference_update(opened)
+        self.safe_cells.difference_update(opened)
+        if len(opened) == 1:
+            (row, col), value = opened[0], int(values[0])
+            if value > 0:
+                self._add_constraint(row, col)
+            self._mark_neighbors_dirty(row, col)
+            return
+        
+        # Los números abiertos son restricciones nuevas
+        numbered = values > 0
+        self._dirty.update(zip(rows[numbered].tolist(), cols[numbered].tolist()))
+        
+        # Rectángulo de las celdas abiertas con un margen de una celda
+        top, left = max(int(rows.min()) - 1, 0), max(int(cols.min()) - 1, 0)
+        bottom = min(int(rows.max()) + 2, self.board.rows)
+        right = min(int(cols.max()) + 2, self.board.columns)
+        inside = np.zeros((bottom - top, right - left), dtype=bool)
+        inside[rows - top, cols - left] = True
+        near_number = np.zeros(inside.shape, dtype=bool)
+        near_number[rows[numbered] - top, cols[numbered] - left] = True
+        near_number = count_adjacent_mines(near_number) > 0
+        
+        # Borde: celdas no abiertas ahora junto a alguna abierta
+        border = (count_adjacent_mines(inside) > 0) & ~inside
+        for i, j in zip(*np.nonzero(border)):
+            cell = (int(i) + top, int(j) + left)
+            if self.board.is_visible(*cell):
+                if self.board.get_cell_value(*cell) > 0:
+                    self._dirty.add(cell)
+            elif near_number[i, j] and not self.board.is_marked(*cell):
+                self.frontier.add(cell)
+    
+    def _on_mark_changed(self, **kwargs) -> None:
+        """Manejador para los eventos de celda marcada y desmarcada."""
+        row, col = kwargs['row'], kwargs['col']
+        cell = (row, col)
+        if self.board.is_marked(row, col):
+            self.frontier.discard(cell)
+            self.mine_cells.discard(cell)
+            self.safe_cells.discard(cell)
+        elif any(self.board.is_visible(ni, nj) and self.board.get_cell_value(ni, nj) > 0
+                 for ni, nj in self.board.get_adjacent_cells(row, col)):
+            self.frontier.add(cell)
+        self._mark_neighbors_dirty(row, col)
+    
+    def _constraint(self, row: int, col: int) -> Tuple[FrozenSet[Cell], int]:
+        """
+        Calcula la restricción de una celda numerada.
+        
+        Las celdas ya deducidas se tratan como conocidas: las minas se restan
+        del número y ni ellas ni las seguras cuentan como desconocidas.
+        
+        Args:
+            row: Fila de la celda numerada
+            col: Columna de la celda numerada
+        
+        Returns:
+            Tupla (celdas desconocidas, minas que faltan entre ellas)
+        """
+        unknown = []
+        mines = self.board.get_cell_value(row, col)
+        for cell in self.board.get_adjacent_cells(row, col):
+            if self.board.is_visible(*cell):
+                continue
+            if self.board.is_marked(*cell) or cell in self.mine_cells:
+                mines -= 1
+            elif cell not in self.safe_cells:
+                unknown.append(cell)
+        return frozenset(unknown), mines
+    
+    def _deduce(self, safe: Iterable[Cell], mines: Iterable[Cell]) -> None:
+        """
+        Registra celdas deducidas y marca para reevaluar los números que las rodean.
+        
+        Args:
+            safe: Celdas deducidas como seguras
+            mines: Celdas deducidas como minas
+        """
+        for cell in safe:
+            if cell not in self.safe_cells:
+                self.safe_cells.add(cell)
+                self._mark_neighbors_dirty(*cell)
+        for cell in mines:
+            if cell not in self.mine_cells:
+                self.mine_cells.add(cell)
+                self._mark_neighbors_dirty(*cell)
+    
+    @profiled("solver_update")
+    def update(self) -> None:
+        """Aplica las reglas a las restricciones modificadas hasta no deducir nada más."""
+        while self._dirty:
+            row, col = self._dirty.pop()
+            unknown, mines = self._constraint(row, col)
+            if not unknown or mines < 0 or mines > len(unknown):
+                continue
+            
+            # Regla de punto único
+            if mines == 0:
+                self._deduce(unknown, ())
+                continue
+            if mines == len(unknown):
+                self._deduce((), unknown)
+                continue
+            
+            # Regla de pareja con los números que comparten celdas desconocidas
+            for other in self._overlapping_constraints(row, col, unknown):
+                other_unknown, other_mines = self._constraint(*other)
+                if other_unknown and 0 <= other_mines <= len(other_unknown):
+                    self._apply_pair(unknown, mines, other_unknown, other_mines)
+    
+    def _overlapping_constraints(self, row: int, col: int, unknown: FrozenSet[Cell]) -> Set[Cell]:
+        """
+        Obtiene los números visibles que comparten alguna celda desconocida con otro.
+        
+        Args:
+            row: Fila de la celda numerada
+            col: Columna de la celda numerada
+            unknown: Celdas desconocidas de su restricción
+        
+        Returns:
+            Conjunto de celdas numeradas vecinas de esas celdas desconocidas
+        """
+        others = set()
+        for cell in unknown:
+            for ni, nj in self.board.get_adjacent_cells(*cell):
+                if self.board.is_visible(ni, nj) and self.board.get_cell_value(ni, nj) > 0:
+                    others.add((ni, nj))
+        others.discard((row, col))
+        return others
+    
+    def _apply_pair(self, first: FrozenSet[Cell], first_mines: int,
+                    second: FrozenSet[Cell], second_mines: int) -> None:
+        """
+        Aplica la regla de pareja a dos restricciones que se solapan.
+        
+        Las minas de la intersección están acotadas por ambas restricciones;
+        con esa cota se deduce cuántas minas quedan fuera de ella en cada una.
+        
+        Args:
+            first: Celdas desconocidas de la primera restricción
+            first_mines: Minas que faltan en la primera restricción
+            second: Celdas desconocidas de la segunda restricción
+            second_mines: Minas que faltan en la segunda restricción
+        """
+        shared = first & second
+        only_first = first - shared
+        only_second = second - shared
+        
+        # Rango posible de minas en la intersección
+        low = max(0, first_mines - len(only_first), second_mines - len(only_second))
+        high = min(len(shared), first_mines, second_mines)
+        
+        for only, mines in ((only_first, first_mines), (only_second, second_mines)):
+            if not only:
+                continue
+            if mines - low == 0:
+                self._deduce(only, ())
+            elif mines - high == len(only):
+                self._deduce((), only)
+    
+    def next_move(self) -> Optional[Tuple[int, int, GameAction]]:
+        """
+        Obtiene el siguiente movimiento seguro, priorizando abrir celdas.
+        
+        Returns:
+            Tupla (fila, columna, acción) o None si no hay deducciones disponibles
+        """
+        self.update()
+        if self.safe_cells:
+            row, col = min(self.safe_cells)
+            return row, col, GameAction.OPEN
+        if self.mine_cells:
+            row, col = min(self.mine_cells)
+            return row, col, GameAction.MARK
+        return None
+    
+    def get_constraints(self) -> Dict[Cell, Tuple[FrozenSet[Cell], int]]:
+        """
+        Obtiene las restricciones activas de la frontera.
+        
+        Las celdas ya deducidas no aparecen como desconocidas (ver _constraint).
+        
+        Returns:
+            Diccionario {celda numerada: (celdas desconocidas, minas que faltan)}
+        """
+        numbered = set()
+        for cell in self.frontier:
+            for ni, nj in self.board.get_adjacent_cells(*cell):
+                if self.board.is_visible(ni, nj) and self.board.get_cell_value(ni, nj) > 0:
+                    numbered.add((ni, nj))
+        
+        constraints = {}
+        for row, col in numbered:
+            unknown, mines = self._constraint(row, col)
+            if unknown:
+                constraints[(row, col)] = (unknown, mines)
+        return constraints
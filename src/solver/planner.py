@@ -0,0 +1,535 @@
+"""
+Planificador Monte Carlo para elegir la celda a abrir cuando no hay deducciones.
+"""
+
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+import numpy as np
+
+from src.game.board import Board, count_adjacent_mines
+from src.game.neighbors import NeighborTable, get_neighbor_table
+from src.solver.constraint_solver import Cell
+from src.solver.probability import Component, SearchBudgetExceeded, binomial, convolve, split_components
+from src.utils.profiling import profiled
+
+
+def _enumerate_solutions(component: Component, max_nodes: int) -> Optional[Dict[int, List[List[int]]]]:
+    """
+    Enumera las soluciones de una componente agrupadas por número de minas.
+    
+    Args:
+        component: Componente de la frontera
+        max_nodes: Nodos máximos de la búsqueda
+    
+    Returns:
+        Diccionario {minas: asignaciones}, o None si se supera max_nodes
+    """
+    solutions: Dict[int, List[List[int]]] = {}
+    
+    def record(assignment: List[int], mines: int) -> bool:
+        solutions.setdefault(mines, []).append(list(assignment))
+        return False
+    
+    try:
+        component.search(record, max_nodes)
+    except SearchBudgetExceeded:
+        return None
+    return solutions
+
+
+def _random_solution(component: Component, max_nodes: int, rng: random.Random) -> np.ndarray:
+    """
+    Obtiene una solución de una componente con una búsqueda de orden aleatorio.
+    
+    Args:
+        component: Componente de la frontera
+        max_nodes: Nodos máximos de la búsqueda
+        rng: Generador aleatorio
+    
+    Returns:
+        Array booleano con la asignación de cada celda de la componente
+    
+    Raises:
+        SearchBudgetExceeded: Si no se encuentra ninguna solución a tiempo
+    """
+    found: List[List[int]] = []
+    
+    def record(assignment: List[int], mines: int) -> bool:
+        found.append(list(assignment))
+        return True
+    
+    component.search(record, max_nodes, rng=rng)
+    if not found:
+        raise SearchBudgetExceeded()
+    return np.array(found[0], dtype=bool)
+
+
+def _open_cells(table: NeighborTable, numbers: np.ndarray, mines: np.ndarray, visible: np.ndarray,
+                known: np.ndarray, cells: np.ndarray) -> int:
+    """
+    Abre celdas seguras expandiendo los ceros por capas, como el flood fill del juego.
+    
+    Args:
+        table: Tabla de vecinos del tablero
+        numbers: Número de minas vecinas de cada celda (array plano)
+        mines: Colocación de minas supuesta (array plano booleano)
+        visible: Celdas abiertas (se modifica en el sitio)
+        known: Celdas marcadas o deducidas como mina (no se abren)
+        cells: Índices planos de las celdas a abrir
+    
+    Returns:
+        Número de celdas abiertas
+    """
+    cells = cells[~visible[cells] & ~known[cells] & ~mines[cells]]
+    opened = 0
+    while len(cells):
+        visible[cells] = True
+        opened += len(cells)
+        zeros = cells[numbers[cells] == 0]
+        if not len(zeros):
+            break
+        cells = table.neighbors_of(zeros)
+        cells = cells[~visible[cells] & ~known[cells]]
+    return opened
+
+
+def _progress(table: NeighborTable, numbers: np.ndarray, mines: np.ndarray, visible: np.ndarray,
+              known: np.ndarray, start: int) -> int:
+    """
+    Cuenta las celdas seguras que desbloquea abrir una celda en una colocación supuesta.
+    
+    Abre la celda y aplica la regla de punto único sobre todo el tablero de
+    forma vectorizada hasta que no se deduce nada más.
+    
+    Args:
+        table: Tabla de vecinos del tablero
+        numbers: Número de minas vecinas de cada celda
+        mines: Colocación de minas supuesta
+        visible: Celdas abiertas antes de la jugada
+        known: Celdas marcadas antes de la jugada
+        start: Índice plano de la celda abierta (segura en esta colocación)
+    
+    Returns:
+        Celdas abiertas por la jugada y por las deducciones que permite
+    """
+    visible = visible.copy()
+    known = known.copy()
+    opened = _open_cells(table, numbers, mines, visible, known, np.array([start]))
+    while True:
+        unknown = ~visible & ~known
+        clues = visible & (numbers > 0)
+        remaining = numbers - table.neighbor_sum(known)
+        unknown_count = table.neighbor_sum(unknown)
+        safe_clues = np.flatnonzero(clues & (remaining == 0) & (unknown_count > 0))
+        mine_clues = np.flatnonzero(clues & (remaining == unknown_count) & (unknown_count > 0))
+        if not len(safe_clues) and not len(mine_clues):
+            return opened
+        if len(mine_clues):
+            new_mines = table.neighbors_of(mine_clues)
+            known[new_mines[unknown[new_mines]]] = True
+        if len(safe_clues):
+            safe = table.neighbors_of(safe_clues)
+            opened += _open_cells(table, numbers, mines, visible, known, safe[unknown[safe]])
+
+
+def rollout_batch(rows: int, columns: int, state: np.ndarray, layouts: np.ndarray,
+                  candidates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evalúa cada celda candidata en cada colocación de minas muestreada.
+    
+    Función de nivel de módulo para poder ejecutarla en un pool de procesos.
+    
+    Args:
+        rows: Número de filas del tablero
+        columns: Número de columnas del tablero
+        state: Observación plana del tablero (constantes de Board)
+        layouts: Matriz booleana (colocaciones, celdas) de minas supuestas
+        candidates: Índices planos de las celdas candidatas
+    
+    Returns:
+        Tupla (veces que cada candidata es segura, suma de celdas desbloqueadas)
+    """
+    table = get_neighbor_table(rows, columns)
+    visible = state >= 0
+    known = state == Board.MARKED
+    safe_counts = np.zeros(len(candidates), dtype=np.int64)
+    progress = np.zeros(len(candidates), dtype=np.int64)
+    for mines in layouts:
+        numbers = count_adjacent_mines(mines.reshape(rows, columns)).ravel()
+        for k, cell in enumerate(candidates):
+            if mines[cell]:
+                continue
+            safe_counts[k] += 1
+            progress[k] += _progress(table, numbers, mines, visible, known, int(cell))
+    return safe_counts, progress
+
+
+class MonteCarloPlanner:
+    """
+    Elige la celda a abrir cuando no quedan deducciones seguras.
+    
+    Muestrea de forma uniforme colocaciones de minas coherentes con la
+    observación (con la misma descomposición en componentes que
+    ProbabilityEngine; las componentes enormes se aproximan con búsquedas de
+    orden aleatorio). Después
+    simula abrir cada candidata en cada colocación y mide cuántas celdas
+    seguras desbloquea (la propia celda, su flood fill y lo que la regla de
+    punto único deduce a continuación). Se elige, entre las candidatas cuya
+    probabilidad estimada de ser segura está a menos de tolerance de la
+    mejor, la que más progreso desbloquea.
+    
+    Las colocaciones muestreadas se guardan entre jugadas y se reutilizan
+    mientras sigan siendo coherentes con la observación, así que en una
+    misma partida cada jugada solo muestrea las que faltan. Se descartan
+    cuando la observación no continúa la anterior (otra partida); reset las
+    descarta explícitamente al empezar una partida nueva. Las simulaciones
+    se reparten en un pool de procesos (que se mantiene abierto hasta close),
+    con un bloque en curso por proceso, y se detienen al agotar time_budget.
+    """
+    
+    def __init__(self, num_samples: int = 100, time_budget: float = 0.2, max_candidates: int = 8,
+                 tolerance: float = 0.02, workers: int = 1, chunk_size: int = 25,
+                 max_nodes: int = 20_000, seed: Optional[int] = None):
+        """
+        Inicializa el planificador.
+        
+        Args:
+            num_samples: Colocaciones de minas por decisión
+            time_budget: Tiempo máximo (segundos) por decisión
+            max_candidates: Candidatas simuladas (las más seguras según las muestras)
+            tolerance: Diferencia de probabilidad de ser segura que se cambia por progreso
+            workers: Procesos para las simulaciones (1 las ejecuta en este proceso)
+            chunk_size: Colocaciones enviadas a la vez a cada proceso
+            max_nodes: Nodos máximos de la búsqueda de cada componente por muestra
+            seed: Semilla del muestreo
+        """
+        self.num_samples = num_samples
+        self.time_budget = time_budget
+        self.max_candidates = max_candidates
+        self.tolerance = tolerance
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.max_nodes = max_nodes
+        self.rng = random.Random(seed)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        
+        # Colocaciones guardadas entre jugadas: (filas, columnas, minas), matriz
+        # (colocaciones, celdas) y observación plana con la que se usaron
+        self._cache_key: Optional[Tuple[int, int, int]] = None
+        self._cache = np.zeros((0, 0), dtype=bool)
+        self._cache_state: Optional[np.ndarray] = None
+    
+    def reset(self) -> None:
+        """Descarta las colocaciones guardadas (llamar al empezar otra partida)."""
+        self._cache_key = None
+        self._cache = np.zeros((0, 0), dtype=bool)
+        self._cache_state = None
+    
+    def close(self) -> None:
+        """Cierra el pool de procesos si se había creado."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+    
+    def __enter__(self) -> 'MonteCarloPlanner':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _constraints(self, state: np.ndarray, table: NeighborTable) -> List[Tuple[FrozenSet[Cell], int]]:
+        """
+        Extrae las restricciones de los números visibles de la observación.
+        
+        Args:
+            state: Observación plana del tablero
+            table: Tabla de vecinos del tablero
+        
+        Returns:
+            Lista de (celdas ocultas sin marcar vecinas, minas que faltan entre ellas)
+        """
+        hidden = state == Board.HIDDEN
+        marked = state == Board.MARKED
+        clues = np.flatnonzero((state >= 0) & (table.neighbor_sum(hidden) > 0))
+        marked_around = table.neighbor_sum(marked)
+        columns = table.columns
+        constraints = []
+        for index in clues.tolist():
+            neighbors = table.adjacent_indices(index)
+            unknown = frozenset(divmod(int(n), columns) for n in neighbors[hidden[neighbors]])
+            constraints.append((unknown, int(state[index] - marked_around[index])))
+        return constraints
+    
+    def _sample_layouts(self, state: np.ndarray, num_mines: int, table: NeighborTable,
+                        count: int, deadline: float) -> np.ndarray:
+        """
+        Muestrea colocaciones de minas coherentes con la observación.
+        
+        Las componentes de la frontera que se pueden enumerar se muestrean de
+        forma exacta: el número de minas de cada una se elige con el peso de
+        sus soluciones por las formas de repartir el resto por el interior,
+        y después una de sus soluciones con ese número de minas. Las que
+        superan max_nodes se resuelven con una búsqueda de orden aleatorio.
+        
+        Args:
+            state: Observación plana del tablero
+            num_mines: Minas totales del tablero
+            table: Tabla de vecinos del tablero
+            count: Colocaciones a muestrear
+            deadline: Instante (time.perf_counter) en que dejar de muestrear
+        
+        Returns:
+            Matriz booleana (colocaciones, celdas); puede tener menos de count filas
+        """
+        columns = table.columns
+        exact, inexact = [], []
+        for component in split_components(self._constraints(state, table)):
+            cells = np.array([row * columns + col for row, col in component.cells], dtype=np.int64)
+            solutions = _enumerate_solutions(component, self.max_nodes)
+            if solutions is None:
+                inexact.append((component, cells))
+            else:
+                exact.append((cells, {k: np.array(found, dtype=bool) for k, found in solutions.items()}))
+        
+        # suffix[i]: distribución {minas: soluciones} de las componentes exactas i, i+1, ...
+        suffix: List[Dict[int, int]] = [{0: 1}]
+        for _, solutions in reversed(exact):
+            suffix.insert(0, convolve(suffix[0], {k: len(found) for k, found in solutions.items()}))
+        
+        frontier = np.zeros(len(state), dtype=bool)
+        for cells, _ in exact:
+            frontier[cells] = True
+        for _, cells in inexact:
+            frontier[cells] = True
+        marked = state == Board.MARKED
+        interior = np.flatnonzero((state == Board.HIDDEN) & ~frontier)
+        base_mines = num_mines - int(np.count_nonzero(marked))
+        
+        def ways(i: int, remaining: int) -> int:
+            # Formas de completar el tablero con las componentes exactas i, ... y el interior
+            return sum(w * binomial(len(interior), remaining - k) for k, w in suffix[i].items())
+        
+        layouts = []
+        attempts = 0
+        while len(layouts) < count and attempts < 4 * count and time.perf_counter() < deadline:
+            attempts += 1
+            layout = marked.copy()
+            remaining = base_mines
+            
+            # Componentes demasiado grandes: una solución de una búsqueda aleatoria
+            try:
+                for component, cells in inexact:
+                    assignment = _random_solution(component, self.max_nodes, self.rng)
+                    layout[cells[assignment]] = True
+                    remaining -= int(np.count_nonzero(assignment))
+            except SearchBudgetExceeded:
+                continue
+            if ways(0, remaining) == 0:
+                continue
+            
+            # Componentes exactas: número de minas y solución en proporción a sus formas
+            for i, (cells, solutions) in enumerate(exact):
+                options = [(k, len(found) * ways(i + 1, remaining - k)) for k, found in solutions.items()]
+                pick = self.rng.randrange(sum(weight for _, weight in options))
+                for k, weight in options:
+                    if pick < weight:
+                        break
+                    pick -= weight
+                found = solutions[k]
+                layout[cells[found[self.rng.randrange(len(found))]]] = True
+                remaining -= k
+            
+            layout[self.rng.sample(interior.tolist(), remaining)] = True
+            layouts.append(layout)
+        if not layouts:
+            return np.zeros((0, len(state)), dtype=bool)
+        return np.array(layouts)
+    
+    def _consistent(self, layouts: np.ndarray, state: np.ndarray, rows: int, columns: int) -> np.ndarray:
+        """
+        Comprueba qué colocaciones guardadas siguen siendo coherentes con la observación.
+        
+        Args:
+            layouts: Matriz booleana (colocaciones, celdas)
+            state: Observación plana del tablero
+            rows: Número de filas
+            columns: Número de columnas
+        
+        Returns:
+            Array booleano con True en las colocaciones válidas
+        """
+        if not len(layouts):
+            return np.zeros(0, dtype=bool)
+        opened = state >= 0
+        counts = count_adjacent_mines(layouts.reshape(-1, rows, columns)).reshape(len(layouts), -1)
+        valid = ~layouts[:, opened].any(axis=1)
+        valid &= (counts[:, opened] == state[opened]).all(axis=1)
+        valid &= layouts[:, state == Board.MARKED].all(axis=1)
+        return valid
+    
+    @staticmethod
+    def _extends(previous: Optional[np.ndarray], state: np.ndarray) -> bool:
+        """
+        Comprueba si una observación continúa la partida de otra anterior.
+        
+        Args:
+            previous: Observación plana de la decisión anterior (None si no hay)
+            state: Observación plana actual
+        
+        Returns:
+            True si ninguna celda visible o marcada en previous ha cambiado
+        """
+        if previous is None or previous.shape != state.shape:
+            return False
+        known = previous != Board.HIDDEN
+        return bool(np.array_equal(previous[known], state[known]))
+    
+    def _layouts(self, state: np.ndarray, num_mines: int, rows: int, columns: int,
+                 deadline: float) -> np.ndarray:
+        """
+        Obtiene las colocaciones de la decisión reutilizando las guardadas que siguen valiendo.
+        
+        Args:
+            state: Observación plana del tablero
+            num_mines: Minas totales del tablero
+            rows: Número de filas
+            columns: Número de columnas
+            deadline: Instante en que dejar de muestrear
+        
+        Returns:
+            Matriz booleana (colocaciones, celdas)
+        """
+        key = (rows, columns, num_mines)
+        previous = self._cache_state
+        # La observación continúa la anterior si las celdas que ya se conocían
+        # (números visibles y marcas) siguen igual; si no, es otra partida
+        if key != self._cache_key or not self._extends(previous, state):
+            self._cache_key = key
+            self._cache = np.zeros((0, rows * columns), dtype=bool)
+        self._cache_state = state.copy()
+        cached = self._cache[self._consistent(self._cache, state, rows, columns)]
+        
+        missing = self.num_samples - len(cached)
+        if missing > 0:
+            table = get_neighbor_table(rows, columns)
+            fresh = self._sample_layouts(state, num_mines, table, missing, deadline)
+            cached = np.concatenate([cached, fresh])
+        self._cache = cached
+        return cached[:self.num_samples]
+    
+    def _run_rollouts(self, rows: int, columns: int, state: np.ndarray, layouts: np.ndarray,
+                      candidates: np.ndarray, deadline: float) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Ejecuta las simulaciones por bloques de colocaciones hasta el límite de tiempo.
+        
+        Args:
+            rows: Número de filas
+            columns: Número de columnas
+            state: Observación plana del tablero
+            layouts: Colocaciones de minas
+            candidates: Índices planos de las candidatas
+            deadline: Instante en que dejar de simular
+        
+        Returns:
+            Tupla (veces segura, celdas desbloqueadas, colocaciones evaluadas)
+        """
+        safe = np.zeros(len(candidates), dtype=np.int64)
+        progress = np.zeros(len(candidates), dtype=np.int64)
+        evaluated = 0
+        chunks = [layouts[i:i + self.chunk_size] for i in range(0, len(layouts), self.chunk_size)]
+        
+        if self.workers <= 1:
+            for chunk in chunks:
+                chunk_safe, chunk_progress = rollout_batch(rows, columns, state, chunk, candidates)
+                safe += chunk_safe
+                progress += chunk_progress
+                evaluated += len(chunk)
+                if time.perf_counter() > deadline:
+                    break
+            return safe, progress, evaluated
+        
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        
+        # Como mucho un bloque en curso por proceso: los bloques que ya se
+        # están ejecutando no se pueden cancelar, y al vencer el plazo solo
+        # esos pocos retrasan la siguiente decisión
+        remaining = iter(chunks)
+        pending: Dict[Future, int] = {}
+        
+        def submit_next() -> None:
+            chunk = next(remaining, None)
+            if chunk is not None:
+                pending[self._pool.submit(rollout_batch, rows, columns, state, chunk, candidates)] = len(chunk)
+        
+        for _ in range(self.workers):
+            submit_next()
+        while pending:
+            done, _ = wait(pending, timeout=max(0.0, deadline - time.perf_counter()),
+                           return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                chunk_safe, chunk_progress = future.result()
+                safe += chunk_safe
+                progress += chunk_progress
+                evaluated += pending.pop(future)
+                if time.perf_counter() < deadline:
+                    submit_next()
+        for future in pending:
+            future.cancel()
+        return safe, progress, evaluated
+    
+    def evaluate(self, state: np.ndarray, num_mines: int) -> Dict[Cell, Tuple[float, float]]:
+        """
+        Estima, para las candidatas más seguras, su probabilidad de ser segura y su progreso.
+        
+        Args:
+            state: Observación (filas, columnas) con las constantes de Board
+            num_mines: Minas totales del tablero
+        
+        Returns:
+            Diccionario {celda: (probabilidad de ser segura, celdas desbloqueadas
+            de media cuando es segura)}; vacío si no se pudo muestrear ninguna
+            colocación coherente
+        """
+        deadline = time.perf_counter() + self.time_budget
+        rows, columns = state.shape
+        flat = np.ascontiguousarray(state).ravel()
+        
+        # La mitad del presupuesto como máximo para muestrear
+        layouts = self._layouts(flat, num_mines, rows, columns, deadline - self.time_budget / 2)
+        hidden = np.flatnonzero(flat == Board.HIDDEN)
+        if not len(layouts) or not len(hidden):
+            return {}
+        
+        # Las candidatas más seguras según las muestras
+        mine_rate = layouts[:, hidden].mean(axis=0)
+        candidates = hidden[np.argsort(mine_rate, kind='stable')[:self.max_candidates]]
+        
+        safe, progress, evaluated = self._run_rollouts(rows, columns, flat, layouts, candidates, deadline)
+        if not evaluated:
+            return {}
+        return {divmod(int(cell), columns): (safe[k] / evaluated, progress[k] / max(1, safe[k]))
+                for k, cell in enumerate(candidates)}
+    
+    @profiled("planner")
+    def choose(self, state: np.ndarray, num_mines: int) -> Optional[Cell]:
+        """
+        Elige la celda a abrir.
+        
+        Args:
+            state: Observación (filas, columnas) con las constantes de Board
+            num_mines: Minas totales del tablero
+        
+        Returns:
+            Celda (fila, columna) elegida, o None si no hay información suficiente
+        """
+        scores = self.evaluate(state, num_mines)
+        if not scores:
+            return None
+        best_safety = max(safety for safety, _ in scores.values())
+        contenders = {cell: score for cell, score in scores.items() if score[0] >= best_safety - self.tolerance}
+        return max(contenders, key=lambda cell: (contenders[cell][1], contenders[cell][0]))
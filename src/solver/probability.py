@@ -0,0 +1,380 @@
+"""
+Cálculo exacto de la probabilidad de mina de cada celda.
+"""
+
+import math
+import random
+import time
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from src.solver.constraint_solver import Cell, ConstraintSolver
+from src.utils.profiling import profiled
+
+
+@lru_cache(maxsize=65536)
+def binomial(n: int, k: int) -> int:
+    """
+    Coeficiente binomial memoizado (0 fuera de rango).
+    
+    Args:
+        n: Número de elementos
+        k: Número de elementos elegidos
+    
+    Returns:
+        Número de combinaciones C(n, k) como entero exacto
+    """
+    if k < 0 or k > n:
+        return 0
+    return math.comb(n, k)
+
+
+def convolve(first: Dict[int, int], second: Dict[int, int]) -> Dict[int, int]:
+    """
+    Convoluciona dos distribuciones {minas: formas}.
+    
+    Args:
+        first: Primera distribución
+        second: Segunda distribución
+    
+    Returns:
+        Distribución del total de minas
+    """
+    result: Dict[int, int] = {}
+    for k1, w1 in first.items():
+        for k2, w2 in second.items():
+            result[k1 + k2] = result.get(k1 + k2, 0) + w1 * w2
+    return result
+
+
+class SearchBudgetExceeded(Exception):
+    """Se ha superado el número máximo de nodos de la enumeración exacta."""
+
+
+class Component:
+    """
+    Componente independiente de la frontera y sus soluciones agrupadas por minas.
+    
+    Atributos:
+        cells: Celdas de la componente
+        weights: {minas: número (o peso) de soluciones con esas minas}
+        cell_weights: {minas: lista con el peso en que cada celda es mina}
+        exact: False si los pesos proceden de muestreo
+        samples: Número de soluciones muestreadas (0 si es exacta)
+    """
+    
+    def __init__(self, cells: List[Cell], constraints: List[Tuple[FrozenSet[Cell], int]]):
+        self.cells = cells
+        index = {cell: i for i, cell in enumerate(cells)}
+        self.constraints = [([index[cell] for cell in unknown], mines) for unknown, mines in constraints]
+        self.cell_constraints: List[List[int]] = [[] for _ in cells]
+        for c, (members, _) in enumerate(self.constraints):
+            for i in members:
+                self.cell_constraints[i].append(c)
+        self.weights: Dict[int, int] = {}
+        self.cell_weights: Dict[int, List[int]] = {}
+        self.exact = True
+        self.samples = 0
+    
+    def search(self, on_solution: Callable[[List[int], int], bool], max_nodes: int,
+               rng: Optional[random.Random] = None) -> None:
+        """
+        Recorre en profundidad (con pila explícita) las asignaciones válidas.
+        
+        Args:
+            on_solution: Función llamada con (asignación, minas) en cada
+                solución; si devuelve True la búsqueda se detiene
+            max_nodes: Número máximo de nodos a visitar
+            rng: Si se indica, el orden de los valores se elige al azar
+        
+        Raises:
+            SearchBudgetExceeded: Si se visitan más de max_nodes nodos
+        """
+        n = len(self.cells)
+        need = [mines for _, mines in self.constraints]
+        free = [len(members) for members, _ in self.constraints]
+        assignment = [0] * n
+        pending: List[List[int]] = [[] for _ in range(n)]
+        applied = [False] * n
+        nodes = 0
+        mines = 0
+        
+        def values() -> List[int]:
+            if rng is not None and rng.random() < 0.5:
+                return [0, 1]
+            return [1, 0]
+        
+        pos = 0
+        pending[0] = values()
+        while pos >= 0:
+            if applied[pos]:
+                # Deshacer el valor anterior de esta celda
+                value = assignment[pos]
+                for c in self.cell_constraints[pos]:
+                    need[c] += value
+                    free[c] += 1
+                mines -= value
+                assignment[pos] = 0
+                applied[pos] = False
+            if not pending[pos]:
+                pos -= 1
+                continue
+            
+            value = pending[pos].pop()
+            nodes += 1
+            if nodes > max_nodes:
+                raise SearchBudgetExceeded()
+            
+            feasible = True
+            for c in self.cell_constraints[pos]:
+                need[c] -= value
+                free[c] -= 1
+                if need[c] < 0 or need[c] > free[c]:
+                    feasible = False
+            assignment[pos] = value
+            mines += value
+            applied[pos] = True
+            if not feasible:
+                continue
+            
+            if pos == n - 1:
+                if on_solution(assignment, mines):
+                    return
+                continue
+            pos += 1
+            pending[pos] = values()
+    
+    def enumerate(self, max_nodes: int) -> None:
+        """
+        Enumera todas las soluciones de la componente.
+        
+        Args:
+            max_nodes: Número máximo de nodos a visitar
+        
+        Raises:
+            SearchBudgetExceeded: Si la componente es demasiado grande
+        """
+        def record(assignment: List[int], mines: int) -> bool:
+            self.weights[mines] = self.weights.get(mines, 0) + 1
+            counts = self.cell_weights.setdefault(mines, [0] * len(assignment))
+            for i, value in enumerate(assignment):
+                counts[i] += value
+            return False
+        
+        self.search(record, max_nodes)
+    
+    def sample(self, num_samples: int, max_nodes: int, deadline: float, rng: random.Random,
+               min_samples: int = 1) -> None:
+        """
+        Aproxima los pesos con soluciones obtenidas por búsquedas aleatorias.
+        
+        Cada muestra es la primera solución de una búsqueda con el orden de
+        valores al azar. No es un muestreo uniforme, pero acota el tiempo en
+        componentes enormes donde la enumeración exacta es inviable.
+        
+        Args:
+            num_samples: Número máximo de muestras
+            max_nodes: Nodos máximos por muestra
+            deadline: Instante (time.perf_counter) en que dejar de muestrear
+            rng: Generador aleatorio
+            min_samples: Muestras que se toman aunque se haya pasado deadline
+        """
+        self.exact = False
+        self.samples = 0
+        self.weights.clear()
+        self.cell_weights.clear()
+        
+        def record(assignment: List[int], mines: int) -> bool:
+            self.samples += 1
+            self.weights[mines] = self.weights.get(mines, 0) + 1
+            counts = self.cell_weights.setdefault(mines, [0] * len(assignment))
+            for i, value in enumerate(assignment):
+                counts[i] += value
+            return True
+        
+        for _ in range(num_samples):
+            try:
+                self.search(record, max_nodes, rng=rng)
+            except SearchBudgetExceeded:
+                pass
+            if self.samples >= min_samples and time.perf_counter() > deadline:
+                break
+
+
+def split_components(constraints: List[Tuple[FrozenSet[Cell], int]]) -> List[Component]:
+    """
+    Agrupa las restricciones en componentes independientes.
+    
+    Args:
+        constraints: Lista de (celdas desconocidas, minas que faltan)
+    
+    Returns:
+        Lista de componentes con las celdas en orden de recorrido
+    """
+    by_cell: Dict[Cell, List[int]] = {}
+    for c, (unknown, _) in enumerate(constraints):
+        for cell in unknown:
+            by_cell.setdefault(cell, []).append(c)
+    
+    components = []
+    seen_constraints = set()
+    for start in range(len(constraints)):
+        if start in seen_constraints:
+            continue
+        # Recorrido en anchura: las celdas quedan ordenadas para podar pronto
+        cells: List[Cell] = []
+        members = []
+        seen_cells = set()
+        queue = [start]
+        seen_constraints.add(start)
+        while queue:
+            c = queue.pop(0)
+            members.append(constraints[c])
+            for cell in sorted(constraints[c][0]):
+                if cell in seen_cells:
+                    continue
+                seen_cells.add(cell)
+                cells.append(cell)
+                for other in by_cell[cell]:
+                    if other not in seen_constraints:
+                        seen_constraints.add(other)
+                        queue.append(other)
+        components.append(Component(cells, members))
+    return components
+
+
+class ProbabilityEngine:
+    """
+    Motor de probabilidad exacta de mina para las celdas desconocidas.
+    
+    Divide la frontera en componentes independientes (restricciones que no
+    comparten celdas), enumera las soluciones de cada una por separado
+    agrupándolas por número de minas y las combina con el número global de
+    minas restantes: una combinación con K minas en la frontera pesa
+    C(celdas interiores, minas restantes - K). Las componentes que superan el
+    presupuesto de la enumeración exacta se aproximan por muestreo; sus
+    probabilidades nunca son exactamente 0 ni 1, porque unas pocas muestras
+    no demuestran que una celda sea segura o mina.
+    """
+    
+    def __init__(self, max_exact_nodes: int = 50_000, num_samples: int = 200,
+                 time_budget: float = 0.02, rng: Optional[random.Random] = None,
+                 min_samples: int = 20):
+        """
+        Inicializa el motor de probabilidad.
+        
+        Args:
+            max_exact_nodes: Nodos máximos de la enumeración exacta por componente
+            num_samples: Muestras por componente cuando se supera el presupuesto
+            time_budget: Tiempo máximo (segundos) de muestreo de cada componente,
+                contado desde que empieza a muestrearse
+            rng: Generador aleatorio para el muestreo
+            min_samples: Muestras mínimas por componente aunque se agote time_budget
+        """
+        self.max_exact_nodes = max_exact_nodes
+        self.num_samples = num_samples
+        self.time_budget = time_budget
+        self.min_samples = min_samples
+        self.rng = rng if rng is not None else random.Random()
+    
+    @profiled("probability")
+    def compute(self, solver: ConstraintSolver) -> Tuple[Dict[Cell, float], float]:
+        """
+        Calcula la probabilidad de mina de las celdas desconocidas.
+        
+        Args:
+            solver: Solucionador actualizado de la partida
+        
+        Returns:
+            Tupla (probabilidades de la frontera, probabilidad de una celda
+            interior), donde las celdas deducidas por el solucionador tienen
+            probabilidad 0 o 1
+        """
+        solver.update()
+        board = solver.board
+        constraints = list(solver.get_constraints().values())
+        components = split_components(constraints)
+        
+        for component in components:
+            try:
+                component.enumerate(self.max_exact_nodes)
+            except SearchBudgetExceeded:
+                # El presupuesto empieza al muestrear esta componente: la
+                # enumeración de las anteriores no puede dejarla sin muestras
+                nodes_per_sample = max(1000, self.max_exact_nodes // self.num_samples)
+                deadline = time.perf_counter() + self.time_budget
+                component.sample(self.num_samples, nodes_per_sample, deadline, self.rng, self.min_samples)
+        
+        # Celdas interiores (ocultas, sin marcar y fuera de la frontera) y minas restantes
+        frontier_cells = sum(len(component.cells) for component in components)
+        deduced = len(solver.safe_cells) + len(solver.mine_cells)
+        interior = board.get_hidden_count() - frontier_cells - deduced
+        remaining = board.get_remaining_mines() - len(solver.mine_cells)
+        
+        probabilities: Dict[Cell, float] = {cell: 0.0 for cell in solver.safe_cells}
+        probabilities.update({cell: 1.0 for cell in solver.mine_cells})
+        
+        # Distribución del total de minas de la frontera
+        total: Dict[int, int] = {0: 1}
+        for component in components:
+            total = convolve(total, component.weights)
+        normalizer = sum(ways * binomial(interior, remaining - k) for k, ways in total.items())
+        
+        if normalizer == 0:
+            # Posición incoherente (por ejemplo, marcas erróneas): densidad uniforme
+            density = min(1.0, max(0.0, remaining / max(1, interior + frontier_cells)))
+            for component in components:
+                probabilities.update({cell: density for cell in component.cells})
+            return probabilities, density
+        
+        for c, component in enumerate(components):
+            others: Dict[int, int] = {0: 1}
+            for o, other in enumerate(components):
+                if o != c:
+                    others = convolve(others, other.weights)
+            
+            totals = [0] * len(component.cells)
+            for k, counts in component.cell_weights.items():
+                weight = sum(ways * binomial(interior, remaining - k - j) for j, ways in others.items())
+                if weight:
+                    for i, count in enumerate(counts):
+                        totals[i] += count * weight
+            if component.exact:
+                for cell, value in zip(component.cells, totals):
+                    probabilities[cell] = value / normalizer
+            else:
+                # Frecuencias muestreadas: acotar como con una muestra más de cada valor
+                margin = 1 / (component.samples + 2)
+                for cell, value in zip(component.cells, totals):
+                    probabilities[cell] = min(max(value / normalizer, margin), 1 - margin)
+        
+        interior_probability = 0.0
+        if interior > 0:
+            mines_inside = sum(ways * binomial(interior - 1, remaining - k - 1) for k, ways in total.items())
+            interior_probability = mines_inside / normalizer
+        
+        return probabilities, interior_probability
+    
+    def safest_cell(self, solver: ConstraintSolver) -> Optional[Cell]:
+        """
+        Obtiene la celda desconocida con menor probabilidad de mina.
+        
+        Args:
+            solver: Solucionador actualizado de la partida
+        
+        Returns:
+            Celda (fila, columna) más segura, o None si no quedan celdas
+        """
+        probabilities, interior_probability = self.compute(solver)
+        candidates = {cell: p for cell, p in probabilities.items() if cell not in solver.mine_cells}
+        best = min(candidates, key=candidates.get) if candidates else None
+        
+        if best is None or interior_probability < candidates[best]:
+            board = solver.board
+            for row in range(board.rows):
+                for col in range(board.columns):
+                    cell = (row, col)
+                    if (not board.is_visible(row, col) and not board.is_marked(row, col)
+                            and cell not in solver.frontier):
+                        return cell
+        return best
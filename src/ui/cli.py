@@ -153,22 +153,23 @@ class CLI:
         print("Juego terminado.")
         
     @staticmethod
-    def play_demo_game(difficulty: str = "beginner") -> None:
+    def play_demo_game(difficulty: str = "beginner", safe_first_click: bool = False) -> None:
         """
         Inicia un juego de demostración con la dificultad especificada.
         
         Args:
             difficulty: Nivel de dificultad ("beginner", "intermediate", "expert")
+            safe_first_click: Si es True, la primera celda abierta nunca es una mina
         """
         if difficulty.lower() == "beginner":
-            game = Minesweeper.create_beginner_game()
+            game = Minesweeper.create_beginner_game(safe_first_click=safe_first_click)
         elif difficulty.lower() == "intermediate":
-            game = Minesweeper.create_intermediate_game()
+            game = Minesweeper.create_intermediate_game(safe_first_click=safe_first_click)
         elif difficulty.lower() == "expert":
-            game = Minesweeper.create_expert_game()
+            game = Minesweeper.create_expert_game(safe_first_click=safe_first_click)
         else:
             print(f"Dificultad '{difficulty}' no reconocida. Usando nivel principiante.")
-            game = Minesweeper.create_beginner_game()
+            game = Minesweeper.create_beginner_game(safe_first_click=safe_first_click)
         
         cli = CLI(game)
         cli.play_game() 
\ No newline at end of file
@@ -0,0 +1,212 @@
+"""
+Renderizado sin matplotlib de tableros a imágenes RGB de NumPy, para vídeos y vistas previas.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+
+from src.game.board import Board
+from src.game.journal import GameRecord, GameReplay
+from src.game.minesweeper import Minesweeper
+from src.utils.visualization import BoardVisualizer, MARKED_CODE, MINE_CODE, NUM_CODES, cell_codes, display_state
+
+
+# Glifos de 5x7 píxeles de los números y de los símbolos de marca y mina
+_GLYPHS: Dict[int, Tuple[str, ...]] = {
+    1: ("..#..", ".##..", "..#..", "..#..", "..#..", "..#..", ".###."),
+    2: (".###.", "#...#", "....#", "...#.", "..#..", ".#...", "#####"),
+    3: ("####.", "....#", "....#", ".###.", "....#", "....#", "####."),
+    4: ("...#.", "..##.", ".#.#.", "#..#.", "#####", "...#.", "...#."),
+    5: ("#####", "#....", "####.", "....#", "....#", "#...#", ".###."),
+    6: ("..##.", ".#...", "#....", "####.", "#...#", "#...#", ".###."),
+    7: ("#####", "....#", "...#.", "..#..", ".#...", ".#...", ".#..."),
+    8: (".###.", "#...#", "#...#", ".###.", "#...#", "#...#", ".###."),
+    MARKED_CODE: (".##..", ".###.", ".####", ".###.", ".#...", ".#...", "####."),
+    MINE_CODE: ("..#..", "#.#.#", ".###.", "#####", ".###.", "#.#.#", "..#.."),
+}
+
+# Opacidad de las celdas en BoardVisualizer (sobre fondo blanco)
+_ALPHA = 0.8
+
+
+def _hex_to_rgb(color: str) -> np.ndarray:
+    """Convierte un color '#RRGGBB' en un array RGB de floats."""
+    return np.array([int(color[i:i + 2], 16) for i in (1, 3, 5)], dtype=np.float64)
+
+
+class FrameRenderer:
+    """
+    Renderizador de observaciones del tablero a arrays RGB uint8.
+    
+    Cada código de celda (ver cell_codes) tiene un tile precalculado de
+    cell_size x cell_size píxeles con los colores de BoardVisualizer.CELL_COLORS,
+    su borde y su glifo. Una imagen es la composición de los tiles indexados
+    por los códigos del tablero, así que un lote de tableros se renderiza
+    con una sola indexación de NumPy, sin matplotlib ni backend gráfico.
+    """
+    
+    def __init__(self, cell_size: int = 16, colors: Optional[Dict] = None):
+        """
+        Precalcula los tiles de las celdas.
+        
+        Args:
+            cell_size: Lado de cada celda en píxeles (los glifos se dibujan
+                desde 9 píxeles; por debajo solo hay colores)
+            colors: Paleta con las claves de BoardVisualizer.CELL_COLORS
+                (None para usar esa)
+        
+        Raises:
+            ValueError: Si cell_size no es positivo
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size debe ser positivo")
+        self.cell_size = cell_size
+        self.colors = dict(BoardVisualizer.CELL_COLORS if colors is None else colors)
+        self.tiles = self._build_tiles()
+        # Filas de píxeles de cada tile como un bloque contiguo (y, x * 3)
+        self._tile_rows = self.tiles.reshape(NUM_CODES, cell_size, cell_size * 3)
+    
+    def _build_tiles(self) -> np.ndarray:
+        """
+        Dibuja el tile de cada código de celda.
+        
+        Returns:
+            Array uint8 (NUM_CODES, cell_size, cell_size, 3)
+        """
+        size = self.cell_size
+        white = np.full(3, 255.0)
+        backgrounds = [self.colors['empty']] * 9 + [self.colors['hidden'], self.colors['marked'], self.colors['mine']]
+        tiles = np.empty((NUM_CODES, size, size, 3), dtype=np.float64)
+        for code, color in enumerate(backgrounds):
+            background = _ALPHA * _hex_to_rgb(color) + (1 - _ALPHA) * white
+            tiles[code] = background
+            
+            # Borde negro semitransparente como el de los rectángulos
+            if size >= 3:
+                border = (1 - _ALPHA) * background
+                tiles[code, [0, -1], :] = border
+                tiles[code, :, [0, -1]] = border
+            
+            glyph = _GLYPHS.get(code)
+            scale = (size - 2) // 7
+            if glyph is None or scale <= 0:
+                continue
+            mask = np.array([[pixel == '#' for pixel in line] for line in glyph])
+            mask = mask.repeat(scale, axis=0).repeat(scale, axis=1)
+            top = (size - mask.shape[0]) // 2
+            left = (size - mask.shape[1]) // 2
+            ink = _hex_to_rgb(self.colors.get(code, '#000000')) if code <= 8 else np.zeros(3)
+            region = tiles[code, top:top + mask.shape[0], left:left + mask.shape[1]]
+            region[mask] = ink
+        return np.rint(tiles).astype(np.uint8)
+    
+    def render_codes(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Compone las imágenes de un lote de tableros ya convertidos a códigos.
+        
+        Args:
+            codes: Array (n, filas, columnas) de códigos de celda
+        
+        Returns:
+            Array uint8 (n, filas * cell_size, columnas * cell_size, 3)
+        """
+        num_boards, rows, columns = codes.shape
+        size = self.cell_size
+        # Copiar los tiles con np.take y reordenar las filas de píxeles en una
+        # segunda copia es más rápido que indexar cada píxel por separado
+        tiles = np.take(self._tile_rows, codes, axis=0)
+        frames = tiles.transpose(0, 1, 3, 2, 4)
+        return frames.reshape(num_boards, rows * size, columns * size, 3)
+    
+    def render_batch(self, states: np.ndarray, shape: Optional[Tuple[int, int]] = None,
+                     marked: int = Board.MARKED, mine: Optional[int] = Board.MINE) -> np.ndarray:
+        """
+        Renderiza un lote de observaciones.
+        
+        Args:
+            states: Array (n, filas, columnas), o (n, celdas) junto con shape
+            shape: Forma (filas, columnas) de las observaciones aplanadas
+            marked: Valor de las celdas marcadas en las observaciones
+            mine: Valor de las minas visibles (None si no se distinguen)
+        
+        Returns:
+            Array uint8 (n, filas * cell_size, columnas * cell_size, 3)
+        """
+        states = np.asarray(states)
+        if shape is not None:
+            states = states.reshape(len(states), *shape)
+        return self.render_codes(cell_codes(states, marked, mine))
+    
+    def render(self, state: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Renderiza una observación.
+        
+        Args:
+            state: Observación (filas, columnas)
+            **kwargs: Argumentos de render_batch (marked, mine)
+        
+        Returns:
+            Array uint8 (filas * cell_size, columnas * cell_size, 3)
+        """
+        return self.render_batch(np.asarray(state)[None], **kwargs)[0]
+    
+    def render_game(self, game: Minesweeper) -> np.ndarray:
+        """
+        Renderiza el estado actual de una partida (con las minas si se ha perdido).
+        
+        Args:
+            game: Instancia de Minesweeper
+        
+        Returns:
+            Array uint8 (filas * cell_size, columnas * cell_size, 3)
+        """
+        return self.render(display_state(game))
+    
+    def render_record(self, record: GameRecord, moves: Optional[Sequence[int]] = None,
+                      checkpoint_interval: int = 32) -> np.ndarray:
+        """
+        Renderiza la secuencia de estados de una partida del diario.
+        
+        Args:
+            record: Partida del diario
+            moves: Números de jugada a renderizar (None para todos, de 0 a len(record))
+            checkpoint_interval: Puntos de control del GameReplay usado
+        
+        Returns:
+            Array uint8 (fotogramas, alto, ancho, 3)
+        """
+        replay = GameReplay(record, checkpoint_interval)
+        states = [display_state(game).copy() for _, game in replay.states(moves)]
+        return self.render_batch(np.stack(states))
+    
+    def render_shard(self, states: np.ndarray, metadata: Dict, marked: int = -2) -> np.ndarray:
+        """
+        Renderiza las observaciones de un fragmento de datos de entrenamiento.
+        
+        Los fragmentos de MineSweeper.py guardan cada observación aplanada,
+        con las celdas marcadas como -2 y la forma del tablero en los
+        metadatos del manifiesto.
+        
+        Args:
+            states: Campo 'state' del fragmento (muestras, celdas)
+            metadata: Metadatos del ShardReader (con 'rows' y 'columns')
+            marked: Valor de las celdas marcadas en las observaciones
+        
+        Returns:
+            Array uint8 (muestras, alto, ancho, 3)
+        """
+        return self.render_batch(states, (metadata['rows'], metadata['columns']), marked=marked, mine=None)
+
+
+def write_ppm(filepath: str, frame: np.ndarray) -> None:
+    """
+    Guarda un fotograma como imagen PPM binaria (sin dependencias).
+    
+    Args:
+        filepath: Ruta del archivo
+        frame: Array uint8 (alto, ancho, 3)
+    """
+    height, width, _ = frame.shape
+    with open(filepath, "wb") as file:
+        file.write(f"P6 {width} {height} 255\n".encode("ascii"))
+        file.write(np.ascontiguousarray(frame, dtype=np.uint8).tobytes())
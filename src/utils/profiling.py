@@ -0,0 +1,263 @@
+"""
+Contadores de tiempo por fase para perfilar el motor y la IA.
+"""
+
+import functools
+import json
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+
+# Generador propio del muestreo por reservorio: no altera el módulo random del juego
+_SAMPLER = random.Random(0)
+
+
+class PhaseStats:
+    """
+    Estadísticas de una fase: llamadas, tiempo acumulado y una muestra de duraciones.
+    
+    La muestra de duraciones se limita a max_samples mediante muestreo por
+    reservorio, así que los percentiles tienen memoria acotada mientras que
+    el número de llamadas y el tiempo total son exactos.
+    """
+    
+    def __init__(self, max_samples: int):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: List[float] = []
+        self.max_samples = max_samples
+    
+    def add(self, seconds: float) -> None:
+        """
+        Registra una duración.
+        
+        Args:
+            seconds: Duración de la llamada en segundos
+        """
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        if len(self.samples) < self.max_samples:
+            self.samples.append(seconds)
+        else:
+            slot = _SAMPLER.randrange(self.count)
+            if slot < self.max_samples:
+                self.samples[slot] = seconds
+
+
+class _NullPhase:
+    """Contexto vacío usado cuando el perfilado está desactivado."""
+    
+    def __enter__(self) -> None:
+        return None
+    
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+class _TimedPhase:
+    """Contexto que mide su duración y la registra en una fase."""
+    
+    __slots__ = ("profiler", "name", "start")
+    
+    def __init__(self, profiler: 'Profiler', name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+    
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+    
+    def __exit__(self, *exc_info) -> None:
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class Profiler:
+    """
+    Perfilador por fases, desactivado por defecto.
+    
+    Las funciones se instrumentan con el decorador profiled(fase) o con el
+    contexto phase(fase). Mientras el perfilador está desactivado, el coste
+    de una función instrumentada es una llamada extra y la comprobación de
+    un atributo, así que solo se instrumentan funciones que tardan bastante
+    más que eso (no los accesos a celdas ni las vistas cacheadas).
+    Activado, registra llamadas, tiempo acumulado y percentiles por fase.
+    
+    Las fases anidadas se miden por separado: el tiempo de una fase incluye
+    el de las fases que se ejecutan dentro de ella.
+    """
+    
+    def __init__(self, max_samples: int = 100_000):
+        """
+        Inicializa el perfilador.
+        
+        Args:
+            max_samples: Duraciones guardadas por fase para los percentiles
+        """
+        self.enabled = False
+        self.max_samples = max_samples
+        self.phases: Dict[str, PhaseStats] = {}
+    
+    def enable(self, reset: bool = True) -> None:
+        """
+        Activa el perfilado.
+        
+        Args:
+            reset: Si es True, descarta las medidas anteriores
+        """
+        if reset:
+            self.reset()
+        self.enabled = True
+    
+    def disable(self) -> None:
+        """Desactiva el perfilado conservando las medidas."""
+        self.enabled = False
+    
+    def reset(self) -> None:
+        """Descarta todas las medidas."""
+        self.phases = {}
+    
+    def record(self, name: str, seconds: float) -> None:
+        """
+        Registra la duración de una llamada a una fase.
+        
+        Args:
+            name: Nombre de la fase
+            seconds: Duración en segundos
+        """
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = PhaseStats(self.max_samples)
+        stats.add(seconds)
+    
+    def phase(self, name: str) -> Any:
+        """
+        Contexto que mide un bloque de código como una fase.
+        
+        Args:
+            name: Nombre de la fase
+        
+        Returns:
+            Gestor de contexto (vacío si el perfilado está desactivado)
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        return _TimedPhase(self, name)
+    
+    def profiled(self, name: str) -> Callable[[Callable], Callable]:
+        """
+        Decorador que mide cada llamada a una función como una fase.
+        
+        Args:
+            name: Nombre de la fase
+        
+        Returns:
+            Decorador
+        """
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+    
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Resume las medidas de cada fase.
+        
+        Returns:
+            Diccionario {fase: {calls, total_s, mean_ms, p50_ms, p90_ms,
+            p99_ms, max_ms}} ordenado por tiempo total descendente
+        """
+        result = {}
+        for name, stats in sorted(self.phases.items(), key=lambda item: -item[1].total):
+            samples = np.array(stats.samples) * 1000
+            p50, p90, p99 = np.percentile(samples, [50, 90, 99]) if len(samples) else (0.0, 0.0, 0.0)
+            result[name] = {
+                "calls": stats.count,
+                "total_s": stats.total,
+                "mean_ms": stats.total / stats.count * 1000 if stats.count else 0.0,
+                "p50_ms": float(p50),
+                "p90_ms": float(p90),
+                "p99_ms": float(p99),
+                "max_ms": stats.max * 1000,
+            }
+        return result
+    
+    def format_table(self) -> str:
+        """
+        Formatea el resumen como una tabla de texto.
+        
+        Returns:
+            Tabla con una fila por fase
+        """
+        lines = [f"{'Fase':<20}{'Llamadas':>10}{'Total (s)':>11}{'Media (ms)':>12}"
+                 f"{'p50 (ms)':>10}{'p99 (ms)':>10}{'Máx (ms)':>10}"]
+        for name, stats in self.summary().items():
+            lines.append(f"{name:<20}{stats['calls']:>10}{stats['total_s']:>11.3f}{stats['mean_ms']:>12.4f}"
+                         f"{stats['p50_ms']:>10.4f}{stats['p99_ms']:>10.4f}{stats['max_ms']:>10.3f}")
+        return "\n".join(lines)
+    
+    def dump_json(self, filepath: Optional[str] = None) -> str:
+        """
+        Exporta el resumen en JSON.
+        
+        Args:
+            filepath: Archivo donde escribirlo (opcional)
+        
+        Returns:
+            Texto JSON con el resumen
+        """
+        text = json.dumps(self.summary(), indent=2)
+        if filepath is not None:
+            with open(filepath, "w") as f:
+                f.write(text)
+        return text
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Copia serializable de las medidas (para enviarlas desde otro proceso).
+        
+        Returns:
+            Diccionario {fase: {count, total, max, samples}}
+        """
+        return {name: {"count": stats.count, "total": stats.total, "max": stats.max,
+                       "samples": list(stats.samples)}
+                for name, stats in self.phases.items()}
+    
+    def merge(self, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Añade las medidas de una copia obtenida con snapshot().
+        
+        Args:
+            snapshot: Medidas de otro perfilador
+        """
+        for name, data in snapshot.items():
+            stats = self.phases.get(name)
+            if stats is None:
+                stats = self.phases[name] = PhaseStats(self.max_samples)
+            stats.count += data["count"]
+            stats.total += data["total"]
+            stats.max = max(stats.max, data["max"])
+            room = self.max_samples - len(stats.samples)
+            stats.samples.extend(data["samples"][:max(0, room)])
+
+
+# Perfilador global usado por el motor y las funciones de la IA
+PROFILER = Profiler()
+profiled = PROFILER.profiled
+phase = PROFILER.phase
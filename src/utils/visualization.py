@@ -2,13 +2,64 @@
 Módulo para visualización del tablero de Buscaminas.
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
-from typing import Optional, Tuple, List
-import matplotlib.colors as mcolors
-from matplotlib.patches import Rectangle
+from typing import TYPE_CHECKING, Optional, Tuple, List
 
-from src.game.minesweeper import Minesweeper, GameEvent
+from src.game.board import Board
+from src.game.minesweeper import Minesweeper, GameEvent, GameStatus
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+# matplotlib se importa al crear la primera figura: registrar el visualizador
+# en una partida no carga matplotlib
+
+# Códigos de celda para dibujar: 0-8 son celdas abiertas con ese
+# número de minas vecinas; después vienen oculta, marcada y mina
+HIDDEN_CODE = 9
+MARKED_CODE = 10
+MINE_CODE = 11
+NUM_CODES = 12
+
+
+def cell_codes(state: np.ndarray, marked: int = Board.MARKED, mine: Optional[int] = Board.MINE) -> np.ndarray:
+    """
+    Convierte una observación del tablero en códigos de celda.
+    
+    Las minas visibles se indican con Board.MINE en la observación (el
+    tablero las deja como -1, igual que las celdas ocultas: ver display_state).
+    
+    Args:
+        state: Observación del tablero (o lote de observaciones)
+        marked: Valor de las celdas marcadas en la observación
+        mine: Valor de las minas visibles (None si la observación no las distingue)
+    
+    Returns:
+        Array uint8 de la misma forma con un código por celda
+    """
+    codes = np.where(state >= 0, state, HIDDEN_CODE).astype(np.uint8)
+    codes[state == marked] = MARKED_CODE
+    if mine is not None:
+        codes[state == mine] = MINE_CODE
+    return codes
+
+
+def display_state(game: Minesweeper) -> np.ndarray:
+    """
+    Obtiene la observación de una partida tal como se dibuja.
+    
+    Args:
+        game: Partida a dibujar
+    
+    Returns:
+        Observación del tablero; si la partida está perdida, copia con las
+        minas como Board.MINE
+    """
+    state = game.get_board_state()
+    if game.status == GameStatus.DEFEAT:
+        state = state.copy()
+        state.flat[game.board.get_mine_cells()] = Board.MINE
+    return state
 
 
 class BoardVisualizer:
@@ -35,33 +86,52 @@ class BoardVisualizer:
         8: '#808080'
     }
     
-    def __init__(self, game: Minesweeper, figsize: Tuple[int, int] = (8, 8)):
+    def __init__(self, game: Minesweeper, figsize: Tuple[int, int] = (8, 8), incremental: bool = False):
         """
         Inicializa el visualizador de tablero.
         
+        Por defecto cada redibujado vuelve a crear un rectángulo y un texto
+        por celda. En modo incremental (incremental=True) los elementos del
+        dibujo se crean una sola vez: los rectángulos de las celdas forman una
+        colección, cada celda tiene un texto que se reutiliza y cada
+        redibujado solo toca las celdas que han cambiado, pintándolas sobre el
+        fondo guardado (blitting) cuando el backend lo permite. Este modo
+        muestra además las minas al perder la partida.
+        
         Args:
             game: Instancia del juego de Buscaminas
             figsize: Tamaño de la figura (ancho, alto)
+            incremental: Si es True, usa el dibujo incremental
         """
         self.game = game
         self.figsize = figsize
+        self.incremental = incremental
         self.fig = None
         self.ax = None
         self.cells = []
         
+        # Estado del dibujo incremental (ver _create_artists)
+        self._cells = None
+        self._texts = []
+        self._codes: Optional[np.ndarray] = None
+        self._background = None
+        self._blit = False
+        
         # Registrar manejadores de eventos
-        self.game.register_event_handler(GameEvent.CELL_OPENED, self._on_cell_opened)
+        self.game.register_event_handler(GameEvent.CELLS_OPENED, self._on_cells_opened)
         self.game.register_event_handler(GameEvent.CELL_MARKED, self._on_cell_marked)
         self.game.register_event_handler(GameEvent.CELL_UNMARKED, self._on_cell_unmarked)
         self.game.register_event_handler(GameEvent.GAME_LOST, self._on_game_lost)
     
-    def create_board_figure(self) -> Tuple[plt.Figure, plt.Axes]:
+    def create_board_figure(self) -> Tuple['plt.Figure', 'plt.Axes']:
         """
         Crea una figura para visualizar el tablero.
         
         Returns:
             Tupla con la figura y los ejes
         """
+        import matplotlib.pyplot as plt
+        
         self.fig, self.ax = plt.subplots(figsize=self.figsize)
         self.ax.set_aspect('equal')
         self.ax.set_xlim(-0.05, self.game.board.columns + 0.05)
@@ -78,13 +148,59 @@ class BoardVisualizer:
         # Título
         self.ax.set_title(f"Buscaminas ({self.game.board.rows}x{self.game.board.columns}, {self.game.board.num_mines} minas)")
         
+        if self.incremental:
+            self._create_artists()
+        
         return self.fig, self.ax
     
+    def _create_artists(self) -> None:
+        """Crea los rectángulos de las celdas y un texto por celda."""
+        from matplotlib.collections import PolyCollection
+        from matplotlib.colors import to_rgba_array
+        
+        rows, columns = self.game.board.rows, self.game.board.columns
+        
+        # Color, texto y estilo de cada código de celda
+        colors = [self.CELL_COLORS['empty']] * 9 + [
+            self.CELL_COLORS['hidden'], self.CELL_COLORS['marked'], self.CELL_COLORS['mine']]
+        self._palette = to_rgba_array(colors)
+        self._palette[:, 3] = 0.8
+        self._code_text = [''] + [str(n) for n in range(1, 9)] + ['', '⚑', '✹']
+        self._code_color = ['black'] + [self.CELL_COLORS[n] for n in range(1, 9)] + ['black'] * 3
+        self._code_weight = ['normal'] + ['bold'] * 8 + ['normal'] * 3
+        self._code_has_text = np.array([bool(text) for text in self._code_text])
+        
+        # Con blitting las celdas se marcan como animadas: el dibujado completo
+        # de la figura las omite y se pintan encima del fondo guardado
+        self._blit = self.fig.canvas.supports_blit
+        self._background = None
+        self._codes = np.full((rows, columns), HIDDEN_CODE, dtype=np.uint8)
+        
+        # Un rectángulo por celda en una sola colección: cambiar colores es
+        # sustituir el array de colores de relleno
+        cell_rows, cell_cols = np.divmod(np.arange(rows * columns), columns)
+        corners = np.array([(0, 0), (1, 0), (1, 1), (0, 1)])
+        verts = np.stack([cell_cols, cell_rows], axis=1)[:, None, :] + corners
+        self._cells = PolyCollection(verts, facecolors=self._palette[self._codes.ravel()],
+                                     edgecolors=(0, 0, 0, 0.8), animated=self._blit)
+        self.ax.add_collection(self._cells)
+        self._texts = [self.ax.text(j + 0.5, i + 0.5, '', ha='center', va='center', fontsize=12,
+                                    animated=self._blit)
+                       for i in range(rows) for j in range(columns)]
+        
+        if self._blit:
+            self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+    
     def draw_board(self) -> None:
         """Dibuja el estado actual del tablero."""
         if self.fig is None or self.ax is None:
             self.create_board_figure()
         
+        if self.incremental:
+            if self._update_artists() or (self._blit and self._background is None):
+                self._render()
+            return
+        
         # Limpiar celdas anteriores
         for cell in self.cells:
             cell.remove()
@@ -102,6 +218,59 @@ class BoardVisualizer:
         # Actualizar figura
         self.fig.canvas.draw()
     
+    def _update_artists(self) -> bool:
+        """
+        Actualiza los colores y los textos de las celdas que han cambiado.
+        
+        Returns:
+            True si alguna celda ha cambiado
+        """
+        codes = cell_codes(display_state(self.game))
+        changed = np.flatnonzero(codes != self._codes)
+        if len(changed) == 0:
+            return False
+        
+        self._codes = codes
+        self._cells.set_facecolor(self._palette[codes.ravel()])
+        for index in changed:
+            code = codes.flat[index]
+            text = self._texts[index]
+            text.set_text(self._code_text[code])
+            text.set_color(self._code_color[code])
+            text.set_fontweight(self._code_weight[code])
+        return True
+    
+    def _draw_animated(self) -> None:
+        """Pinta las celdas (rectángulos y textos no vacíos) sobre el lienzo."""
+        self.ax.draw_artist(self._cells)
+        for index in np.flatnonzero(self._code_has_text[self._codes]):
+            self.ax.draw_artist(self._texts[index])
+    
+    def _on_draw(self, event) -> None:
+        """Guarda el fondo tras cada dibujado completo y pinta las celdas encima."""
+        # Al guardar la figura las celdas no son animadas y ya están dibujadas
+        if event.canvas is not self.fig.canvas or not self._cells.get_animated():
+            return
+        self._background = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
+    
+    def _render(self) -> None:
+        """Muestra las celdas actualizadas: blitting sobre el fondo o dibujado completo."""
+        canvas = self.fig.canvas
+        if self._blit and self._background is not None:
+            canvas.restore_region(self._background)
+            self._draw_animated()
+            canvas.blit(self.ax.bbox)
+            canvas.flush_events()
+        else:
+            # El primer dibujado guarda el fondo en _on_draw
+            canvas.draw()
+    
+    def _set_animated(self, animated: bool) -> None:
+        """Cambia si las celdas se omiten en los dibujados completos de la figura."""
+        for artist in [self._cells, *self._texts]:
+            artist.set_animated(animated)
+    
     def _draw_cell(self, row: int, col: int, value: int) -> None:
         """
         Dibuja una celda individual.
@@ -130,6 +299,7 @@ class BoardVisualizer:
             text_color = self.CELL_COLORS.get(value, '#000000')
         
         # Dibujar rectángulo
+        from matplotlib.patches import Rectangle
         rect = Rectangle((col, row), 1, 1, facecolor=color, edgecolor='black', alpha=0.8)
         self.ax.add_patch(rect)
         self.cells.append(rect)
@@ -144,26 +314,36 @@ class BoardVisualizer:
                                    color='black', fontsize=12)
             self.cells.append(text_obj)
     
-    def _on_cell_opened(self, **kwargs) -> None:
-        """Manejador para el evento de celda abierta."""
-        if self.fig is not None and plt.fignum_exists(self.fig.number):
+    def _figure_open(self) -> bool:
+        """Indica si la figura del tablero existe y sigue abierta."""
+        if self.fig is None:
+            return False
+        import matplotlib.pyplot as plt
+        return plt.fignum_exists(self.fig.number)
+    
+    def _on_cells_opened(self, **kwargs) -> None:
+        """Manejador para el evento de celdas abiertas: un redibujado por acción."""
+        if self._figure_open():
             self.draw_board()
     
     def _on_cell_marked(self, **kwargs) -> None:
         """Manejador para el evento de celda marcada."""
-        if self.fig is not None and plt.fignum_exists(self.fig.number):
+        if self._figure_open():
             self.draw_board()
     
     def _on_cell_unmarked(self, **kwargs) -> None:
         """Manejador para el evento de celda desmarcada."""
-        if self.fig is not None and plt.fignum_exists(self.fig.number):
+        if self._figure_open():
             self.draw_board()
     
     def _on_game_lost(self, **kwargs) -> None:
         """Manejador para el evento de juego perdido."""
-        if self.fig is not None and plt.fignum_exists(self.fig.number):
+        if self._figure_open():
             self.draw_board()
             self.ax.set_title("¡BOOM! Juego terminado")
+            if self.incremental:
+                # El título queda fuera de la zona del blitting
+                self.fig.canvas.draw_idle()
     
     def animate_game(self, actions: List[Tuple[int, int, str]], delay: float = 0.5) -> None:
         """
@@ -174,12 +354,23 @@ class BoardVisualizer:
             delay: Tiempo de espera entre acciones (segundos)
         """
         import time
+        import matplotlib.pyplot as plt
         
         self.create_board_figure()
         self.draw_board()
+        if self.incremental:
+            plt.pause(0.01)  # Muestra la figura y guarda el fondo para el blitting
         
+        next_frame = time.perf_counter()
         for row, col, action in actions:
-            time.sleep(delay)
+            if self.incremental:
+                # delay marca el ritmo entre fotogramas: se descuenta el tiempo de dibujo
+                next_frame += delay
+                remaining = next_frame - time.perf_counter()
+                if remaining > 0:
+                    self.fig.canvas.start_event_loop(remaining)
+            else:
+                time.sleep(delay)
             
             if action.lower() == 'open':
                 self.game.open_cell(row, col)
@@ -187,10 +378,13 @@ class BoardVisualizer:
                 self.game.mark_cell(row, col)
             
             self.draw_board()
-            plt.pause(0.01)  # Necesario para actualizar la figura en algunos backends
+            if not self.incremental:
+                plt.pause(0.01)  # Necesario para actualizar la figura en algunos backends
     
     def show(self) -> None:
         """Muestra la visualización del tablero."""
+        import matplotlib.pyplot as plt
+        
         if self.fig is None:
             self.create_board_figure()
             self.draw_board()
@@ -205,9 +399,19 @@ class BoardVisualizer:
         Args:
             filepath: Ruta donde guardar la imagen
         """
+        import matplotlib.pyplot as plt
+        
         if self.fig is None:
             self.create_board_figure()
             self.draw_board()
         
         plt.tight_layout()
-        plt.savefig(filepath, dpi=150, bbox_inches='tight') 
\ No newline at end of file
+        if self.incremental and self._blit:
+            # savefig omite los elementos animados
+            self._set_animated(False)
+            try:
+                plt.savefig(filepath, dpi=150, bbox_inches='tight')
+            finally:
+                self._set_animated(True)
+        else:
+            plt.savefig(filepath, dpi=150, bbox_inches='tight')
\ No newline at end of file